@@ -0,0 +1,187 @@
+"""
+Measures the client against the local stub server: throughput, p50 and
+p99 latency and peak Python memory of the list, paged, streamed, get and
+bulk create paths.
+
+Usage::
+
+    python benchmarks/bench_client.py [--queues 10000] [--latency 2]
+        [--concurrency 16] [--scenario list_queues --scenario get_queue]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+import tracemalloc
+from threading import Lock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubServer  # noqa: E402
+from rabbitmq_admin.api import RabbitAPIClient  # noqa: E402
+from rabbitmq_admin.bulk import iter_bulk  # noqa: E402
+
+
+class Timings(object):
+    """
+    Collects the durations of the operations of a scenario
+    """
+
+    def __init__(self):
+        self.durations = []
+        self._lock = Lock()
+
+    def timed(self, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.durations.append(time.perf_counter() - start)
+        return wrapper
+
+    def percentile(self, percent):
+        ordered = sorted(self.durations)
+        index = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+        return ordered[index] if ordered else 0.0
+
+
+def run_sequential(func, repeat, timings):
+    timed = timings.timed(func)
+    for _ in range(repeat):
+        timed()
+
+
+def run_concurrent(func, items, concurrency, timings):
+    for result in iter_bulk(timings.timed(func), items, concurrency):
+        if not result.ok:
+            raise result.error
+
+
+def scenarios(api, args):
+    """
+    The scenarios by name, each one runs its operations into a Timings
+    """
+    names = ['queue.{0:06d}'.format(index) for index in range(args.gets)]
+    created = ['bench.{0:06d}'.format(index) for index in range(args.creates)]
+    return {
+        'list_queues': lambda timings: run_sequential(
+            api.list_queues, args.repeat, timings
+        ),
+        'list_queues_columns': lambda timings: run_sequential(
+            lambda: api.list_queues(columns=['name', 'messages']),
+            args.repeat,
+            timings,
+        ),
+        'list_connections': lambda timings: run_sequential(
+            api.list_connections, args.repeat, timings
+        ),
+        'list_bindings': lambda timings: run_sequential(
+            api.list_bindings, args.repeat, timings
+        ),
+        'iter_queues': lambda timings: run_sequential(
+            lambda: sum(1 for _ in api.iter_queues(page_size=500)),
+            args.repeat,
+            timings,
+        ),
+        'stream_queues': lambda timings: run_sequential(
+            lambda: sum(1 for _ in api.stream_queues()),
+            args.repeat,
+            timings,
+        ),
+        'get_queue': lambda timings: run_concurrent(
+            lambda name: api.get_queue_for_vhost(name, '/'),
+            names,
+            args.concurrency,
+            timings,
+        ),
+        'bulk_create_queues': lambda timings: run_concurrent(
+            lambda name: api.create_queue_for_vhost(
+                name, '/', {'durable': True}
+            ),
+            created,
+            args.concurrency,
+            timings,
+        ),
+    }
+
+
+def measure(scenario, with_memory):
+    """
+    Runs the scenario and returns its timings, its wall time and the peak
+    memory in bytes, or ``None`` without ``with_memory``
+    """
+    timings = Timings()
+    start = time.perf_counter()
+    scenario(timings)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if with_memory:
+        # a separate run, tracing the allocations slows the client down
+        tracemalloc.start()
+        scenario(Timings())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return timings, elapsed, peak
+
+
+def report(name, timings, elapsed, peak):
+    print('{0:<22} {1:>7} {2:>9.1f} {3:>9.2f} {4:>9.2f} {5:>9}'.format(
+        name,
+        len(timings.durations),
+        len(timings.durations) / elapsed,
+        timings.percentile(50) * 1000,
+        timings.percentile(99) * 1000,
+        '-' if peak is None else '{0:.1f}'.format(peak / 2 ** 20),
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--queues', type=int, default=10000)
+    parser.add_argument('--connections', type=int, default=1000)
+    parser.add_argument('--bindings', type=int, default=10000)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='response delay of the stub in milliseconds')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs of the list scenarios')
+    parser.add_argument('--gets', type=int, default=2000)
+    parser.add_argument('--creates', type=int, default=2000)
+    parser.add_argument('--codec', default=None)
+    parser.add_argument('--scenario', action='append',
+                        help='run only this scenario, may be repeated')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the peak memory runs')
+    args = parser.parse_args()
+    args.gets = min(args.gets, args.queues)
+
+    server = StubServer(
+        latency=args.latency / 1000,
+        queues=args.queues,
+        connections=args.connections,
+        bindings=args.bindings,
+    )
+    with server, RabbitAPIClient(
+        '127.0.0.1',
+        server.port,
+        ('guest', 'guest'),
+        pool_maxsize=args.concurrency,
+        codec=args.codec,
+    ) as api:
+        print('{0} queues, {1} connections, {2} bindings, codec {3}'.format(
+            args.queues, args.connections, args.bindings, api.codec.name
+        ))
+        print('{0:<22} {1:>7} {2:>9} {3:>9} {4:>9} {5:>9}'.format(
+            'scenario', 'ops', 'ops/s', 'p50, ms', 'p99, ms', 'peak, MB'
+        ))
+        for name, scenario in scenarios(api, args).items():
+            if args.scenario and name not in args.scenario:
+                continue
+            report(name, *measure(scenario, not args.no_memory))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares the JSON codecs on a synthetic ``/api/queues`` payload.
+
+Usage::
+
+    python benchmarks/bench_codecs.py [--queues 50000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.payloads import make_queues  # noqa: E402
+from rabbitmq_admin.codec import CODECS, get_codec  # noqa: E402
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--queues', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    queues = make_queues(args.queues)
+    body = get_codec('json').dumps(queues)
+    print('{0} queues, {1:.1f} MB body'.format(
+        args.queues, len(body) / 2 ** 20
+    ))
+    print('{0:<10} {1:>10} {2:>10}'.format('codec', 'dumps, s', 'loads, s'))
+
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print('{0:<10} {1:>21}'.format(name, 'not installed'))
+            continue
+        print('{0:<10} {1:>10.3f} {2:>10.3f}'.format(
+            name,
+            best_of(args.repeat, codec.dumps, queues),
+            best_of(args.repeat, codec.loads, body),
+        ))
+
+
+if __name__ == '__main__':
+    main()
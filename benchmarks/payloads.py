@@ -0,0 +1,159 @@
+"""
+Synthetic management API payloads shaped like the responses of a
+RabbitMQ 3.x broker.
+"""
+
+
+def make_rate(value):
+    return {'rate': float(value % 97) / 10}
+
+
+def make_queue(index, vhost='/'):
+    messages = index * 7 % 5000
+    return {
+        'name': 'queue.{0:06d}'.format(index),
+        'vhost': vhost,
+        'node': 'rabbit@node{0}'.format(index % 3),
+        'durable': True,
+        'auto_delete': False,
+        'exclusive': False,
+        'arguments': {'x-queue-type': 'classic'},
+        'state': 'running',
+        'consumers': index % 4,
+        'consumer_utilisation': None,
+        'memory': 10000 + index,
+        'messages': messages,
+        'messages_details': make_rate(index),
+        'messages_ready': messages - messages // 10,
+        'messages_ready_details': make_rate(index + 1),
+        'messages_unacknowledged': messages // 10,
+        'messages_unacknowledged_details': make_rate(index + 2),
+        'message_bytes': messages * 512,
+        'reductions': index * 1000,
+        'reductions_details': make_rate(index + 3),
+        'idle_since': '2023-01-01 00:00:00',
+        'policy': None,
+        'message_stats': {
+            'publish': index * 3,
+            'publish_details': make_rate(index + 4),
+            'deliver_get': index * 2,
+            'deliver_get_details': make_rate(index + 5),
+            'ack': index * 2,
+            'ack_details': make_rate(index + 6),
+            'redeliver': index % 10,
+            'redeliver_details': make_rate(index + 7),
+        },
+        'backing_queue_status': {
+            'mode': 'default',
+            'q1': 0,
+            'q2': 0,
+            'delta': ['delta', 'undefined', 0, 0, 'undefined'],
+            'q3': 0,
+            'q4': messages,
+            'len': messages,
+            'target_ram_count': 'infinity',
+            'next_seq_id': messages,
+            'avg_ingress_rate': 0.1,
+            'avg_egress_rate': 0.1,
+            'avg_ack_ingress_rate': 0.0,
+            'avg_ack_egress_rate': 0.0,
+        },
+        'garbage_collection': {
+            'fullsweep_after': 65535,
+            'max_heap_size': 0,
+            'min_bin_vheap_size': 46422,
+            'min_heap_size': 233,
+            'minor_gcs': index % 100,
+        },
+    }
+
+
+def make_vhost(index, vhosts):
+    number = index % vhosts
+    return 'vhost{0}'.format(number) if number else '/'
+
+
+def make_queues(count, vhosts=1):
+    return [
+        make_queue(index, vhost=make_vhost(index, vhosts))
+        for index in range(count)
+    ]
+
+
+def make_connection(index):
+    return {
+        'name': '10.0.{0}.{1}:{2} -> 10.0.0.1:5672'.format(
+            index // 250 % 250, index % 250, 30000 + index % 30000
+        ),
+        'node': 'rabbit@node{0}'.format(index % 3),
+        'vhost': '/',
+        'user': 'user{0}'.format(index % 10),
+        'state': 'running',
+        'protocol': 'AMQP 0-9-1',
+        'channels': 1 + index % 4,
+        'peer_host': '10.0.{0}.{1}'.format(index // 250 % 250, index % 250),
+        'peer_port': 30000 + index % 30000,
+        'ssl': False,
+        'connected_at': 1672531200000 + index,
+        'client_properties': {
+            'product': 'pika',
+            'version': '1.3.2',
+            'capabilities': {
+                'publisher_confirms': True,
+                'consumer_cancel_notify': True,
+            },
+        },
+        'recv_oct': index * 1024,
+        'recv_oct_details': make_rate(index),
+        'send_oct': index * 2048,
+        'send_oct_details': make_rate(index + 1),
+        'garbage_collection': {'minor_gcs': index % 100},
+    }
+
+
+def make_binding(index, vhost='/'):
+    return {
+        'source': 'exchange.{0:04d}'.format(index % 1000),
+        'vhost': vhost,
+        'destination': 'queue.{0:06d}'.format(index),
+        'destination_type': 'queue',
+        'routing_key': 'key.{0}'.format(index),
+        'arguments': {},
+        'properties_key': 'key.{0}'.format(index),
+    }
+
+
+def make_exchange(index, vhost='/'):
+    return {
+        'name': 'exchange.{0:04d}'.format(index),
+        'vhost': vhost,
+        'type': 'topic',
+        'durable': True,
+        'auto_delete': False,
+        'internal': False,
+        'arguments': {},
+        'message_stats': {
+            'publish_in': index * 5,
+            'publish_in_details': make_rate(index),
+            'publish_out': index * 5,
+            'publish_out_details': make_rate(index + 1),
+        },
+    }
+
+
+def make_connections(count):
+    return [make_connection(index) for index in range(count)]
+
+
+def make_bindings(count, vhosts=1):
+    return [
+        make_binding(index, vhost=make_vhost(index, vhosts))
+        for index in range(count)
+    ]
+
+
+def make_exchanges(count, vhosts=1):
+    return [
+        make_exchange(index, vhost=make_vhost(index, vhosts))
+        for index in range(count)
+    ]
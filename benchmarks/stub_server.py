@@ -0,0 +1,320 @@
+"""
+A local stub of the RabbitMQ management API serving synthetic payloads,
+so the client can be measured without a broker. It supports the list,
+get, create and delete endpoints of queues, exchanges, bindings and
+connections, pagination, ``columns``, ``disable_stats`` and conditional
+GETs with an ``ETag``.
+
+Usage::
+
+    with StubServer(queues=10000, latency=0.002) as server:
+        api = RabbitAPIClient('127.0.0.1', server.port, ('guest', 'guest'))
+
+or standalone::
+
+    python benchmarks/stub_server.py --queues 10000 --port 15672
+"""
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import re
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.payloads import (  # noqa: E402
+    make_bindings,
+    make_connections,
+    make_exchanges,
+    make_queue,
+    make_queues,
+)
+
+#: The collections whose objects are identified by vhost and name
+NAMED = ('queues', 'exchanges')
+
+NOT_FOUND = b'{"error":"Object Not Found","reason":"Not Found"}'
+
+
+class Store(object):
+    """
+    The objects served by the stub and the encoded list responses
+    """
+
+    def __init__(self, queues=1000, exchanges=100, bindings=1000,
+                 connections=1000, vhosts=1):
+        self.collections = {
+            'queues': make_queues(queues, vhosts),
+            'exchanges': make_exchanges(exchanges, vhosts),
+            'bindings': make_bindings(bindings, vhosts),
+            'connections': make_connections(connections),
+            'channels': [],
+            'consumers': [],
+            'vhosts': [{'name': '/'}],
+            'nodes': [{'name': 'rabbit@node0', 'running': True}],
+        }
+        self.lock = Lock()
+        self._index = {
+            (collection, item['vhost'], item['name']): item
+            for collection in NAMED
+            for item in self.collections[collection]
+        }
+        self._encoded = {}
+
+    def list(self, collection, vhost=None):
+        items = self.collections.get(collection, [])
+        if vhost is None:
+            return items
+        return [item for item in items if item.get('vhost') == vhost]
+
+    def find(self, collection, vhost, name):
+        return self._index.get((collection, vhost, name))
+
+    def put(self, collection, vhost, name, body):
+        with self.lock:
+            self.delete(collection, vhost, name)
+            item = make_queue(0) if collection == 'queues' else {}
+            item.update(body or {}, name=name, vhost=vhost)
+            self.collections[collection].append(item)
+            self._index[collection, vhost, name] = item
+            self._encoded.clear()
+
+    def delete(self, collection, vhost, name):
+        """
+        Deletes an object, the caller holds the lock
+        """
+        item = self._index.pop((collection, vhost, name), None)
+        if item is not None:
+            self.collections[collection].remove(item)
+            self._encoded.clear()
+        return item
+
+    def encoded(self, key, build):
+        """
+        Encodes a response once, the stub should not be the bottleneck
+        """
+        body = self._encoded.get(key)
+        if body is None:
+            body = json.dumps(build(), separators=(',', ':')).encode()
+            self._encoded[key] = body
+        return body
+
+
+def project(item, columns):
+    """
+    Keeps the given fields, nested ones are separated by dots
+    """
+    result = {}
+    for column in columns:
+        value, target = item, result
+        *parents, field = column.split('.')
+        for parent in parents:
+            value = value.get(parent) or {}
+            target = target.setdefault(parent, {})
+        if field in value:
+            target[field] = value[field]
+    return result
+
+
+def without_stats(item):
+    return {
+        key: value for key, value in item.items()
+        if key != 'message_stats' and not key.endswith('_details')
+    }
+
+
+def paginate(items, query):
+    page = int(query['page'])
+    size = int(query.get('page_size', 100))
+    name = query.get('name')
+    if name:
+        pattern = name if query.get('use_regex') == 'true' else re.escape(
+            name
+        )
+        items = [item for item in items if re.search(pattern, item['name'])]
+    return {
+        'items': items[(page - 1) * size:page * size],
+        'page': page,
+        'page_size': size,
+        'page_count': max(1, math.ceil(len(items) / size)),
+        'item_count': len(items[(page - 1) * size:page * size]),
+        'filtered_count': len(items),
+    }
+
+
+def shape(items, query):
+    """
+    Applies the query parameters of a list request
+    """
+    if query.get('disable_stats') == 'true':
+        items = [without_stats(item) for item in items]
+    if query.get('columns'):
+        columns = query['columns'].split(',')
+        items = [project(item, columns) for item in items]
+    if 'page' in query:
+        return paginate(items, query)
+    return items
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Routes the requests by the first path segments
+    """
+
+    protocol_version = 'HTTP/1.1'
+    store = None
+    latency = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        parts, query = self.parse()
+        key = self.path
+        if parts == ['overview']:
+            body = self.store.encoded(key, lambda: {'cluster_name': 'stub'})
+        elif len(parts) == 3 and parts[0] in NAMED:
+            item = self.store.find(*parts)
+            if item is None:
+                return self.respond(404, NOT_FOUND)
+            body = json.dumps(item).encode()
+        elif len(parts) > 2:
+            return self.respond(404, NOT_FOUND)
+        else:
+            body = self.store.encoded(key, lambda: shape(
+                self.store.list(*parts[:2]), query
+            ))
+        self.respond_conditional(body)
+
+    def do_PUT(self):
+        time.sleep(self.latency)
+        parts, _ = self.parse()
+        body = self.read_body()
+        if len(parts) == 3 and parts[0] in NAMED:
+            self.store.put(parts[0], parts[1], parts[2], body)
+        self.respond(201 if body is not None else 204)
+
+    def do_DELETE(self):
+        time.sleep(self.latency)
+        parts, _ = self.parse()
+        if len(parts) == 3 and parts[0] in NAMED:
+            with self.store.lock:
+                self.store.delete(*parts)
+        self.respond(204)
+
+    def do_POST(self):
+        time.sleep(self.latency)
+        self.read_body()
+        self.respond(201)
+
+    def parse(self):
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.split('/')[2:] if part]
+        query = {
+            key: values[-1] for key, values in parse_qs(url.query).items()
+        }
+        return parts, query
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def respond_conditional(self, body):
+        etag = '"{0}"'.format(hashlib.blake2b(body, digest_size=8).hexdigest())
+        if self.headers.get('If-None-Match') == etag:
+            return self.respond(304, headers={'ETag': etag})
+        self.respond(200, body, {'ETag': etag})
+
+    def respond(self, status, body=b'', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(port, latency, sizes, ready=None):
+    """
+    Runs the stub server until the process is terminated
+    """
+    handler = type('StubHandler', (Handler,), {
+        'store': Store(**sizes),
+        'latency': latency,
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    if ready is not None:
+        ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+class StubServer(object):
+    """
+    Runs the stub server in a child process, so it does not share the GIL
+    nor the memory with the measured client
+
+    :param latency: The delay of every response in seconds
+    :type latency: float
+
+    The other keyword arguments are the object counts of :class:`Store`
+    """
+
+    def __init__(self, latency=0.0, port=0, **sizes):
+        self.latency = latency
+        self.port = port
+        self.sizes = sizes
+        self._process = None
+
+    def start(self):
+        ready = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=serve,
+            args=(self.port, self.latency, self.sizes, ready),
+            daemon=True,
+        )
+        self._process.start()
+        self.port = ready.get(timeout=300)
+        return self
+
+    def stop(self):
+        self._process.terminate()
+        self._process.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--port', type=int, default=15672)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='response delay in milliseconds')
+    for collection in ('queues', 'exchanges', 'bindings', 'connections'):
+        parser.add_argument('--' + collection, type=int, default=1000)
+    parser.add_argument('--vhosts', type=int, default=1)
+    args = parser.parse_args()
+    print('Serving on 127.0.0.1:{0}'.format(args.port))
+    serve(args.port, args.latency / 1000, {
+        'queues': args.queues,
+        'exchanges': args.exchanges,
+        'bindings': args.bindings,
+        'connections': args.connections,
+        'vhosts': args.vhosts,
+    })
+
+
+if __name__ == '__main__':
+    main()
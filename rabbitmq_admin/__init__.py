@@ -1 +1,6 @@
 from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.cluster import (
+    AsyncClusterRabbitAPIClient,
+    ClusterRabbitAPIClient,
+)
@@ -1,40 +1,155 @@
+from binascii import b2a_base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from urllib import parse
 
 from rabbitmq_admin.base import Resource
+from rabbitmq_admin.bulk import iter_bulk
+from rabbitmq_admin.definitions import DefinitionsProgress, split_definitions
+from rabbitmq_admin.messages import decode_payloads
+from rabbitmq_admin.models import (
+    Binding,
+    Channel,
+    Connection,
+    Exchange,
+    Node,
+    Queue,
+)
 
 
 class RabbitAPIClient(Resource):
     """
     The entrypoint for interacting with the RabbitMQ Management HTTP API
+
+    Every ``list_*`` and ``get_*`` method also takes the optional
+    ``columns``, ``disable_stats``, ``enable_queue_totals`` and ``params``
+    arguments to shrink the response:
+    ::
+
+        >>> api.list_queues(columns=['name', 'messages'], disable_stats=True)
+        [{'messages': 1, 'name': 'test_queue'}]
+
+    The queues, exchanges, bindings, connections, channels and nodes are
+    returned as compact :mod:`rabbitmq_admin.models` objects with
+    ``raw=False``:
+    ::
+
+        >>> api.list_queues(raw=False)
+        [<Queue 'test_queue'>]
     """
 
     def _quote(self, value):
         """Quotes without saving characters."""
         return parse.quote(value, safe='')
 
-    def overview(self):
+    def _vhost_url(self, url, vhost=None):
+        """Appends the quoted vhost to the url if it is given."""
+        if vhost is None:
+            return url
+        return '{0}/{1}'.format(url, self._quote(vhost))
+
+    def _page(self, url, page=1, page_size=100, name=None, use_regex=False,
+              sort=None, sort_reverse=False, **query):
+        """
+        Requests a single page of a list. The response looks like:
+        ::
+
+            {
+                "items": [...],
+                "page": 1,
+                "page_count": 3,
+                "page_size": 100,
+                "item_count": 100,
+                "filtered_count": 250,
+                "total_count": 300
+            }
+
+        :param page: The page number, starting from 1
+        :type page: int
+
+        :param page_size: The number of items per page, the server allows
+            at most 500
+        :type page_size: int
+
+        :param name: Only return the items whose name contains this string
+        :type name: str
+
+        :param use_regex: Set to ``True`` to treat ``name`` as a regular
+            expression
+        :type use_regex: bool
+
+        :param sort: The field to sort by, e.g. ``messages``
+        :type sort: str
+
+        :param sort_reverse: Set to ``True`` to sort in descending order
+        :type sort_reverse: bool
+
+        The ``columns``, ``disable_stats``, ``enable_queue_totals`` and
+        ``params`` arguments are passed through, see :meth:`_api_get`.
+        """
+        return self._api_get(
+            url,
+            params=dict(
+                query.pop('params', None) or {},
+                page=page,
+                page_size=page_size,
+                name=name,
+                use_regex=use_regex if name else None,
+                sort=sort,
+                sort_reverse=sort_reverse if sort else None,
+            ),
+            **query
+        )
+
+    def _iter_pages(self, url, page_size=500, prefetch=False, **filters):
+        """
+        Yields the items of a list page by page, so only one page (two with
+        ``prefetch``) is kept in memory. Items created or deleted during
+        the iteration may shift between the pages.
+
+        :param prefetch: Set to ``True`` to request the next page in a
+            background thread while the current one is consumed
+        :type prefetch: bool
+        """
+        fetch = partial(self._page, url, page_size=page_size, **filters)
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = fetch(page=1)
+            while True:
+                number = page['page']
+                last = number >= page['page_count']
+                if executor and not last:
+                    following = executor.submit(fetch, page=number + 1)
+                yield from page['items']
+                if last:
+                    return
+                if executor:
+                    page = following.result()
+                else:
+                    page = fetch(page=number + 1)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def overview(self, **query):
         """
         Various random bits of information that describe the whole system
         """
-        return self._api_get('/api/overview')
+        return self._api_get('/api/overview', **query)
 
-    def get_cluster_name(self):
+    def get_cluster_name(self, **query):
         """
         Name identifying this RabbitMQ cluster.
         """
-        return self._get(
-            url=self.url + '/api/cluster-name',
-            headers=self.headers,
-            auth=self.auth
-        )
+        return self._api_get('/api/cluster-name', **query)
 
-    def list_nodes(self):
+    def list_nodes(self, **query):
         """
         A list of nodes in the RabbitMQ cluster.
         """
-        return self._api_get('/api/nodes')
+        return self._api_get('/api/nodes', model=Node, **query)
 
-    def get_node(self, name, memory=False, binary=False):
+    def get_node(self, name, memory=False, binary=False, **query):
         """
         An individual node in the RabbitMQ cluster. Set "memory=true" to get
         memory statistics, and "binary=true" to get a breakdown of binary
@@ -44,18 +159,21 @@ class RabbitAPIClient(Resource):
         return self._api_get(
             url='/api/nodes/{0}'.format(name),
             params=dict(
+                query.pop('params', None) or {},
                 binary=binary,
                 memory=memory,
             ),
+            model=Node,
+            **query
         )
 
-    def list_extensions(self):
+    def list_extensions(self, **query):
         """
         A list of extensions to the management plugin.
         """
-        return self._api_get('/api/extensions')
+        return self._api_get('/api/extensions', **query)
 
-    def get_definitions(self):
+    def get_definitions(self, **query):
         """
         The server definitions - exchanges, queues, bindings, users, virtual
         hosts, permissions and parameters. Everything apart from messages.
@@ -63,7 +181,7 @@ class RabbitAPIClient(Resource):
         This method can be used for backing up the configuration of a server
         or cluster.
         """
-        return self._api_get('/api/definitions')
+        return self._api_get('/api/definitions', **query)
 
     def post_definitions(self, data):
         """
@@ -87,15 +205,105 @@ class RabbitAPIClient(Resource):
         :param data: The definitions for a RabbitMQ server
         :type data: dict
         """
-        self._api_post('/api/definitions', data=data)
+        return self._api_post('/api/definitions', data=data)
+
+    def apply_definitions_chunked(self, definitions, chunk_size=500,
+                                  concurrency=1, progress=None):
+        """
+        Upload a large set of definitions in bounded batches. The
+        definitions are split in dependency order: vhosts, users,
+        permissions, topic permissions and global parameters first, then
+        parameters, policies, exchanges, queues and bindings of every vhost.
+        The vhosts are applied in parallel if ``concurrency`` is above 1.
+
+        A failure in the global sections raises, since every vhost depends
+        on them. A failure in a vhost stops only that vhost and is reported
+        in the results.
+
+        :param definitions: The definitions for a RabbitMQ server
+        :type definitions: dict
 
-    def list_connections(self):
+        :param chunk_size: The maximum number of objects per request
+        :type chunk_size: int
+
+        :param concurrency: The number of vhosts applied in parallel
+        :type concurrency: int
+
+        :param progress: An optional callback, called as
+            ``progress(done, total, chunk)`` after every applied chunk
+        :type progress: callable
+
+        :returns: A result per vhost, see :meth:`bulk`
+        :rtype: list of rabbitmq_admin.bulk.BulkResult
+        """
+        head, vhosts = split_definitions(definitions, chunk_size)
+        tracker = DefinitionsProgress(head, vhosts, progress)
+
+        for chunk in head:
+            self.post_definitions(chunk)
+            tracker.advance(chunk)
+
+        def apply_vhost(vhost):
+            for chunk in vhosts[vhost]:
+                self.post_definitions(chunk)
+                tracker.advance(chunk)
+
+        return self._bulk(apply_vhost, list(vhosts), concurrency)
+
+    def list_connections(self, **query):
         """
         A list of all open connections.
         """
-        return self._api_get('/api/connections')
+        return self._api_get('/api/connections', model=Connection, **query)
+
+    def list_connections_page(self, page=1, page_size=100, **filters):
+        """
+        A page of open connections. Takes the ``name``, ``use_regex``,
+        ``sort`` and ``sort_reverse`` filters, see :meth:`_page`.
+
+        :param page: The page number, starting from 1
+        :type page: int
+
+        :param page_size: The number of connections per page
+        :type page_size: int
+        """
+        return self._page(
+            '/api/connections', page, page_size, model=Connection, **filters
+        )
+
+    def iter_connections(self, page_size=500, prefetch=False, **filters):
+        """
+        Iterates over all open connections, requesting them page by page.
+        Takes the same filters as :meth:`list_connections_page`.
+
+        :param page_size: The number of connections per request
+        :type page_size: int
+
+        :param prefetch: Set to ``True`` to request the next page while the
+            current one is consumed
+        :type prefetch: bool
+        """
+        return self._iter_pages(
+            '/api/connections',
+            page_size,
+            prefetch,
+            model=Connection,
+            **filters
+        )
+
+    def stream_connections(self, **query):
+        """
+        Iterates over all open connections, decoding them one by one while
+        the response is downloaded, so only one connection is kept in memory.
+        """
+        return self._api_get(
+            '/api/connections',
+            stream=True,
+            model=Connection,
+            **query
+        )
 
-    def get_connection(self, name):
+    def get_connection(self, name, **query):
         """
         An individual connection.
 
@@ -104,7 +312,7 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/connections/{0}'.format(
             self._quote(name)
-        ))
+        ), model=Connection, **query)
 
     def delete_connection(self, name, reason=None):
         """
@@ -118,14 +326,14 @@ class RabbitAPIClient(Resource):
         """
         headers = {'X-Reason': reason} if reason else {}
 
-        self._api_delete(
+        return self._api_delete(
             '/api/connections/{0}'.format(
                 self._quote(name)
             ),
             headers=headers,
         )
 
-    def list_connection_channels(self, name):
+    def list_connection_channels(self, name, **query):
         """
         List of all channels for a given connection.
 
@@ -134,15 +342,58 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/connections/{0}/channels'.format(
             self._quote(name)
-        ))
+        ), model=Channel, **query)
 
-    def list_channels(self):
+    def list_channels(self, **query):
         """
         A list of all open channels.
         """
-        return self._api_get('/api/channels')
+        return self._api_get('/api/channels', model=Channel, **query)
+
+    def list_channels_page(self, page=1, page_size=100, **filters):
+        """
+        A page of open channels. Takes the ``name``, ``use_regex``, ``sort``
+        and ``sort_reverse`` filters, see :meth:`_page`.
+
+        :param page: The page number, starting from 1
+        :type page: int
+
+        :param page_size: The number of channels per page
+        :type page_size: int
+        """
+        return self._page(
+            '/api/channels', page, page_size, model=Channel, **filters
+        )
+
+    def iter_channels(self, page_size=500, prefetch=False, **filters):
+        """
+        Iterates over all open channels, requesting them page by page.
+        Takes the same filters as :meth:`list_channels_page`.
+
+        :param page_size: The number of channels per request
+        :type page_size: int
+
+        :param prefetch: Set to ``True`` to request the next page while the
+            current one is consumed
+        :type prefetch: bool
+        """
+        return self._iter_pages(
+            '/api/channels', page_size, prefetch, model=Channel, **filters
+        )
+
+    def stream_channels(self, **query):
+        """
+        Iterates over all open channels, decoding them one by one while the
+        response is downloaded, so only one channel is kept in memory.
+        """
+        return self._api_get(
+            '/api/channels',
+            stream=True,
+            model=Channel,
+            **query
+        )
 
-    def get_channel(self, name):
+    def get_channel(self, name, **query):
         """
         Details about an individual channel.
 
@@ -151,15 +402,15 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/channels/{0}'.format(
             self._quote(name)
-        ))
+        ), model=Channel, **query)
 
-    def list_consumers(self):
+    def list_consumers(self, **query):
         """
         A list of all consumers.
         """
-        return self._api_get('/api/consumers')
+        return self._api_get('/api/consumers', **query)
 
-    def list_consumers_for_vhost(self, vhost):
+    def list_consumers_for_vhost(self, vhost, **query):
         """
         A list of all consumers in a given virtual host.
 
@@ -168,15 +419,15 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/consumers/{0}'.format(
             self._quote(vhost)
-        ))
+        ), **query)
 
-    def list_exchanges(self):
+    def list_exchanges(self, **query):
         """
         A list of all exchanges.
         """
-        return self._api_get('/api/exchanges')
+        return self._api_get('/api/exchanges', model=Exchange, **query)
 
-    def list_exchanges_for_vhost(self, vhost):
+    def list_exchanges_for_vhost(self, vhost, **query):
         """
         A list of all exchanges in a given virtual host.
 
@@ -185,9 +436,74 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/exchanges/{0}'.format(
             self._quote(vhost)
-        ))
+        ), model=Exchange, **query)
+
+    def list_exchanges_page(self, page=1, page_size=100, vhost=None,
+                            **filters):
+        """
+        A page of exchanges, optionally in a given virtual host. Takes the
+        ``name``, ``use_regex``, ``sort`` and ``sort_reverse`` filters, see
+        :meth:`_page`.
+
+        :param page: The page number, starting from 1
+        :type page: int
+
+        :param page_size: The number of exchanges per page
+        :type page_size: int
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._page(
+            self._vhost_url('/api/exchanges', vhost),
+            page,
+            page_size,
+            model=Exchange,
+            **filters
+        )
+
+    def iter_exchanges(self, vhost=None, page_size=500, prefetch=False,
+                       **filters):
+        """
+        Iterates over all exchanges, optionally in a given virtual host,
+        requesting them page by page. Takes the same filters as
+        :meth:`list_exchanges_page`.
+
+        :param vhost: The vhost name
+        :type vhost: str
+
+        :param page_size: The number of exchanges per request
+        :type page_size: int
+
+        :param prefetch: Set to ``True`` to request the next page while the
+            current one is consumed
+        :type prefetch: bool
+        """
+        return self._iter_pages(
+            self._vhost_url('/api/exchanges', vhost),
+            page_size,
+            prefetch,
+            model=Exchange,
+            **filters
+        )
+
+    def stream_exchanges(self, vhost=None, **query):
+        """
+        Iterates over all exchanges, optionally in a given virtual host,
+        decoding them one by one while the response is downloaded, so only
+        one exchange is kept in memory.
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._api_get(
+            self._vhost_url('/api/exchanges', vhost),
+            stream=True,
+            model=Exchange,
+            **query
+        )
 
-    def get_exchange_for_vhost(self, exchange, vhost):
+    def get_exchange_for_vhost(self, exchange, vhost, **query):
         """
         An individual exchange
 
@@ -200,7 +516,7 @@ class RabbitAPIClient(Resource):
         return self._api_get('/api/exchanges/{0}/{1}'.format(
             self._quote(vhost),
             self._quote(exchange)
-        ))
+        ), model=Exchange, **query)
 
     def create_exchange_for_vhost(self, exchange, vhost, body):
         """
@@ -227,7 +543,7 @@ class RabbitAPIClient(Resource):
         :param body: A body for the exchange.
         :type body: dict
         """
-        self._api_put(
+        return self._api_put(
             '/api/exchanges/{0}/{1}'.format(
                 self._quote(vhost),
                 self._quote(exchange)),
@@ -249,7 +565,7 @@ class RabbitAPIClient(Resource):
         :param if_unused: Set to ``True`` to only delete if it is unused
         :type if_unused: bool
         """
-        self._api_delete(
+        return self._api_delete(
             '/api/exchanges/{0}/{1}'.format(
                 self._quote(vhost),
                 self._quote(exchange)),
@@ -258,13 +574,91 @@ class RabbitAPIClient(Resource):
             },
         )
 
-    def list_bindings(self):
+    def publish_message(self, exchange, vhost, routing_key, payload,
+                        properties=None, payload_encoding=None):
+        """
+        Publish a message to an exchange. The management API opens a channel
+        per request, use a client library for sustained traffic.
+
+        :param exchange: The exchange name, ``amq.default`` for the default
+            exchange
+        :type exchange: str
+
+        :param vhost: The vhost name
+        :type vhost: str
+
+        :param routing_key: The routing key
+        :type routing_key: str
+
+        :param payload: The message body, bytes are sent base64 encoded
+        :type payload: str or bytes
+
+        :param properties: The message properties, e.g.
+            ``{'delivery_mode': 2, 'headers': {}}``
+        :type properties: dict
+
+        :param payload_encoding: ``string`` or ``base64`` for a payload
+            which is already encoded, by default derived from the payload
+            type
+        :type payload_encoding: str
+
+        :returns: ``{'routed': True}`` if the message was routed to at
+            least one queue
+        :rtype: dict
+        """
+        if payload_encoding is None and isinstance(
+            payload, (bytes, bytearray, memoryview)
+        ):
+            payload = b2a_base64(payload, newline=False).decode()
+            payload_encoding = 'base64'
+        return self._api_post(
+            '/api/exchanges/{0}/{1}/publish'.format(
+                self._quote(vhost),
+                self._quote(exchange)),
+            data={
+                'properties': properties or {},
+                'routing_key': routing_key,
+                'payload': payload,
+                'payload_encoding': payload_encoding or 'string',
+            }
+        )
+
+    def publish_many(self, messages, concurrency=32):
+        """
+        Publish many messages concurrently. The messages are read lazily
+        and the results are yielded in their order, so a generator of any
+        length is published in constant memory. Set ``pool_maxsize`` to at
+        least ``concurrency`` so every request reuses a keep-alive
+        connection.
+
+        Example ::
+
+            >>> results = api.publish_many(
+            ...     {'exchange': 'events', 'vhost': '/',
+            ...      'routing_key': 'replay', 'payload': line}
+            ...     for line in lines
+            ... )
+            >>> unrouted = [result.item for result in results
+            ...             if result.ok and not result.result['routed']]
+
+        :param messages: The arguments of :meth:`publish_message`
+        :type messages: iterable of dict
+
+        :param concurrency: The number of concurrent requests
+        :type concurrency: int
+
+        :returns: A :class:`rabbitmq_admin.bulk.BulkResult` per message
+        :rtype: iterator
+        """
+        return self._iter_bulk(self.publish_message, messages, concurrency)
+
+    def list_bindings(self, **query):
         """
         A list of all bindings.
         """
-        return self._api_get('/api/bindings')
+        return self._api_get('/api/bindings', model=Binding, **query)
 
-    def list_bindings_for_vhost(self, vhost):
+    def list_bindings_for_vhost(self, vhost, **query):
         """
         A list of all bindings in a given virtual host.
 
@@ -273,9 +667,25 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/bindings/{}'.format(
             self._quote(vhost)
-        ))
+        ), model=Binding, **query)
+
+    def stream_bindings(self, vhost=None, **query):
+        """
+        Iterates over all bindings, optionally in a given virtual host,
+        decoding them one by one while the response is downloaded, so only
+        one binding is kept in memory.
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._api_get(
+            self._vhost_url('/api/bindings', vhost),
+            stream=True,
+            model=Binding,
+            **query
+        )
 
-    def list_bindings_by_queue(self, queue, vhost):
+    def list_bindings_by_queue(self, queue, vhost, **query):
         """A list of all bindings on a given queue.
 
         :param queue: The queue name
@@ -285,15 +695,190 @@ class RabbitAPIClient(Resource):
         :type vhost: str
         """
         return self._api_get(
-            f'/api/queues/{self._quote(vhost)}/{self._quote(queue)}/bindings')
+            f'/api/queues/{self._quote(vhost)}/{self._quote(queue)}/bindings',
+            model=Binding,
+            **query
+        )
+
+    def list_bindings_by_source(self, exchange, vhost, **query):
+        """
+        A list of all bindings in which a given exchange is the source.
+
+        :param exchange: The exchange name
+        :type exchange: str
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._api_get(
+            '/api/exchanges/{0}/{1}/bindings/source'.format(
+                self._quote(vhost),
+                self._quote(exchange)),
+            model=Binding,
+            **query
+        )
+
+    def list_bindings_by_destination(self, exchange, vhost, **query):
+        """
+        A list of all bindings in which a given exchange is the destination.
+
+        :param exchange: The exchange name
+        :type exchange: str
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._api_get(
+            '/api/exchanges/{0}/{1}/bindings/destination'.format(
+                self._quote(vhost),
+                self._quote(exchange)),
+            model=Binding,
+            **query
+        )
+
+    def _binding_url(self, vhost, source, kind, destination,
+                     properties_key=None):
+        """
+        The url of the bindings between an exchange and a queue (``kind``
+        ``q``) or another exchange (``e``), or of one of them
+        """
+        url = '/api/bindings/{0}/e/{1}/{2}/{3}'.format(
+            self._quote(vhost),
+            self._quote(source),
+            kind,
+            self._quote(destination),
+        )
+        if properties_key is None:
+            return url
+        return '{0}/{1}'.format(url, self._quote(properties_key))
+
+    def list_queue_bindings(self, exchange, queue, vhost, **query):
+        """
+        A list of all bindings between an exchange and a queue.
+
+        :param exchange: The exchange name
+        :type exchange: str
+
+        :param queue: The queue name
+        :type queue: str
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._api_get(
+            self._binding_url(vhost, exchange, 'q', queue),
+            model=Binding,
+            **query
+        )
+
+    def create_queue_binding(self, exchange, queue, vhost, routing_key='',
+                             arguments=None):
+        """
+        Bind a queue to an exchange.
+
+        :param exchange: The exchange name
+        :type exchange: str
+
+        :param queue: The queue name
+        :type queue: str
+
+        :param vhost: The vhost name
+        :type vhost: str
+
+        :param routing_key: The routing key of the binding
+        :type routing_key: str
+
+        :param arguments: The binding arguments, e.g. for a headers exchange
+        :type arguments: dict
+        """
+        return self._api_post(
+            self._binding_url(vhost, exchange, 'q', queue),
+            data={'routing_key': routing_key, 'arguments': arguments or {}},
+        )
+
+    def get_queue_binding(self, exchange, queue, vhost, properties_key,
+                          **query):
+        """
+        An individual binding between an exchange and a queue.
+
+        :param properties_key: The ``properties_key`` of the binding, the
+            routing key and a hash of the arguments
+        :type properties_key: str
+        """
+        return self._api_get(
+            self._binding_url(vhost, exchange, 'q', queue, properties_key),
+            model=Binding,
+            **query
+        )
+
+    def delete_queue_binding(self, exchange, queue, vhost, properties_key):
+        """
+        Delete an individual binding between an exchange and a queue, see
+        :meth:`get_queue_binding`
+        """
+        return self._api_delete(
+            self._binding_url(vhost, exchange, 'q', queue, properties_key)
+        )
+
+    def list_exchange_bindings(self, source, destination, vhost, **query):
+        """
+        A list of all bindings between two exchanges.
+
+        :param source: The source exchange name
+        :type source: str
+
+        :param destination: The destination exchange name
+        :type destination: str
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._api_get(
+            self._binding_url(vhost, source, 'e', destination),
+            model=Binding,
+            **query
+        )
+
+    def create_exchange_binding(self, source, destination, vhost,
+                                routing_key='', arguments=None):
+        """
+        Bind an exchange to another exchange, see
+        :meth:`create_queue_binding`
+        """
+        return self._api_post(
+            self._binding_url(vhost, source, 'e', destination),
+            data={'routing_key': routing_key, 'arguments': arguments or {}},
+        )
+
+    def get_exchange_binding(self, source, destination, vhost,
+                             properties_key, **query):
+        """
+        An individual binding between two exchanges, see
+        :meth:`get_queue_binding`
+        """
+        return self._api_get(
+            self._binding_url(vhost, source, 'e', destination, properties_key),
+            model=Binding,
+            **query
+        )
+
+    def delete_exchange_binding(self, source, destination, vhost,
+                                properties_key):
+        """
+        Delete an individual binding between two exchanges, see
+        :meth:`get_queue_binding`
+        """
+        return self._api_delete(
+            self._binding_url(vhost, source, 'e', destination, properties_key)
+        )
 
-    def list_vhosts(self):
+    def list_vhosts(self, **query):
         """
         A list of all vhosts.
         """
-        return self._api_get('/api/vhosts')
+        return self._api_get('/api/vhosts', **query)
 
-    def get_vhost(self, name):
+    def get_vhost(self, name, **query):
         """
         Details about an individual vhost.
 
@@ -302,7 +887,7 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/vhosts/{0}'.format(
             self._quote(name)
-        ))
+        ), **query)
 
     def delete_vhost(self, name):
         """
@@ -311,7 +896,7 @@ class RabbitAPIClient(Resource):
         :param name: The vhost name
         :type name: str
         """
-        self._api_delete('/api/vhosts/{0}'.format(
+        return self._api_delete('/api/vhosts/{0}'.format(
             self._quote(name)
         ))
 
@@ -326,18 +911,18 @@ class RabbitAPIClient(Resource):
         :type tracing: bool
         """
         data = {'tracing': True} if tracing else {}
-        self._api_put(
+        return self._api_put(
             '/api/vhosts/{0}'.format(self._quote(name)),
             data=data,
         )
 
-    def list_users(self):
+    def list_users(self, **query):
         """
         A list of all users.
         """
-        return self._api_get('/api/users')
+        return self._api_get('/api/users', **query)
 
-    def get_user(self, name):
+    def get_user(self, name, **query):
         """
         Details about an individual user.
 
@@ -346,7 +931,7 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/users/{0}'.format(
             self._quote(name)
-        ))
+        ), **query)
 
     def delete_user(self, name):
         """
@@ -355,7 +940,7 @@ class RabbitAPIClient(Resource):
         :param name: The user's name
         :type name: str
         """
-        self._api_delete('/api/users/{0}'.format(
+        return self._api_delete('/api/users/{0}'.format(
             self._quote(name)
         ))
 
@@ -385,12 +970,12 @@ class RabbitAPIClient(Resource):
         else:
             data['password_hash'] = ""
 
-        self._api_put(
+        return self._api_put(
             '/api/users/{0}'.format(self._quote(name)),
             data=data,
         )
 
-    def list_user_permissions(self, name):
+    def list_user_permissions(self, name, **query):
         """
         A list of all permissions for a given user.
 
@@ -399,7 +984,7 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/users/{0}/permissions'.format(
             self._quote(name)
-        ))
+        ), **query)
 
     def whoami(self):
         """
@@ -407,13 +992,13 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/whoami')
 
-    def list_permissions(self):
+    def list_permissions(self, **query):
         """
         A list of all permissions for all users.
         """
-        return self._api_get('/api/permissions')
+        return self._api_get('/api/permissions', **query)
 
-    def get_user_permission(self, vhost, name):
+    def get_user_permission(self, vhost, name, **query):
         """
         An individual permission of a user and virtual host.
 
@@ -426,7 +1011,7 @@ class RabbitAPIClient(Resource):
         return self._api_get('/api/permissions/{0}/{1}'.format(
             self._quote(vhost),
             self._quote(name)
-        ))
+        ), **query)
 
     def delete_user_permission(self, name, vhost):
         """
@@ -438,7 +1023,7 @@ class RabbitAPIClient(Resource):
         :param vhost: The vhost name
         :type vhost: str
         """
-        self._api_delete('/api/permissions/{0}/{1}'.format(
+        return self._api_delete('/api/permissions/{0}/{1}'.format(
             self._quote(vhost),
             self._quote(name)
         ))
@@ -468,7 +1053,7 @@ class RabbitAPIClient(Resource):
             'write': write or '.*',
             'read': read or '.*',
         }
-        self._api_put(
+        return self._api_put(
             '/api/permissions/{0}/{1}'.format(
                 self._quote(vhost),
                 self._quote(name)
@@ -476,21 +1061,21 @@ class RabbitAPIClient(Resource):
             data=data
         )
 
-    def list_policies(self):
+    def list_policies(self, **query):
         """
         A list of all policies
         """
-        return self._api_get('/api/policies')
+        return self._api_get('/api/policies', **query)
 
-    def list_policies_for_vhost(self, vhost):
+    def list_policies_for_vhost(self, vhost, **query):
         """
         A list of all policies for a vhost.
         """
         return self._api_get('/api/policies/{0}'.format(
             self._quote(vhost)
-        ))
+        ), **query)
 
-    def get_policy_for_vhost(self, vhost, name):
+    def get_policy_for_vhost(self, vhost, name, **query):
         """
         Get a specific policy for a vhost.
 
@@ -502,7 +1087,7 @@ class RabbitAPIClient(Resource):
         return self._api_get('/api/policies/{0}/{1}'.format(
             self._quote(vhost),
             self._quote(name),
-        ))
+        ), **query)
 
     def create_policy_for_vhost(
             self, vhost, name,
@@ -545,7 +1130,7 @@ class RabbitAPIClient(Resource):
             "priority": priority,
             "apply-to": apply_to
         }
-        self._api_put(
+        return self._api_put(
             '/api/policies/{0}/{1}'.format(
                 self._quote(vhost),
                 self._quote(name),
@@ -562,7 +1147,7 @@ class RabbitAPIClient(Resource):
         :param name: The name of the policy
         :type name: str
         """
-        self._api_delete('/api/policies/{0}/{1}/'.format(
+        return self._api_delete('/api/policies/{0}/{1}/'.format(
             self._quote(vhost),
             self._quote(name),
         ))
@@ -603,14 +1188,14 @@ class RabbitAPIClient(Resource):
         :param body: A body for the queue.
         :type body: dict
         """
-        self._api_put(
+        return self._api_put(
             '/api/queues/{0}/{1}'.format(
                 self._quote(vhost),
                 self._quote(queue)),
             data=body
         )
 
-    def get_queue_for_vhost(self, queue, vhost):
+    def get_queue_for_vhost(self, queue, vhost, **query):
         """
         An individual queue
 
@@ -623,15 +1208,15 @@ class RabbitAPIClient(Resource):
         return self._api_get('/api/queues/{0}/{1}'.format(
             self._quote(vhost),
             self._quote(queue)
-        ))
+        ), model=Queue, **query)
 
-    def list_queues(self):
+    def list_queues(self, **query):
         """
         A list of all queues.
         """
-        return self._api_get('/api/queues')
+        return self._api_get('/api/queues', model=Queue, **query)
 
-    def list_queues_for_vhost(self, vhost):
+    def list_queues_for_vhost(self, vhost, **query):
         """
         A list of all queues in a given virtual host.
 
@@ -640,13 +1225,79 @@ class RabbitAPIClient(Resource):
         """
         return self._api_get('/api/queues/{0}'.format(
             self._quote(vhost)
-        ))
+        ), model=Queue, **query)
+
+    def list_queues_page(self, page=1, page_size=100, vhost=None, **filters):
+        """
+        A page of queues, optionally in a given virtual host. Takes the
+        ``name``, ``use_regex``, ``sort`` and ``sort_reverse`` filters, see
+        :meth:`_page`.
+
+        :param page: The page number, starting from 1
+        :type page: int
+
+        :param page_size: The number of queues per page
+        :type page_size: int
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._page(
+            self._vhost_url('/api/queues', vhost),
+            page,
+            page_size,
+            model=Queue,
+            **filters
+        )
+
+    def iter_queues(self, vhost=None, page_size=500, prefetch=False,
+                    **filters):
+        """
+        Iterates over all queues, optionally in a given virtual host,
+        requesting them page by page. Takes the same filters as
+        :meth:`list_queues_page`.
+
+        :param vhost: The vhost name
+        :type vhost: str
+
+        :param page_size: The number of queues per request
+        :type page_size: int
+
+        :param prefetch: Set to ``True`` to request the next page while the
+            current one is consumed
+        :type prefetch: bool
+        """
+        return self._iter_pages(
+            self._vhost_url('/api/queues', vhost),
+            page_size,
+            prefetch,
+            model=Queue,
+            **filters
+        )
+
+    def stream_queues(self, vhost=None, **query):
+        """
+        Iterates over all queues, optionally in a given virtual host,
+        decoding them one by one while the response is downloaded, so only
+        one queue is kept in memory.
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._api_get(
+            self._vhost_url('/api/queues', vhost),
+            stream=True,
+            model=Queue,
+            **query
+        )
 
     def extract_messages(self, queue, vhost, limit=1,
                          *,
                          mode='ack_requeue_false',
                          encoding='auto',
-                         truncate=None):
+                         truncate=None,
+                         binary=False,
+                         buffer=None):
         """Get messages from a queue and removed or requeued.
 
         :param queue: The queue name
@@ -667,18 +1318,31 @@ class RabbitAPIClient(Resource):
 
         :param truncate: truncate the message payload(in bytes)
         :type truncate: int
+
+        :param binary: return the payloads as bytes, requested in base64 and
+            decoded in one pass
+        :type binary: bool
+
+        :param buffer: decode the payloads into this buffer and return them
+            as ``memoryview`` slices of it, see
+            :func:`rabbitmq_admin.messages.decode_payloads`
+        :type buffer: bytearray
         """
+        binary = binary or buffer is not None
         body = {
             'count': limit,
             'ackmode': mode,
-            'encoding': encoding,
+            'encoding': 'base64' if binary else encoding,
         }
         if truncate:
             body['truncate'] = truncate
 
-        return self._api_post(
+        messages = self._api_post(
             f'/api/queues/{self._quote(vhost)}/{self._quote(queue)}/get',
             data=body)
+        if not binary:
+            return messages
+        return self._then(messages, partial(decode_payloads, buffer=buffer))
 
     def delete_queue_for_vhost(self, queue, vhost, if_unused=False,
                                if_empty=False):
@@ -702,7 +1366,7 @@ class RabbitAPIClient(Resource):
         :param if_empty: Set to ``True`` to only delete if it is empty
         :type if_empty: bool
         """
-        self._api_delete(
+        return self._api_delete(
             '/api/queues/{0}/{1}'.format(
                 self._quote(vhost),
                 self._quote(queue)),
@@ -711,3 +1375,218 @@ class RabbitAPIClient(Resource):
                 'if-empty': if_empty
             },
         )
+
+    def purge_queue(self, queue, vhost):
+        """
+        Delete all the ready messages of a queue
+
+        :param queue: The queue name
+        :type queue: str
+
+        :param vhost: The vhost name
+        :type vhost: str
+        """
+        return self._api_delete(
+            '/api/queues/{0}/{1}/contents'.format(
+                self._quote(vhost),
+                self._quote(queue)),
+        )
+
+    def queue_action(self, queue, vhost, action):
+        """
+        Run an action on a queue, e.g. ``sync`` or ``cancel_sync`` for a
+        classic mirrored queue
+
+        :param queue: The queue name
+        :type queue: str
+
+        :param vhost: The vhost name
+        :type vhost: str
+
+        :param action: The action name
+        :type action: str
+        """
+        return self._api_post(
+            '/api/queues/{0}/{1}/actions'.format(
+                self._quote(vhost),
+                self._quote(queue)),
+            data={'action': action},
+        )
+
+    def purge_queues(self, vhost, regex, concurrency=32):
+        """
+        Purge the queues of a vhost whose name matches a regular expression
+        concurrently, see :meth:`bulk`. The queues are filtered by the
+        server, the expression is not anchored.
+
+        Example ::
+
+            >>> results = api.purge_queues('/', r'^orders\\.retry\\.')
+            >>> [result.item['queue'] for result in results if not result.ok]
+            []
+
+        :param vhost: The vhost name
+        :type vhost: str
+
+        :param regex: The regular expression the names are searched with
+        :type regex: str
+
+        :returns: A :class:`rabbitmq_admin.bulk.BulkResult` per queue
+        :rtype: list
+        """
+        return self._for_queues(self.purge_queue, vhost, regex, concurrency)
+
+    def queue_actions(self, vhost, regex, action, concurrency=32):
+        """
+        Run an action on the queues of a vhost whose name matches a regular
+        expression concurrently, see :meth:`purge_queues` and
+        :meth:`queue_action`
+        """
+        return self._for_queues(
+            partial(self.queue_action, action=action),
+            vhost,
+            regex,
+            concurrency,
+        )
+
+    def _for_queues(self, func, vhost, regex, concurrency):
+        """
+        Calls ``func`` with the queue and vhost of every matching queue
+        """
+        queues = self.iter_queues(
+            vhost, name=regex, use_regex=True, columns=['name']
+        )
+        return self._bulk(func, [
+            {'queue': queue['name'], 'vhost': vhost} for queue in queues
+        ], concurrency)
+
+    def _bulk(self, func, items, concurrency):
+        """
+        Runs ``func`` for every item on a thread pool, see
+        :func:`rabbitmq_admin.bulk.iter_bulk`
+        """
+        return list(iter_bulk(func, items, concurrency))
+
+    def _iter_bulk(self, func, items, concurrency):
+        """
+        Yields the results of :meth:`_bulk` lazily
+        """
+        return iter_bulk(func, items, concurrency)
+
+    def bulk(self, method, items, concurrency=32):
+        """
+        Calls a client method for many items concurrently. Errors do not
+        stop the other calls, every item gets a
+        :class:`rabbitmq_admin.bulk.BulkResult` in the order of the items.
+        Set ``pool_maxsize`` to at least ``concurrency`` so every thread
+        reuses a keep-alive connection.
+
+        Example ::
+
+            >>> results = api.bulk('create_vhost', ['tenant1', 'tenant2'])
+            >>> [result.item for result in results if not result.ok]
+            []
+
+        :param method: The client method or its name
+        :type method: str or callable
+
+        :param items: The arguments of each call. A dict is passed as
+            keyword arguments, a tuple as positional ones and anything
+            else as the only argument
+        :type items: iterable
+
+        :param concurrency: The number of concurrent requests
+        :type concurrency: int
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+        return self._bulk(method, items, concurrency)
+
+    def bulk_create_queues(self, queues, concurrency=32):
+        """
+        Create many queues concurrently, see :meth:`bulk`
+
+        :param queues: The arguments of :meth:`create_queue_for_vhost`, e.g.
+            ``{'queue': 'q1', 'vhost': '/', 'body': {'durable': True}}``
+        :type queues: iterable of dict
+        """
+        return self._bulk(self.create_queue_for_vhost, queues, concurrency)
+
+    def bulk_delete_queues(self, queues, concurrency=32):
+        """
+        Delete many queues concurrently, see :meth:`bulk`
+
+        :param queues: The arguments of :meth:`delete_queue_for_vhost`, e.g.
+            ``{'queue': 'q1', 'vhost': '/', 'if_empty': True}``
+        :type queues: iterable of dict
+        """
+        return self._bulk(self.delete_queue_for_vhost, queues, concurrency)
+
+    def bulk_create_exchanges(self, exchanges, concurrency=32):
+        """
+        Create many exchanges concurrently, see :meth:`bulk`
+
+        :param exchanges: The arguments of
+            :meth:`create_exchange_for_vhost`, e.g.
+            ``{'exchange': 'e1', 'vhost': '/', 'body': {'type': 'topic'}}``
+        :type exchanges: iterable of dict
+        """
+        return self._bulk(
+            self.create_exchange_for_vhost, exchanges, concurrency
+        )
+
+    def bulk_delete_exchanges(self, exchanges, concurrency=32):
+        """
+        Delete many exchanges concurrently, see :meth:`bulk`
+
+        :param exchanges: The arguments of
+            :meth:`delete_exchange_for_vhost`, e.g.
+            ``{'exchange': 'e1', 'vhost': '/'}``
+        :type exchanges: iterable of dict
+        """
+        return self._bulk(
+            self.delete_exchange_for_vhost, exchanges, concurrency
+        )
+
+    def bulk_create_users(self, users, concurrency=32):
+        """
+        Create many users concurrently, see :meth:`bulk`
+
+        :param users: The arguments of :meth:`create_user`, e.g.
+            ``{'name': 'u1', 'password': 'secret', 'tags': ['management']}``
+        :type users: iterable of dict
+        """
+        return self._bulk(self.create_user, users, concurrency)
+
+    def bulk_delete_users(self, names, concurrency=32):
+        """
+        Delete many users concurrently, see :meth:`bulk`
+
+        :param names: The user names
+        :type names: iterable of str
+        """
+        return self._bulk(self.delete_user, names, concurrency)
+
+    def bulk_create_user_permissions(self, permissions, concurrency=32):
+        """
+        Create many user permissions concurrently, see :meth:`bulk`
+
+        :param permissions: The arguments of :meth:`create_user_permission`,
+            e.g. ``{'name': 'u1', 'vhost': '/', 'read': '^u1\\.'}``
+        :type permissions: iterable of dict
+        """
+        return self._bulk(
+            self.create_user_permission, permissions, concurrency
+        )
+
+    def bulk_delete_user_permissions(self, permissions, concurrency=32):
+        """
+        Delete many user permissions concurrently, see :meth:`bulk`
+
+        :param permissions: The arguments of :meth:`delete_user_permission`,
+            e.g. ``{'name': 'u1', 'vhost': '/'}``
+        :type permissions: iterable of dict
+        """
+        return self._bulk(
+            self.delete_user_permission, permissions, concurrency
+        )
@@ -0,0 +1,128 @@
+import asyncio
+from collections import deque
+from functools import partial
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.async_base import AsyncResource
+from rabbitmq_admin.bulk import BulkResult, split_item
+from rabbitmq_admin.definitions import DefinitionsProgress, split_definitions
+
+
+async def acall_item(func, item):
+    """
+    Awaits ``func`` with the item, see :func:`rabbitmq_admin.bulk.call_item`
+    """
+    args, kwargs = split_item(item)
+    try:
+        return BulkResult(item, await func(*args, **kwargs), None)
+    except Exception as error:
+        return BulkResult(item, None, error)
+
+
+class AsyncRabbitAPIClient(AsyncResource, RabbitAPIClient):
+    """
+    The asyncio entrypoint for interacting with the RabbitMQ Management HTTP
+    API. It has the same methods as :class:`RabbitAPIClient`, every method
+    returns a coroutine and the ``iter_*`` methods return async iterators:
+    ::
+
+        async with AsyncRabbitAPIClient(host, port, auth=auth) as api:
+            queues = await asyncio.gather(*(
+                api.get_queue_for_vhost(name, '/') for name in names
+            ))
+            async for queue in api.iter_queues():
+                ...
+    """
+
+    async def _iter_pages(self, url, page_size=500, prefetch=False,
+                          **filters):
+        """
+        Yields the items of a list page by page, see
+        :meth:`RabbitAPIClient._iter_pages`
+        """
+        fetch = partial(self._page, url, page_size=page_size, **filters)
+        async for page in self._pages(fetch, prefetch):
+            for item in page['items']:
+                yield item
+
+    async def _pages(self, fetch, prefetch):
+        """
+        Yields the pages of a list, requesting the next page in a task while
+        the current one is consumed if ``prefetch`` is set
+        """
+        following = None
+        try:
+            page = await fetch(page=1)
+            while page['page'] < page['page_count']:
+                number = page['page'] + 1
+                if prefetch:
+                    following = asyncio.ensure_future(fetch(page=number))
+                yield page
+                page = await (following if prefetch else fetch(page=number))
+            yield page
+        finally:
+            if following:
+                following.cancel()
+
+    async def apply_definitions_chunked(self, definitions, chunk_size=500,
+                                        concurrency=1, progress=None):
+        """
+        Upload a large set of definitions in bounded batches, see
+        :meth:`RabbitAPIClient.apply_definitions_chunked`
+        """
+        head, vhosts = split_definitions(definitions, chunk_size)
+        tracker = DefinitionsProgress(head, vhosts, progress)
+
+        for chunk in head:
+            await self.post_definitions(chunk)
+            tracker.advance(chunk)
+
+        async def apply_vhost(vhost):
+            for chunk in vhosts[vhost]:
+                await self.post_definitions(chunk)
+                tracker.advance(chunk)
+
+        return await self._bulk(apply_vhost, list(vhosts), concurrency)
+
+    async def _bulk(self, func, items, concurrency):
+        """
+        Runs the coroutine function for every item, at most ``concurrency``
+        at a time, see :meth:`RabbitAPIClient.bulk`
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(item):
+            async with semaphore:
+                return await acall_item(func, item)
+
+        return list(await asyncio.gather(*map(call, items)))
+
+    async def _for_queues(self, func, vhost, regex, concurrency):
+        """
+        Calls ``func`` for every matching queue, see
+        :meth:`RabbitAPIClient._for_queues`
+        """
+        queues = self.iter_queues(
+            vhost, name=regex, use_regex=True, columns=['name']
+        )
+        return await self._bulk(func, [
+            {'queue': queue['name'], 'vhost': vhost} async for queue in queues
+        ], concurrency)
+
+    async def _iter_bulk(self, func, items, concurrency):
+        """
+        Yields the results of :meth:`_bulk` in the order of the items with
+        at most ``concurrency`` calls in flight, so ``items`` may be a lazy
+        iterable of any length
+        """
+        window = deque()
+        try:
+            for item in items:
+                window.append(asyncio.ensure_future(acall_item(func, item)))
+                if len(window) >= concurrency:
+                    yield await window.popleft()
+            while window:
+                yield await window.popleft()
+        finally:
+            for task in window:
+                task.cancel()
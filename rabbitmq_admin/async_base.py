@@ -0,0 +1,265 @@
+import asyncio
+import inspect
+from functools import partial
+
+from rabbitmq_admin.base import Resource
+from rabbitmq_admin.instrumentation import RequestEvent, current_event
+from rabbitmq_admin.streaming import JSONArrayParser
+from rabbitmq_admin.throttle import UNLIMITED
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class AsyncResource(Resource):
+    """
+    A base class for API resources which performs the requests on an asyncio
+    event loop. The ``_api_*`` wrappers are shared with :class:`Resource`,
+    only the transport methods are coroutines here.
+
+    Requires the ``httpx`` package, install it with the ``async`` extra.
+    """
+
+    def __init__(self, *args, transport=None, **kwargs):
+        """
+        Takes the same arguments as :class:`Resource`
+
+        :param transport: An optional httpx transport, used instead of the
+            default pooled one (e.g. ``httpx.MockTransport`` in tests)
+        :type transport: httpx.AsyncBaseTransport
+        """
+        self._transport = transport
+        super().__init__(*args, **kwargs)
+
+    def _make_session(
+            self, pool_connections, pool_maxsize, pool_block, max_retries
+    ):
+        """
+        Creates the async client which keeps the connections to the API open
+        between the requests. ``pool_block`` has no equivalent in httpx, the
+        total number of connections is limited by
+        ``pool_connections * pool_maxsize``
+        """
+        if httpx is None:
+            raise ImportError(
+                'httpx is required for the asyncio client, install '
+                'rabbitmq-api-admin[async]'
+            )
+        limits = httpx.Limits(
+            max_connections=pool_connections * pool_maxsize,
+            max_keepalive_connections=pool_maxsize,
+        )
+        transport = self._transport or httpx.AsyncHTTPTransport(
+            verify=self.verify,
+            limits=limits,
+            retries=max_retries,
+        )
+        return httpx.AsyncClient(transport=transport, limits=limits)
+
+    def __enter__(self):
+        raise TypeError('Use "async with" for the asyncio client')
+
+    def __exit__(self, *args):
+        """Never called, see __enter__"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the client and all the pooled connections
+        """
+        await self.session.aclose()
+
+    def _models(self, result, model):
+        if inspect.isasyncgen(result):
+            return self._stream_models(result, model)
+        return self._await_models(result, model)
+
+    async def _await_models(self, result, model):
+        return model.parse(await result)
+
+    async def _stream_models(self, items, model):
+        async for item in items:
+            yield model(item)
+
+    async def _then(self, result, func):
+        return func(await result)
+
+    async def _stream(self, kwargs):
+        """
+        Yields the items of a streamed GET. The limit of the request class
+        is held and the request is reported to the hooks until the
+        generator is exhausted or closed
+        """
+        event = self._begin('GET', kwargs)
+        error = None
+        try:
+            async with self._limit('GET', kwargs) or UNLIMITED:
+                async for item in self._open(event, kwargs):
+                    yield item
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._end(event, error)
+
+    def _cached_get(self, url, kwargs):
+        """
+        Returns the cached response or gets it
+        """
+        return self.cache.aget_or_fetch(
+            url,
+            kwargs['params'],
+            partial(self._send, 'GET', self._get, kwargs),
+        )
+
+    async def _send(self, method, send, kwargs):
+        """
+        Sends a request and reports it to the hooks
+        """
+        if not self.hooks:
+            return await self._retried(method, send, kwargs)
+        event = RequestEvent(method, kwargs['url'], kwargs.get('params'))
+        token = current_event.set(event)
+        try:
+            self._emit('before_request', event)
+            result = await self._retried(method, send, kwargs)
+        except Exception as error:
+            self._end(event, error)
+            raise
+        finally:
+            current_event.reset(token)
+        self._end(event)
+        return result
+
+    async def _retried(self, method, send, kwargs):
+        """
+        Sends a request, retrying it according to the retry policy
+        """
+        send = self._limited(method, send, kwargs)
+        if self.retry is None or not self.retry.retries(method):
+            return await send(**kwargs)
+        self.retry.budget.deposit()
+        attempt, delay = 0, None
+        while True:
+            try:
+                return await send(**kwargs)
+            except Exception as error:
+                attempt += 1
+                delay = self.retry.delay(attempt, error, delay)
+                if delay is None:
+                    raise
+            self._count_retry()
+            await asyncio.sleep(delay)
+
+    async def _throttled(self, limit, send, **kwargs):
+        async with limit:
+            return await send(**kwargs)
+
+    async def _write(self, method, send, url, kwargs):
+        """
+        Sends a write request and invalidates the cached responses it may
+        have changed
+        """
+        try:
+            return await self._send(method, send, kwargs)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(url)
+
+    async def _request(self, method, url, data=None, **kwargs):
+        """
+        Sends a request with the pooled client. It will also json encode
+        your 'data' parameter
+
+        :returns: The response
+        :rtype: httpx.Response
+        """
+        kwargs.pop('verify', None)
+        if data is not None:
+            kwargs['content'] = self._encode(data)
+        event = current_event.get()
+        if event is not None:
+            kwargs['extensions'] = {'trace': event.trace}
+        response = await self.session.request(method, url, **kwargs)
+        self._observe(response)
+        # unlike requests, httpx raises on redirects, 304 answers a
+        # conditional GET
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def _observe(self, response):
+        """
+        Reports the response to the hooks, the timings are traced
+        """
+        event = current_event.get()
+        if event is not None:
+            event.observe(response)
+
+    def _get(self, *args, stream=False, **kwargs):
+        """
+        A wrapper for getting things. Pass ``stream=True`` to get an async
+        generator which decodes the elements of a JSON array one by one
+        while the response is downloaded
+
+        :returns: The response of your get
+        :rtype: dict
+        """
+        if stream:
+            return self._stream_items(
+                *args, event=current_event.get(), **kwargs
+            )
+        return self._get_json(*args, **kwargs)
+
+    async def _get_json(self, url, **kwargs):
+        validated = self._validate(url, kwargs)
+        response = await self._request('GET', url, **kwargs)
+        return self._decode_get(response, validated)
+
+    async def _stream_items(self, url, event=None, **kwargs):
+        kwargs.pop('verify', None)
+        if event is not None:
+            kwargs['extensions'] = {'trace': event.trace}
+        parser = JSONArrayParser()
+        async with self.session.stream('GET', url, **kwargs) as response:
+            chunks = response.aiter_bytes(self.stream_chunk_size)
+            if event is not None:
+                event.observe(response, streamed=True)
+                chunks = event.aread(chunks)
+            response.raise_for_status()
+            async for chunk in chunks:
+                for item in parser.feed(chunk):
+                    yield item
+        for item in parser.close():
+            yield item
+
+    async def _put(self, *args, **kwargs):
+        """
+        A wrapper for putting things. It will also json encode your 'data'
+        parameter
+        """
+        await self._request('PUT', *args, **kwargs)
+
+    async def _post(self, *args, **kwargs):
+        """
+        A wrapper for posting things. It will also json encode your 'data'
+        parameter
+
+        :returns: The response of your post
+        :rtype: dict
+        """
+        response = await self._request('POST', *args, **kwargs)
+        return self._decode(response) if response.content else None
+
+    async def _delete(self, *args, **kwargs):
+        """
+        A wrapper for deleting things
+        """
+        await self._request('DELETE', *args, **kwargs)
@@ -1,7 +1,16 @@
-import json
+import time
+
 import requests
 import urllib3
 from copy import deepcopy
+from functools import partial
+
+from requests.adapters import HTTPAdapter
+
+from rabbitmq_admin.codec import get_codec
+from rabbitmq_admin.instrumentation import RequestEvent, current_event
+from rabbitmq_admin.streaming import iter_json_array
+from rabbitmq_admin.throttle import UNLIMITED
 
 
 class Resource(object):
@@ -13,8 +22,14 @@ class Resource(object):
     # ```['GET', 'PUT', 'POST', 'DELETE']``"""
     # ALLOWED_METHODS = []
 
+    #: The size of the chunks read from streamed responses
+    stream_chunk_size = 64 * 1024
+
     def __init__(
-            self, host, port, auth, scheme='http', timeout=10, verify=True
+            self, host, port, auth, scheme='http', timeout=10, verify=True,
+            pool_connections=10, pool_maxsize=10, pool_block=False,
+            max_retries=0, codec=None, cache=None, conditional=None,
+            retry=None, throttle=None, hooks=None,
     ):
         """
         :param host: The RabbitMQ API host to connect to
@@ -35,6 +50,49 @@ class Resource(object):
         :param verify: verifies SSL certificates for HTTPS requests
         :type verify: bool
 
+        :param pool_connections: the number of per-host connection pools
+            to keep in the session
+        :type pool_connections: int
+
+        :param pool_maxsize: the maximum number of keep-alive connections
+            kept open to a single host
+        :type pool_maxsize: int
+
+        :param pool_block: set to ``True`` to wait for a free connection
+            instead of opening more than ``pool_maxsize`` connections to a
+            single host
+        :type pool_block: bool
+
+        :param max_retries: the number of retries for failed connections,
+            passed to the transport adapter
+        :type max_retries: int
+
+        :param codec: The JSON codec for the request and response bodies,
+            a name like ``'orjson'`` or a codec instance. Defaults to the
+            fastest installed one, see :func:`rabbitmq_admin.codec.get_codec`
+        :type codec: str or rabbitmq_admin.codec.JSONCodec
+
+        :param cache: An optional cache for GET responses, writes through
+            this resource invalidate the related responses
+        :type cache: rabbitmq_admin.cache.ResponseCache
+
+        :param conditional: An optional store of response validators, GET
+            requests are then sent as conditional requests and unchanged
+            responses are not decoded again
+        :type conditional: rabbitmq_admin.cache.ValidatorCache
+
+        :param retry: An optional policy to retry the requests which failed
+            with a transient error. Streamed responses are not retried
+        :type retry: rabbitmq_admin.retry.RetryPolicy
+
+        :param throttle: Optional rate and concurrency limits of the
+            requests, a streamed response holds its limit until it is read
+        :type throttle: rabbitmq_admin.throttle.Throttle
+
+        :param hooks: Objects called around every request, a streamed
+            one ends when its generator is exhausted or closed
+        :type hooks: list of rabbitmq_admin.instrumentation.Hook
+
         .. _Requests' authentication:
         http://docs.python-requests.org/en/latest/user/authentication/
         """
@@ -42,6 +100,12 @@ class Resource(object):
         self.auth = auth
         self.timeout = timeout
         self.verify = verify
+        self.codec = get_codec(codec)
+        self.cache = cache
+        self.conditional = conditional
+        self.retry = retry
+        self.throttle = throttle
+        self.hooks = list(hooks or [])
 
         if not self.verify:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -50,10 +114,46 @@ class Resource(object):
             'Content-type': 'application/json',
         }
 
-    def _api_get(self, url, **kwargs):
+        self.session = self._make_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+        )
+
+    def _make_session(
+            self, pool_connections, pool_maxsize, pool_block, max_retries
+    ):
+        """
+        Creates the session which keeps the connections to the API open
+        between the requests
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
         """
-        A convenience wrapper for _get. Adds headers, auth and base url by
-        default
+        Closes the session and all the pooled connections
+        """
+        self.session.close()
+
+    def _prepare(self, url, kwargs):
+        """
+        Adds headers, auth, timeout and base url to the request arguments
         """
         kwargs['url'] = self.url + url
         kwargs['auth'] = self.auth
@@ -63,35 +163,328 @@ class Resource(object):
         kwargs['headers'] = headers
         kwargs['timeout'] = self.timeout
         kwargs['verify'] = self.verify
-        return self._get(**kwargs)
+        if kwargs.get('params'):
+            kwargs['params'] = self._encode_params(kwargs['params'])
+        return kwargs
+
+    def _encode_params(self, params):
+        """
+        Drops empty query parameters and lowercases booleans, the API only
+        recognises ``true``
+        """
+        return {
+            key: str(value).lower() if isinstance(value, bool) else value
+            for key, value in params.items()
+            if value is not None
+        }
+
+    def _encode(self, data):
+        """
+        Encodes the request body
+        """
+        body = self.codec.dumps(data)
+        event = current_event.get()
+        if event is not None:
+            event.bytes_out = len(body)
+        return body
+
+    def _decode(self, response):
+        """
+        Decodes the response body
+        """
+        event = current_event.get()
+        if event is None:
+            return self.codec.loads(response.content)
+        started = time.perf_counter()
+        value = self.codec.loads(response.content)
+        event.timings['decode'] = time.perf_counter() - started
+        return value
+
+    def _observe(self, response, streamed=False):
+        """
+        Reports the response to the hooks
+        """
+        event = current_event.get()
+        if event is not None:
+            event.observe(response, streamed)
+            event.timings['ttfb'] = response.elapsed.total_seconds()
+
+    def _api_get(self, url, columns=None, disable_stats=None,
+                 enable_queue_totals=None, raw=True, model=None, **kwargs):
+        """
+        A convenience wrapper for _get. Adds headers, auth and base url by
+        default
+
+        :param columns: Only return these fields of the objects, nested
+            fields are separated by dots, e.g. ``message_stats.publish``
+        :type columns: list of str or str
+
+        :param disable_stats: Set to ``True`` to skip the message rates and
+            other statistics the server has to compute
+        :type disable_stats: bool
+
+        :param enable_queue_totals: Set to ``True`` together with
+            ``disable_stats`` to still get the queue message counts
+        :type enable_queue_totals: bool
+
+        :param raw: Set to ``False`` to get ``model`` objects instead of
+            dicts
+        :type raw: bool
+
+        :param model: The model class of the objects
+        :type model: type
+        """
+        if not isinstance(columns, (str, type(None))):
+            columns = ','.join(columns)
+        kwargs['params'] = dict(
+            kwargs.get('params') or {},
+            columns=columns,
+            disable_stats=disable_stats,
+            enable_queue_totals=enable_queue_totals,
+        )
+        self._prepare(url, kwargs)
+        result = self._fetch(url, kwargs)
+        if raw or model is None:
+            return result
+        return self._models(result, model)
+
+    def _fetch(self, url, kwargs):
+        if kwargs.get('stream'):
+            return self._stream(kwargs)
+        if self.cache is None:
+            return self._send('GET', self._get, kwargs)
+        return self._cached_get(url, kwargs)
+
+    def _models(self, result, model):
+        """
+        Turns the decoded response into model objects, see
+        :mod:`rabbitmq_admin.models`
+        """
+        return model.parse(result)
+
+    def _then(self, result, func):
+        """
+        Applies ``func`` to the result of a request, the asyncio client
+        awaits it first
+        """
+        return func(result)
+
+    def _stream(self, kwargs):
+        """
+        Yields the items of a streamed GET. The limit of the request class
+        is held and the request is reported to the hooks until the
+        generator is exhausted or closed
+        """
+        event = self._begin('GET', kwargs)
+        error = None
+        try:
+            with self._limit('GET', kwargs) or UNLIMITED:
+                yield from self._open(event, kwargs)
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._end(event, error)
+
+    def _open(self, event, kwargs):
+        """
+        Starts a streamed GET with its event as the current one. The event
+        is not current while the items are read, the caller may send other
+        requests in between
+        """
+        token = current_event.set(event)
+        try:
+            return self._get(**kwargs)
+        finally:
+            current_event.reset(token)
+
+    def _cached_get(self, url, kwargs):
+        """
+        Returns the cached response or gets it
+        """
+        return self.cache.get_or_fetch(
+            url,
+            kwargs['params'],
+            partial(self._send, 'GET', self._get, kwargs),
+        )
+
+    def _send(self, method, send, kwargs):
+        """
+        Sends a request and reports it to the hooks
+        """
+        if not self.hooks:
+            return self._retried(method, send, kwargs)
+        event = RequestEvent(method, kwargs['url'], kwargs.get('params'))
+        token = current_event.set(event)
+        try:
+            self._emit('before_request', event)
+            result = self._retried(method, send, kwargs)
+        except Exception as error:
+            self._end(event, error)
+            raise
+        finally:
+            current_event.reset(token)
+        self._end(event)
+        return result
+
+    def _begin(self, method, kwargs):
+        """
+        Reports the start of a request to the hooks
+
+        :returns: The event of the request, ``None`` without hooks
+        :rtype: rabbitmq_admin.instrumentation.RequestEvent
+        """
+        if not self.hooks:
+            return None
+        event = RequestEvent(method, kwargs['url'], kwargs.get('params'))
+        self._emit('before_request', event)
+        return event
+
+    def _end(self, event, error=None):
+        """
+        Reports the end of a request to the hooks
+        """
+        if event is None:
+            return
+        event.finish(error)
+        self._emit('after_response' if error is None else 'on_error', event)
+
+    def _emit(self, name, event):
+        for hook in self.hooks:
+            getattr(hook, name)(event)
+
+    def _retried(self, method, send, kwargs):
+        """
+        Sends a request, retrying it according to the retry policy
+        """
+        send = self._limited(method, send, kwargs)
+        if self.retry is None or not self.retry.retries(method):
+            return send(**kwargs)
+        self.retry.budget.deposit()
+        attempt, delay = 0, None
+        while True:
+            try:
+                return send(**kwargs)
+            except Exception as error:
+                attempt += 1
+                delay = self.retry.delay(attempt, error, delay)
+                if delay is None:
+                    raise
+            self._count_retry()
+            time.sleep(delay)
+
+    def _count_retry(self):
+        event = current_event.get()
+        if event is not None:
+            event.retries += 1
+
+    def _limit(self, method, kwargs):
+        """
+        :returns: The limit of the request class, ``None`` without a
+            throttle
+        :rtype: rabbitmq_admin.throttle.Limit
+        """
+        if self.throttle is None:
+            return None
+        return self.throttle.limit_for(
+            method, kwargs['url'], kwargs.get('params')
+        )
+
+    def _limited(self, method, send, kwargs):
+        """
+        Applies the limit of the request class to every attempt
+        """
+        limit = self._limit(method, kwargs)
+        if limit is None:
+            return send
+        return partial(self._throttled, limit, send)
+
+    def _throttled(self, limit, send, **kwargs):
+        with limit:
+            return send(**kwargs)
+
+    def _write(self, method, send, url, kwargs):
+        """
+        Sends a write request and invalidates the cached responses it may
+        have changed
+        """
+        try:
+            return self._send(method, send, kwargs)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(url)
 
     def _get(self, *args, **kwargs):
         """
-        A wrapper for getting things
+        A wrapper for getting things. Pass ``stream=True`` to get a generator
+        which decodes the elements of a JSON array one by one while the
+        response is downloaded
 
         :returns: The response of your get
         :rtype: dict
         """
-        response = requests.get(*args, **kwargs)
-
+        validated = self._validate(
+            args[0] if args else kwargs['url'], kwargs
+        )
+        stream = kwargs.get('stream', False)
+        response = self.session.get(*args, **kwargs)
+        self._observe(response, stream)
         response.raise_for_status()
 
-        return response.json()
+        if stream:
+            return self._stream_items(response, current_event.get())
+        return self._decode_get(response, validated)
+
+    def _validate(self, url, kwargs):
+        """
+        Turns the request into a conditional one if the validators of the
+        previous response are known
+
+        :returns: The key of the response in the validators store and the
+            entry whose validators are sent
+        :rtype: tuple
+        """
+        if self.conditional is None or kwargs.get('stream'):
+            return None
+        key = self.conditional.key(url, kwargs.get('params'))
+        entry = self.conditional.entry(key)
+        if entry is not None:
+            kwargs['headers'] = self.conditional.headers(
+                key, kwargs.get('headers'), entry
+            )
+        return key, entry
+
+    def _decode_get(self, response, validated):
+        """
+        Decodes the response of a GET, unless it did not change since the
+        previous one
+        """
+        if validated is None:
+            return self._decode(response)
+        key, entry = validated
+        return self.conditional.resolve(key, response, self._decode, entry)
+
+    def _stream_items(self, response, event=None):
+        """
+        Yields the elements of the JSON array in the response body and
+        releases the connection afterwards
+
+        :param event: The event of the request, counts the body size
+        :type event: rabbitmq_admin.instrumentation.RequestEvent
+        """
+        with response:
+            chunks = response.iter_content(self.stream_chunk_size)
+            if event is not None:
+                chunks = event.read(chunks)
+            yield from iter_json_array(chunks)
 
     def _api_put(self, url, **kwargs):
         """
         A convenience wrapper for _put. Adds headers, auth and base url by
         default
         """
-        kwargs['url'] = self.url + url
-        kwargs['auth'] = self.auth
-
-        headers = deepcopy(self.headers)
-        headers.update(kwargs.get('headers', {}))
-        kwargs['headers'] = headers
-        kwargs['timeout'] = self.timeout
-        kwargs['verify'] = self.verify
-        self._put(**kwargs)
+        self._prepare(url, kwargs)
+        return self._write('PUT', self._put, url, kwargs)
 
     def _put(self, *args, **kwargs):
         """
@@ -102,8 +495,9 @@ class Resource(object):
         :rtype: dict
         """
         if 'data' in kwargs:
-            kwargs['data'] = json.dumps(kwargs['data'])
-        response = requests.put(*args, **kwargs)
+            kwargs['data'] = self._encode(kwargs['data'])
+        response = self.session.put(*args, **kwargs)
+        self._observe(response)
         response.raise_for_status()
 
     def _api_post(self, url, **kwargs):
@@ -111,15 +505,8 @@ class Resource(object):
         A convenience wrapper for _post. Adds headers, auth and base url by
         default
         """
-        kwargs['url'] = self.url + url
-        kwargs['auth'] = self.auth
-
-        headers = deepcopy(self.headers)
-        headers.update(kwargs.get('headers', {}))
-        kwargs['headers'] = headers
-        kwargs['timeout'] = self.timeout
-        kwargs['verify'] = self.verify
-        return self._post(**kwargs)
+        self._prepare(url, kwargs)
+        return self._write('POST', self._post, url, kwargs)
 
     def _post(self, *args, **kwargs):
         """
@@ -130,25 +517,19 @@ class Resource(object):
         :rtype: dict
         """
         if 'data' in kwargs:
-            kwargs['data'] = json.dumps(kwargs['data'])
-        response = requests.post(*args, **kwargs)
+            kwargs['data'] = self._encode(kwargs['data'])
+        response = self.session.post(*args, **kwargs)
+        self._observe(response)
         response.raise_for_status()
-        return response.json() if response.content else None
+        return self._decode(response) if response.content else None
 
     def _api_delete(self, url, **kwargs):
         """
         A convenience wrapper for _delete. Adds headers, auth and base url by
         default
         """
-        kwargs['url'] = self.url + url
-        kwargs['auth'] = self.auth
-
-        headers = deepcopy(self.headers)
-        headers.update(kwargs.get('headers', {}))
-        kwargs['headers'] = headers
-        kwargs['timeout'] = self.timeout
-        kwargs['verify'] = self.verify
-        self._delete(**kwargs)
+        self._prepare(url, kwargs)
+        return self._write('DELETE', self._delete, url, kwargs)
 
     def _delete(self, *args, **kwargs):
         """
@@ -157,5 +538,6 @@ class Resource(object):
         :returns: The response of your delete
         :rtype: dict
         """
-        response = requests.delete(*args, **kwargs)
+        response = self.session.delete(*args, **kwargs)
+        self._observe(response)
         response.raise_for_status()
@@ -0,0 +1,74 @@
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BulkResult(namedtuple('BulkResult', ['item', 'result', 'error'])):
+    """
+    The outcome of one call of a bulk operation
+
+    :param item: The arguments the call was made with
+    :param result: The return value of the call, ``None`` on error
+    :param error: The exception raised by the call, ``None`` on success
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def split_item(item):
+    """
+    Turns a bulk item into call arguments: a dict is passed as keyword
+    arguments, a tuple or list as positional ones and anything else as the
+    only argument.
+
+    :returns: args and kwargs
+    :rtype: tuple
+    """
+    if isinstance(item, dict):
+        return (), item
+    if isinstance(item, (tuple, list)):
+        return tuple(item), {}
+    return (item,), {}
+
+
+def call_item(func, item):
+    """
+    Calls ``func`` with the item and wraps the outcome in a
+    :class:`BulkResult` instead of raising
+    """
+    args, kwargs = split_item(item)
+    try:
+        return BulkResult(item, func(*args, **kwargs), None)
+    except Exception as error:
+        return BulkResult(item, None, error)
+
+
+def iter_bulk(func, items, concurrency=32):
+    """
+    Calls ``func`` for every item on a pool of ``concurrency`` threads and
+    yields the results in the order of the items. At most
+    ``2 * concurrency`` items are in flight, so ``items`` may be a lazy
+    iterable of any length.
+
+    :param func: The function to call
+    :type func: callable
+
+    :param items: The arguments of each call, see :func:`split_item`
+    :type items: iterable
+
+    :param concurrency: The number of threads
+    :type concurrency: int
+
+    :rtype: iterator of BulkResult
+    """
+    window = deque()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for item in items:
+            window.append(executor.submit(call_item, func, item))
+            if len(window) >= 2 * concurrency:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
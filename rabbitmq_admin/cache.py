@@ -0,0 +1,304 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from fnmatch import fnmatchcase
+from threading import Lock
+from urllib.parse import urlencode
+
+#: Collections whose cached responses change together. A write to any of
+#: them invalidates all of them
+RELATED = (
+    {'queues', 'exchanges', 'bindings', 'consumers'},
+    {'users', 'permissions', 'topic-permissions', 'whoami'},
+    {'policies', 'operator-policies'},
+    {'connections', 'channels', 'consumers'},
+)
+
+#: Collections invalidated by every write
+ALWAYS = {'overview', 'definitions'}
+
+#: Collections whose writes may change any other one and clear the cache
+CLEARS_ALL = {'vhosts', 'definitions'}
+
+
+def collection_of(path):
+    """
+    The collection name of an API path, e.g. ``queues`` for
+    ``/api/queues/%2F/name``
+    """
+    parts = path.partition('?')[0].split('/', 3)
+    return parts[2] if len(parts) > 2 else ''
+
+
+class ResponseCache(object):
+    """
+    An in-memory LRU cache of decoded GET responses with a TTL per path.
+    Concurrent identical requests are de-duplicated: one of them calls the
+    API, the others wait for its result.
+
+    Cached objects are shared between the callers, do not modify them.
+    ::
+
+        cache = ResponseCache(ttl=1, ttls={'/api/overview': 5,
+                                           '/api/queues*': 0})
+        api = RabbitAPIClient(host, port, auth, cache=cache)
+    """
+
+    def __init__(self, ttl=1.0, ttls=None, maxsize=256, clock=time.monotonic):
+        """
+        :param ttl: The default lifetime of a response in seconds
+        :type ttl: float
+
+        :param ttls: Lifetimes by path pattern, see :mod:`fnmatch`. The
+            first matching pattern wins, a lifetime of 0 disables caching
+        :type ttls: dict
+
+        :param maxsize: The maximum number of cached responses
+        :type maxsize: int
+        """
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._generation = 0
+        self._lock = Lock()
+
+    def ttl_for(self, path):
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+    def key(self, path, params=None):
+        query = urlencode(sorted((params or {}).items()))
+        return '{0}?{1}'.format(path, query)
+
+    def get_or_fetch(self, path, params, fetch):
+        """
+        Returns the cached response or calls ``fetch`` to get it
+
+        :param path: The API path
+        :type path: str
+
+        :param params: The query parameters
+        :type params: dict
+
+        :param fetch: Requests the response
+        :type fetch: callable
+        """
+        key = self.key(path, params)
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = Future()
+        if pending is not None:
+            return pending.result()
+        return self._fill(path, key, fetch)
+
+    async def aget_or_fetch(self, path, params, fetch):
+        """
+        Same as :meth:`get_or_fetch` for an asyncio client, ``fetch``
+        returns an awaitable
+        """
+        key = self.key(path, params)
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = Future()
+        if pending is not None:
+            return await asyncio.wrap_future(pending)
+        return await self._afill(path, key, fetch)
+
+    def invalidate(self, path):
+        """
+        Drops the cached responses a write to ``path`` may have changed
+        """
+        collection = collection_of(path)
+        related = ALWAYS.union(*(
+            group for group in RELATED if collection in group
+        ), {collection})
+        with self._lock:
+            self._generation += 1
+            if collection in CLEARS_ALL:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if collection_of(key) in related:
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self.clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+        self.misses += 1
+        return False, None
+
+    def _fill(self, path, key, fetch):
+        generation = self._generation
+        try:
+            value = fetch()
+        except BaseException as error:
+            self._resolve(key, error=error)
+            raise
+        self._store(path, key, value, generation)
+        self._resolve(key, value=value)
+        return value
+
+    async def _afill(self, path, key, fetch):
+        generation = self._generation
+        try:
+            value = await fetch()
+        except BaseException as error:
+            self._resolve(key, error=error)
+            raise
+        self._store(path, key, value, generation)
+        self._resolve(key, value=value)
+        return value
+
+    def _store(self, path, key, value, generation):
+        ttl = self.ttl_for(path)
+        with self._lock:
+            # a write during the request may have changed the response
+            if ttl <= 0 or generation != self._generation:
+                return
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _resolve(self, key, value=None, error=None):
+        with self._lock:
+            pending = self._pending.pop(key)
+        if error is not None:
+            pending.set_exception(error)
+        else:
+            pending.set_result(value)
+
+
+class ValidatorCache(object):
+    """
+    Remembers the last decoded response of every URL together with its
+    validators: the ``ETag`` and ``Last-Modified`` headers and a hash of
+    the body. The next request for the URL is sent as a conditional one and
+    on ``304 Not Modified``, or when the body hash did not change, the
+    remembered object is returned without decoding the body again.
+
+    Returned objects are shared between the callers, do not modify them.
+    """
+
+    def __init__(self, maxsize=256):
+        """
+        :param maxsize: The maximum number of remembered URLs
+        :type maxsize: int
+        """
+        self.maxsize = maxsize
+        #: Responses answered with 304 Not Modified
+        self.not_modified = 0
+        #: Responses with the same body as the remembered one
+        self.unchanged = 0
+        #: Responses which had to be decoded
+        self.misses = 0
+        #: The size of the bodies which were not decoded
+        self.saved_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def hits(self):
+        return self.not_modified + self.unchanged
+
+    def key(self, url, params=None):
+        query = urlencode(sorted((params or {}).items()))
+        return '{0}?{1}'.format(url, query)
+
+    def entry(self, key):
+        """
+        :returns: The remembered response of the key, ``None`` if unknown.
+            Pass it to :meth:`headers` and :meth:`resolve`, so a
+            ``304 Not Modified`` still resolves when the entry is evicted
+            in between
+        :rtype: dict
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def headers(self, key, headers=None, entry=None):
+        """
+        Adds the validators of the remembered response to the headers
+
+        :param entry: The entry of the key, see :meth:`entry`, looked up
+            by default
+        """
+        headers = dict(headers or {})
+        if entry is None:
+            entry = self.entry(key)
+        if entry is not None and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry is not None and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def resolve(self, key, response, decode, entry=None):
+        """
+        Returns the remembered object if the response did not change,
+        otherwise decodes the response and remembers it
+
+        :param response: A requests or httpx response
+        :param decode: Decodes the response
+        :type decode: callable
+
+        :param entry: The entry whose validators were sent, see
+            :meth:`entry`, looked up by default
+        :type entry: dict
+        """
+        if entry is None:
+            entry = self.entry(key)
+        if entry is not None and response.status_code == 304:
+            return self._hit(key, entry, 'not_modified', entry['size'])
+
+        body = response.content
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if entry is not None and entry['digest'] == digest:
+            return self._hit(key, entry, 'unchanged', len(body))
+
+        value = decode(response)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'digest': digest,
+                'size': len(body),
+                'value': value,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def _hit(self, key, entry, counter, size):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            self.saved_bytes += size
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return entry['value']
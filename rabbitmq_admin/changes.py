@@ -0,0 +1,186 @@
+"""
+A change feed of the queues, connections, channels or exchanges. Every
+poll streams the list with only the compared columns and reports the
+objects added, removed or changed since the previous poll:
+::
+
+    feed = ChangeFeed(api, 'queues', fields=('messages', 'consumers'))
+    for change in feed.changes(interval=10):
+        print(change.kind, change.key, change.previous)
+"""
+import asyncio
+import time
+from collections import namedtuple
+
+from rabbitmq_admin.reconcile import digest
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+
+class Change(namedtuple('Change', ['kind', 'key', 'item', 'previous'])):
+    """
+    An added, removed or changed object
+
+    :param key: The values of the key fields, e.g. ``(vhost, name)``
+    :param item: The object as returned by the API, ``None`` when removed
+    :param previous: The compared fields of the previous poll, ``None``
+        when added
+    """
+
+    __slots__ = ()
+
+
+def _value(item, field):
+    """
+    Returns the value of a field, nested ones are separated by dots
+    """
+    for name in field.split('.'):
+        if not isinstance(item, dict):
+            return None
+        item = item.get(name)
+    return item
+
+
+def _fingerprint(values):
+    try:
+        return hash(values)
+    except TypeError:
+        # nested dicts or lists, e.g. arguments
+        return digest(values)
+
+
+class ChangeFeed(object):
+    """
+    Compares every poll with an index of the previous one which keeps only
+    a hash and the compared fields per object, not the objects.
+
+    :param api: The client, an asyncio one for :meth:`apoll`
+    :param collection: The name of the ``stream_*`` method, e.g. ``queues``
+    :type collection: str
+
+    :param fields: The compared fields, nested ones are separated by dots
+    :type fields: tuple of str
+
+    :param key: The fields identifying an object
+    :type key: tuple of str
+
+    :param initial: Whether the first poll reports every object as added
+    :type initial: bool
+
+    The other keyword arguments are passed to the ``stream_*`` method,
+    e.g. ``vhost``
+    """
+
+    def __init__(self, api, collection='queues',
+                 fields=('messages', 'consumers', 'state'),
+                 key=('vhost', 'name'), initial=False, **query):
+        self.api = api
+        self.collection = collection
+        self.fields = tuple(fields)
+        self.key = tuple(key)
+        self.initial = initial
+        self.query = query
+        self.index = None
+        self._running = False
+
+    def _stream(self):
+        columns = list(self.key) + [
+            field for field in self.fields if field not in self.key
+        ]
+        return getattr(self.api, 'stream_' + self.collection)(
+            columns=columns, **self.query
+        )
+
+    def poll(self):
+        """
+        Requests the objects once
+
+        :returns: The changes since the previous poll
+        :rtype: list of Change
+        """
+        index = {}
+        changes = [self._compare(item, index) for item in self._stream()]
+        return self._finish(changes, index)
+
+    async def apoll(self):
+        """
+        Requests the objects once with an asyncio client, see :meth:`poll`
+        """
+        index = {}
+        changes = [
+            self._compare(item, index) async for item in self._stream()
+        ]
+        return self._finish(changes, index)
+
+    def _compare(self, item, index):
+        key = tuple(item.get(field) for field in self.key)
+        values = tuple(_value(item, field) for field in self.fields)
+        entry = index[key] = (_fingerprint(values), values)
+        if self.index is None:
+            return Change(ADDED, key, item, None) if self.initial else None
+        previous = self.index.get(key)
+        if previous is None:
+            return Change(ADDED, key, item, None)
+        if previous[0] != entry[0]:
+            return Change(CHANGED, key, item, self._fields(previous[1]))
+        return None
+
+    def _fields(self, values):
+        return dict(zip(self.fields, values))
+
+    def _finish(self, changes, index):
+        changes = [change for change in changes if change is not None]
+        changes.extend(
+            Change(REMOVED, key, None, self._fields(entry[1]))
+            for key, entry in (self.index or {}).items()
+            if key not in index
+        )
+        self.index = index
+        return changes
+
+    def changes(self, interval=10):
+        """
+        Polls until :meth:`stop` is called and yields the changes
+
+        :param interval: The seconds between the starts of the polls
+        :type interval: float
+        """
+        self._running = True
+        while True:
+            started = time.monotonic()
+            yield from self.poll()
+            if not self._running:
+                return
+            time.sleep(max(0, interval - (time.monotonic() - started)))
+
+    async def achanges(self, interval=10):
+        """
+        Polls with an asyncio client until :meth:`stop` is called, see
+        :meth:`changes`
+        """
+        self._running = True
+        while True:
+            started = time.monotonic()
+            for change in await self.apoll():
+                yield change
+            if not self._running:
+                return
+            await asyncio.sleep(
+                max(0, interval - (time.monotonic() - started))
+            )
+
+    def run(self, callback, interval=10):
+        """
+        Polls until :meth:`stop` is called and calls ``callback`` with
+        every change
+        """
+        for change in self.changes(interval):
+            callback(change)
+
+    def stop(self):
+        """
+        Stops the polling after the current poll
+        """
+        self._running = False
@@ -0,0 +1,315 @@
+"""
+Clients which spread their requests over the management endpoints of all
+the nodes of a cluster. Reads are balanced and retried on another node,
+failing nodes are skipped for an exponentially growing time.
+"""
+import itertools
+import time
+from threading import Lock
+from urllib.parse import urlsplit
+
+import requests
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.async_base import httpx
+
+
+class Endpoint(object):
+    """
+    The management endpoint of one node and its health
+    """
+
+    def __init__(self, url):
+        self.url = url
+        #: The number of consecutive failures
+        self.failures = 0
+        #: The time before which the endpoint is not used
+        self.retry_at = 0.0
+        #: The moving average of the response time in seconds
+        self.latency = 0.0
+
+    def __repr__(self):
+        return '<Endpoint {0}>'.format(self.url)
+
+
+class NodePool(object):
+    """
+    Chooses the endpoint of each request
+
+    :param urls: The base URLs of the endpoints
+    :type urls: list of str
+
+    :param strategy: How reads are spread, ``'round_robin'`` or
+        ``'least_latency'``
+    :type strategy: str
+
+    :param backoff: The time in seconds a failed endpoint is skipped,
+        doubled on every consecutive failure
+    :type backoff: float
+
+    :param max_backoff: The longest time a failed endpoint is skipped
+    :type max_backoff: float
+    """
+
+    #: The weight of the last response time in the latency average
+    smoothing = 0.3
+
+    def __init__(self, urls, strategy='round_robin', backoff=1.0,
+                 max_backoff=30.0, clock=time.monotonic):
+        strategies = {
+            'round_robin': self._round_robin,
+            'least_latency': self._least_latency,
+        }
+        if strategy not in strategies:
+            raise ValueError('Unknown strategy: {0}'.format(strategy))
+        self._choose = strategies[strategy]
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.endpoints = []
+        self._counter = itertools.count()
+        self._lock = Lock()
+        self.add(urls)
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    def add(self, urls):
+        """
+        Adds the endpoints which are not in the pool yet
+        """
+        with self._lock:
+            known = {endpoint.url for endpoint in self.endpoints}
+            self.endpoints.extend(
+                Endpoint(url) for url in dict.fromkeys(urls)
+                if url not in known
+            )
+
+    def pick(self, pinned=False, exclude=()):
+        """
+        Returns a healthy endpoint which is not excluded. When every
+        endpoint failed, the one which may be retried first is returned
+
+        :param pinned: Set to ``True`` to get the first healthy endpoint,
+            so the requests go to the same node as long as it is healthy
+        :type pinned: bool
+        """
+        with self._lock:
+            candidates = [
+                endpoint for endpoint in self.endpoints
+                if endpoint not in exclude
+            ] or self.endpoints
+            now = self.clock()
+            healthy = [
+                endpoint for endpoint in candidates
+                if endpoint.retry_at <= now
+            ]
+            if not healthy:
+                return min(candidates, key=lambda endpoint: endpoint.retry_at)
+            return healthy[0] if pinned else self._choose(healthy)
+
+    def succeeded(self, endpoint, latency):
+        with self._lock:
+            endpoint.failures = 0
+            endpoint.retry_at = 0.0
+            endpoint.latency += self.smoothing * (latency - endpoint.latency)
+
+    def failed(self, endpoint):
+        """
+        Ejects the endpoint until its backoff is over
+        """
+        with self._lock:
+            endpoint.failures += 1
+            endpoint.retry_at = self.clock() + min(
+                self.max_backoff, self.backoff * 2 ** (endpoint.failures - 1)
+            )
+
+    def _round_robin(self, healthy):
+        return healthy[next(self._counter) % len(healthy)]
+
+    def _least_latency(self, healthy):
+        return min(healthy, key=lambda endpoint: endpoint.latency)
+
+
+class ClusterRabbitAPIClient(RabbitAPIClient):
+    """
+    A :class:`RabbitAPIClient` for all the nodes of a cluster. GET requests
+    are spread over the healthy nodes and retried on another node when a
+    node can not be reached or answers with a server error. Writes are not
+    retried, since they may have been applied.
+    ::
+
+        api = ClusterRabbitAPIClient(
+            ['rabbit-1:15672', 'rabbit-2:15672', ('rabbit-3', 15672)],
+            auth=('guest', 'guest'),
+            strategy='least_latency',
+            pin_writes=True,
+        )
+    """
+
+    def __init__(self, endpoints, auth, scheme='http', port=15672,
+                 strategy='round_robin', pin_writes=False, backoff=1.0,
+                 max_backoff=30.0, **kwargs):
+        """
+        :param endpoints: The management endpoints as ``'host:port'``,
+            ``'host'`` or ``(host, port)``
+        :type endpoints: list
+
+        :param port: The port of the endpoints without one
+        :type port: int
+
+        :param strategy: How reads are spread, ``'round_robin'`` or
+            ``'least_latency'``
+        :type strategy: str
+
+        :param pin_writes: Set to ``True`` to send all writes to the first
+            healthy endpoint
+        :type pin_writes: bool
+
+        :param backoff: The time in seconds a failed node is skipped,
+            doubled on every consecutive failure up to ``max_backoff``
+        :type backoff: float
+
+        The other arguments are the ones of :class:`RabbitAPIClient`
+        """
+        self.scheme = scheme
+        self.port = port
+        self.pin_writes = pin_writes
+        urls = [self._endpoint_url(endpoint) for endpoint in endpoints]
+        if not urls:
+            raise ValueError('At least one endpoint is required')
+        super().__init__(None, None, auth, scheme=scheme, **kwargs)
+        self.url = urls[0]
+        self.nodes = NodePool(urls, strategy, backoff, max_backoff)
+
+    def _endpoint_url(self, endpoint):
+        if isinstance(endpoint, str):
+            host, _, port = endpoint.partition(':')
+        else:
+            host, port = endpoint
+        return '{0}://{1}:{2}'.format(self.scheme, host, port or self.port)
+
+    def discover_nodes(self, port=None):
+        """
+        Adds the endpoints of the running nodes of the cluster, assuming
+        the management plugin listens on ``port`` on every node host
+        """
+        self.nodes.add(self._discovered(
+            self.list_nodes(columns=['name', 'running']), port
+        ))
+
+    def _discovered(self, nodes, port):
+        return [
+            self._endpoint_url((node['name'].partition('@')[2], port))
+            for node in nodes
+            if node.get('running', True)
+        ]
+
+    def _prepare(self, url, kwargs):
+        """
+        Leaves the URL relative, the node is chosen when sending
+        """
+        super()._prepare(url, kwargs)
+        kwargs['url'] = url
+        return kwargs
+
+    def _validate(self, url, kwargs):
+        """
+        Keys the validators on the path like the cached responses, so the
+        nodes share one entry per response
+        """
+        return super()._validate(urlsplit(url).path, kwargs)
+
+    def _get(self, *args, **kwargs):
+        return self._on_nodes(super()._get, kwargs, retry=True)
+
+    def _put(self, *args, **kwargs):
+        return self._on_nodes(super()._put, kwargs, pinned=self.pin_writes)
+
+    def _post(self, *args, **kwargs):
+        return self._on_nodes(super()._post, kwargs, pinned=self.pin_writes)
+
+    def _delete(self, *args, **kwargs):
+        return self._on_nodes(super()._delete, kwargs, pinned=self.pin_writes)
+
+    def _on_nodes(self, send, kwargs, retry=False, pinned=False):
+        """
+        Sends the request to a node, on failure to the next one if
+        ``retry`` is set, until every node was tried
+        """
+        path = kwargs.pop('url')
+        tried = []
+        while True:
+            endpoint = self.nodes.pick(pinned, tried)
+            started = time.monotonic()
+            try:
+                result = send(url=endpoint.url + path, **kwargs)
+            except Exception as error:
+                tried.append(endpoint)
+                self._failed(endpoint, error, retry and len(tried) < len(
+                    self.nodes
+                ))
+                continue
+            self.nodes.succeeded(endpoint, time.monotonic() - started)
+            return result
+
+    def _failed(self, endpoint, error, retry):
+        """
+        Ejects the endpoint if the error is its fault and raises the error
+        unless the request can be retried
+        """
+        if not self._is_node_failure(error):
+            raise error
+        self.nodes.failed(endpoint)
+        if not retry:
+            raise error
+
+    def _is_node_failure(self, error):
+        if isinstance(error, requests.HTTPError):
+            return error.response.status_code >= 500
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+class AsyncClusterRabbitAPIClient(
+        ClusterRabbitAPIClient, AsyncRabbitAPIClient
+):
+    """
+    The asyncio version of :class:`ClusterRabbitAPIClient`. Streamed
+    responses are not retried on another node.
+    """
+
+    async def discover_nodes(self, port=None):
+        self.nodes.add(self._discovered(
+            await self.list_nodes(columns=['name', 'running']), port
+        ))
+
+    def _get(self, *args, **kwargs):
+        if not kwargs.get('stream'):
+            return super()._get(**kwargs)
+        path = kwargs.pop('url')
+        return AsyncRabbitAPIClient._get(
+            self, url=self.nodes.pick().url + path, **kwargs
+        )
+
+    async def _on_nodes(self, send, kwargs, retry=False, pinned=False):
+        path = kwargs.pop('url')
+        tried = []
+        while True:
+            endpoint = self.nodes.pick(pinned, tried)
+            started = time.monotonic()
+            try:
+                result = await send(url=endpoint.url + path, **kwargs)
+            except Exception as error:
+                tried.append(endpoint)
+                self._failed(endpoint, error, retry and len(tried) < len(
+                    self.nodes
+                ))
+                continue
+            self.nodes.succeeded(endpoint, time.monotonic() - started)
+            return result
+
+    def _is_node_failure(self, error):
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= 500
+        return isinstance(error, httpx.TransportError)
@@ -0,0 +1,110 @@
+import json
+from importlib import import_module
+
+
+class JSONCodec(object):
+    """
+    Encodes request bodies and decodes response bodies with the standard
+    library. Codecs work with bytes on both sides, so a faster backend can
+    skip the intermediate ``str`` copy.
+    """
+
+    name = 'json'
+
+    def dumps(self, data):
+        """
+        :returns: The encoded document
+        :rtype: bytes
+        """
+        return json.dumps(data, separators=(',', ':')).encode()
+
+    def loads(self, data):
+        """
+        :param data: The encoded document
+        :type data: bytes
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Uses `orjson <https://github.com/ijl/orjson>`_. Note that orjson only
+    encodes ``str`` dictionary keys and 64-bit integers.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        self._orjson = import_module('orjson')
+
+    def dumps(self, data):
+        return self._orjson.dumps(data)
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Uses `ujson <https://github.com/ultrajson/ultrajson>`_
+    """
+
+    name = 'ujson'
+
+    def __init__(self):
+        self._ujson = import_module('ujson')
+
+    def dumps(self, data):
+        return self._ujson.dumps(data, ensure_ascii=False).encode()
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+
+class SimdjsonCodec(JSONCodec):
+    """
+    Decodes with `pysimdjson <https://github.com/TkTech/pysimdjson>`_,
+    encodes with the standard library
+    """
+
+    name = 'simdjson'
+
+    def __init__(self):
+        self._simdjson = import_module('simdjson')
+
+    def loads(self, data):
+        return self._simdjson.loads(data)
+
+
+CODECS = {
+    codec.name: codec
+    for codec in (OrjsonCodec, UjsonCodec, SimdjsonCodec, JSONCodec)
+}
+
+
+def get_codec(codec=None):
+    """
+    Returns a codec instance. Without arguments the fastest installed
+    backend is used: orjson, ujson, simdjson and finally the standard
+    library.
+
+    :param codec: A codec name (``'orjson'``, ``'ujson'``, ``'simdjson'``,
+        ``'json'``), a codec instance or ``None``
+    :type codec: str or JSONCodec
+    """
+    if codec is None:
+        return _fastest_codec()
+    if isinstance(codec, str):
+        try:
+            return CODECS[codec]()
+        except KeyError:
+            raise ValueError('Unknown JSON codec: {0}'.format(codec))
+    return codec
+
+
+def _fastest_codec():
+    for codec_class in CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            continue
@@ -0,0 +1,82 @@
+from collections import defaultdict
+from threading import Lock
+
+#: Sections applied first and in this order, the vhost sections depend on
+#: them
+GLOBAL_SECTIONS = (
+    'vhosts',
+    'users',
+    'permissions',
+    'topic_permissions',
+    'global_parameters',
+)
+
+#: Sections applied per vhost and in this order, bindings need both their
+#: exchanges and queues
+VHOST_SECTIONS = (
+    'parameters',
+    'policies',
+    'exchanges',
+    'queues',
+    'bindings',
+)
+
+
+def _chunks(section, items, chunk_size):
+    for start in range(0, len(items), chunk_size):
+        yield {section: items[start:start + chunk_size]}
+
+
+def split_definitions(definitions, chunk_size=500):
+    """
+    Splits server definitions into partial definitions of at most
+    ``chunk_size`` objects of a single section, in dependency order.
+
+    :param definitions: The definitions, as returned by
+        :meth:`RabbitAPIClient.get_definitions`
+    :type definitions: dict
+
+    :returns: The global chunks, which have to be applied first and in
+        order, and the chunks of every vhost. The vhosts do not depend on
+        each other and can be applied in parallel
+    :rtype: tuple(list of dict, dict of str to list of dict)
+    """
+    head = [
+        chunk
+        for section in GLOBAL_SECTIONS
+        for chunk in _chunks(section, definitions.get(section, []), chunk_size)
+    ]
+
+    by_vhost = defaultdict(lambda: defaultdict(list))
+    for section in VHOST_SECTIONS:
+        for item in definitions.get(section, []):
+            by_vhost[item['vhost']][section].append(item)
+
+    vhosts = {
+        vhost: [
+            chunk
+            for section in VHOST_SECTIONS
+            for chunk in _chunks(section, sections[section], chunk_size)
+        ]
+        for vhost, sections in by_vhost.items()
+    }
+    return head, vhosts
+
+
+class DefinitionsProgress(object):
+    """
+    Counts the applied chunks and reports them to an optional callback,
+    which is called as ``callback(done, total, chunk)``
+    """
+
+    def __init__(self, head, vhosts, callback=None):
+        self.total = len(head) + sum(map(len, vhosts.values()))
+        self.done = 0
+        self.callback = callback
+        self._lock = Lock()
+
+    def advance(self, chunk):
+        with self._lock:
+            self.done += 1
+            if self.callback:
+                self.callback(self.done, self.total, chunk)
@@ -0,0 +1,355 @@
+"""
+Drains or backs up a queue with :meth:`RabbitAPIClient.extract_messages`
+in batches sized by the observed response times and payload sizes. The
+messages are written to a sink batch by batch. A checkpoint saved after
+every batch restores the counters and the batch size of an interrupted
+drain, not a position in the queue: the drained messages are already gone
+from it, so the drain goes on with the messages left:
+::
+
+    drain = Drain(api, 'dead-letters', '/',
+                  checkpoint=Checkpoint('dead-letters.checkpoint'))
+    stats = drain.run(JSONLinesSink('dead-letters.jsonl.gz'),
+                      on_batch=lambda stats: print(stats.rate))
+
+Note that the messages of a request are removed from the queue before they
+are written, a message is lost if the process dies in between.
+"""
+import gzip
+import json
+import os
+import time
+
+from rabbitmq_admin.codec import get_codec
+
+PEEK = 'ack_requeue_true'
+
+
+class BatchSizer(object):
+    """
+    Grows the batches while the responses are fast and small and shrinks
+    them when they are not, by at most a factor of 2 per batch
+
+    :param target: The wanted duration of a request in seconds
+    :type target: float
+
+    :param max_bytes: The wanted payload size of a batch
+    :type max_bytes: int
+    """
+
+    def __init__(self, initial=100, minimum=1, maximum=10000, target=1.0,
+                 max_bytes=16 * 2 ** 20):
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target = target
+        self.max_bytes = max_bytes
+
+    def update(self, count, seconds, size):
+        """
+        :param count: The number of messages of the batch
+        :param seconds: The duration of the request
+        :param size: The payload bytes of the batch
+        """
+        factor = 2.0
+        if seconds > 0:
+            factor = min(factor, self.target / seconds)
+        if size > 0:
+            factor = min(factor, self.max_bytes / size)
+        if count < self.size:
+            # the queue had fewer messages, the batch says nothing
+            factor = min(factor, 1.0)
+        self.size = int(min(
+            self.maximum, max(self.minimum, self.size * max(0.5, factor))
+        ))
+
+
+class DrainStats(object):
+    """
+    The progress of a drain
+    """
+
+    def __init__(self, messages=0, bytes=0, batches=0, elapsed=0.0):
+        self.messages = messages
+        self.bytes = bytes
+        self.batches = batches
+        #: The seconds spent in the requests and the sink
+        self.elapsed = elapsed
+
+    @property
+    def rate(self):
+        """
+        The messages per second
+        """
+        return self.messages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def byte_rate(self):
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self):
+        return {
+            'messages': self.messages,
+            'bytes': self.bytes,
+            'batches': self.batches,
+            'elapsed': self.elapsed,
+        }
+
+
+class Checkpoint(object):
+    """
+    Saves the counters and the batch size of a drain to a JSON file,
+    replaced atomically
+
+    :param path: The file path
+    :type path: str
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """
+        :returns: The saved state or ``None``
+        :rtype: dict
+        """
+        try:
+            with open(self.path) as checkpoint:
+                return json.load(checkpoint)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state):
+        temporary = self.path + '.tmp'
+        with open(temporary, 'w') as checkpoint:
+            json.dump(state, checkpoint)
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+        os.replace(temporary, self.path)
+
+
+class Sink(object):
+    """
+    A sink is any object with the ``write(message)``, ``flush()`` and
+    ``close()`` methods. This base class provides a ``flush`` which does
+    nothing, a ``close`` which flushes and the context manager, the
+    subclasses add ``write``
+    """
+
+    def flush(self):
+        """
+        Called after every batch
+        """
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class JSONLinesSink(Sink):
+    """
+    Appends the messages to a newline-delimited JSON file, compressed with
+    gzip if the path ends with ``.gz``
+
+    :param path: The file path
+    :type path: str
+
+    :param codec: The JSON codec, see :func:`rabbitmq_admin.codec.get_codec`
+    """
+
+    def __init__(self, path, codec=None, compress=None):
+        if compress is None:
+            compress = path.endswith('.gz')
+        self.codec = get_codec(codec)
+        self.file = gzip.open(path, 'ab') if compress else open(path, 'ab')
+
+    def write(self, message):
+        self.file.write(self.codec.dumps(message) + b'\n')
+
+    def flush(self):
+        self.file.flush()
+        if isinstance(self.file, gzip.GzipFile):
+            self.file.fileobj.flush()
+            os.fsync(self.file.fileobj.fileno())
+        else:
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+class CallbackSink(Sink):
+    """
+    Calls ``callback`` with every message
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def write(self, message):
+        self.callback(message)
+
+
+class Drain(object):
+    """
+    :param api: The client, an asyncio one for the ``a*`` methods
+    :param queue: The queue name
+    :type queue: str
+
+    :param vhost: The vhost name
+    :type vhost: str
+
+    :param limit: The maximum number of messages, by default all of them
+    :type limit: int
+
+    :param mode: The ``ackmode``. With ``ack_requeue_true`` the messages
+        stay at the head of the queue, so only one batch of ``limit``
+        messages can be peeked
+    :type mode: str
+
+    :param sizer: Sizes the batches
+    :type sizer: BatchSizer
+
+    :param checkpoint: Restores the counters and the batch size at the
+        start and saves them after every batch
+    :type checkpoint: Checkpoint
+
+    The ``encoding`` and ``truncate`` arguments are passed to
+    :meth:`RabbitAPIClient.extract_messages`.
+    """
+
+    def __init__(self, api, queue, vhost, limit=None,
+                 mode='ack_requeue_false', encoding='auto', truncate=None,
+                 sizer=None, checkpoint=None):
+        if mode == PEEK and limit is None:
+            raise ValueError('Peeking needs a limit')
+        self.api = api
+        self.queue = queue
+        self.vhost = vhost
+        self.limit = limit
+        self.mode = mode
+        self.encoding = encoding
+        self.truncate = truncate
+        self.sizer = sizer or BatchSizer()
+        self.checkpoint = checkpoint
+        self.stats = DrainStats()
+        state = checkpoint.load() if checkpoint else None
+        if state:
+            self.sizer.size = state.pop('batch_size', self.sizer.size)
+            self.stats = DrainStats(**state)
+        self._done = False
+
+    def _count(self):
+        """
+        :returns: The size of the next batch, ``0`` when done
+        """
+        if self._done:
+            return 0
+        if self.mode == PEEK:
+            # the requeued messages would be read again
+            self._done = True
+            return self.limit
+        if self.limit is None:
+            return self.sizer.size
+        return max(0, min(self.sizer.size, self.limit - self.stats.messages))
+
+    def _request(self, count):
+        return self.api.extract_messages(
+            self.queue,
+            self.vhost,
+            count,
+            mode=self.mode,
+            encoding=self.encoding,
+            truncate=self.truncate,
+        )
+
+    def _record(self, count, batch, started):
+        seconds = time.perf_counter() - started
+        size = sum(
+            message.get('payload_bytes') or len(message.get('payload', ''))
+            for message in batch
+        )
+        self.sizer.update(len(batch), seconds, size)
+        self.stats.messages += len(batch)
+        self.stats.bytes += size
+        self.stats.batches += 1
+        self.stats.elapsed += seconds
+        if len(batch) < count:
+            self._done = True
+
+    def batches(self):
+        """
+        Yields the batches of messages until the queue is empty or the
+        limit is reached
+        """
+        count = self._count()
+        while count:
+            started = time.perf_counter()
+            batch = self._request(count)
+            self._record(count, batch, started)
+            if batch:
+                yield batch
+            count = self._count()
+
+    async def abatches(self):
+        """
+        Yields the batches of messages with an asyncio client, see
+        :meth:`batches`
+        """
+        count = self._count()
+        while count:
+            started = time.perf_counter()
+            batch = await self._request(count)
+            self._record(count, batch, started)
+            if batch:
+                yield batch
+            count = self._count()
+
+    def messages(self):
+        """
+        Yields the messages one by one
+        """
+        for batch in self.batches():
+            yield from batch
+
+    def _write(self, sink, batch, on_batch):
+        started = time.perf_counter()
+        for message in batch:
+            sink.write(message)
+        sink.flush()
+        self.stats.elapsed += time.perf_counter() - started
+        if self.checkpoint:
+            self.checkpoint.save(
+                dict(self.stats.to_dict(), batch_size=self.sizer.size)
+            )
+        if on_batch:
+            on_batch(self.stats)
+
+    def run(self, sink, on_batch=None):
+        """
+        Writes all the messages to the sink
+
+        :param sink: Gets the messages, see :class:`Sink`
+
+        :param on_batch: Called with the :class:`DrainStats` after every
+            batch
+        :rtype: DrainStats
+        """
+        for batch in self.batches():
+            self._write(sink, batch, on_batch)
+        return self.stats
+
+    async def arun(self, sink, on_batch=None):
+        """
+        Writes all the messages to the sink with an asyncio client, see
+        :meth:`run`
+        """
+        async for batch in self.abatches():
+            self._write(sink, batch, on_batch)
+        return self.stats
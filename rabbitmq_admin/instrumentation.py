@@ -0,0 +1,296 @@
+"""
+Hooks called around every API request, with ready-made ones for
+Prometheus and OpenTelemetry. A hook implements any of the methods of
+:class:`Hook` and receives the :class:`RequestEvent` of the request:
+::
+
+    class SlowRequests(Hook):
+
+        def after_response(self, event):
+            if event.duration > 1:
+                log.warning('%s %s took %.1fs', event.method,
+                            event.template, event.duration)
+
+    api = RabbitAPIClient(host, port, auth, hooks=[SlowRequests()])
+"""
+import time
+from contextvars import ContextVar
+from importlib import import_module
+from urllib.parse import urlsplit
+
+#: The event of the request sent in the current thread or task
+current_event = ContextVar('rabbitmq_admin_event', default=None)
+
+#: The path templates of the API endpoints with path parameters
+ROUTES = (
+    '/api/aliveness-test/{vhost}',
+    '/api/bindings/{vhost}',
+    '/api/bindings/{vhost}/e/{exchange}/q/{queue}',
+    '/api/bindings/{vhost}/e/{exchange}/q/{queue}/{props}',
+    '/api/bindings/{vhost}/e/{source}/e/{destination}',
+    '/api/bindings/{vhost}/e/{source}/e/{destination}/{props}',
+    '/api/channels/{channel}',
+    '/api/connections/{connection}',
+    '/api/connections/{connection}/channels',
+    '/api/consumers/{vhost}',
+    '/api/definitions/{vhost}',
+    '/api/exchanges/{vhost}',
+    '/api/exchanges/{vhost}/{exchange}',
+    '/api/exchanges/{vhost}/{exchange}/bindings/destination',
+    '/api/exchanges/{vhost}/{exchange}/bindings/source',
+    '/api/exchanges/{vhost}/{exchange}/publish',
+    '/api/nodes/{node}',
+    '/api/permissions/{vhost}/{user}',
+    '/api/policies/{vhost}',
+    '/api/policies/{vhost}/{policy}',
+    '/api/queues/{vhost}',
+    '/api/queues/{vhost}/{queue}',
+    '/api/queues/{vhost}/{queue}/actions',
+    '/api/queues/{vhost}/{queue}/bindings',
+    '/api/queues/{vhost}/{queue}/contents',
+    '/api/queues/{vhost}/{queue}/get',
+    '/api/users/{user}',
+    '/api/users/{user}/permissions',
+    '/api/vhosts/{vhost}',
+)
+
+_ROUTE_PARTS = [route.split('/') for route in ROUTES]
+
+
+def path_template(path):
+    """
+    Returns the template of an API path, e.g. ``/api/queues/{vhost}/{queue}``
+    for ``/api/queues/%2F/name``. Paths without parameters are returned as
+    they are, unknown ones with every segment after the collection replaced
+    by ``{}``, so the number of distinct templates stays small
+    """
+    parts = urlsplit(path).path.rstrip('/').split('/')
+    for route in _ROUTE_PARTS:
+        if len(route) == len(parts) and all(
+            expected.startswith('{') or expected == part
+            for expected, part in zip(route, parts)
+        ):
+            return '/'.join(route)
+    return '/'.join(parts[:3] + ['{}'] * len(parts[3:]))
+
+
+class RequestEvent(object):
+    """
+    A request reported to the hooks. Hooks may keep their own state of the
+    request in :attr:`data`.
+
+    ``timings`` holds durations in seconds: ``total``, ``ttfb`` (until the
+    response headers were received), ``decode`` and for the asyncio client
+    ``connect`` and ``tls`` when a new connection was opened. The name
+    resolution is part of ``connect``.
+    """
+
+    def __init__(self, method, url, params=None):
+        self.method = method
+        self.url = url
+        self.path = urlsplit(url).path
+        self.template = path_template(self.path)
+        self.params = params
+        self.status = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        #: The number of retried attempts
+        self.retries = 0
+        self.error = None
+        self.timings = {}
+        self.data = {}
+        self._started = time.perf_counter()
+        self._marks = {}
+
+    @property
+    def duration(self):
+        return self.timings.get('total')
+
+    def observe(self, response, streamed=False):
+        """
+        Records the status and size of a response, the size of a streamed
+        one is counted by :meth:`read` while its body is read
+        """
+        self.status = response.status_code
+        if not streamed:
+            self.bytes_in = len(response.content)
+
+    def read(self, chunks):
+        """
+        Counts the size of the chunks of a streamed body while passing them
+        on
+        """
+        for chunk in chunks:
+            self.bytes_in += len(chunk)
+            yield chunk
+
+    async def aread(self, chunks):
+        """
+        Same as :meth:`read` for an asynchronous iterable
+        """
+        async for chunk in chunks:
+            self.bytes_in += len(chunk)
+            yield chunk
+
+    async def trace(self, name, info):
+        """
+        Records the connection events of httpx, see the ``trace`` request
+        extension
+        """
+        self._marks[name.partition('.')[2]] = time.perf_counter()
+
+    def finish(self, error=None):
+        self.timings['total'] = time.perf_counter() - self._started
+        self._span('connect', 'connect_tcp.started', 'connect_tcp.complete')
+        self._span('tls', 'start_tls.started', 'start_tls.complete')
+        self._span(
+            'ttfb',
+            'send_request_headers.started',
+            'receive_response_headers.complete',
+        )
+        if error is not None:
+            self.error = error
+            response = getattr(error, 'response', None)
+            self.status = getattr(response, 'status_code', self.status)
+
+    def _span(self, timing, start, end):
+        if start in self._marks and end in self._marks:
+            self.timings[timing] = self._marks[end] - self._marks[start]
+
+
+class Hook(object):
+    """
+    The base class of hooks, every method does nothing by default
+    """
+
+    def before_request(self, event):
+        """
+        Called before the first attempt of a request
+        """
+
+    def after_response(self, event):
+        """
+        Called after a successful request
+        """
+
+    def on_error(self, event):
+        """
+        Called when a request failed, the exception is ``event.error``
+        """
+
+
+class PrometheusHook(Hook):
+    """
+    Records the request durations, response sizes, retries and errors
+    with `prometheus_client <https://github.com/prometheus/client_python>`_,
+    labelled by method and path template. Install it with the
+    ``prometheus`` extra.
+    """
+
+    def __init__(self, registry=None, prefix='rabbitmq_admin', buckets=None):
+        """
+        :param registry: The collector registry, the default one if not
+            given
+        :param prefix: The prefix of the metric names
+        :type prefix: str
+
+        :param buckets: The buckets of the duration histogram in seconds
+        :type buckets: list of float
+        """
+        prometheus = import_module('prometheus_client')
+        options = {'registry': registry or prometheus.REGISTRY}
+        labels = ['method', 'path', 'status']
+        self.duration = prometheus.Histogram(
+            prefix + '_request_duration_seconds',
+            'Duration of the RabbitMQ management API requests',
+            labels,
+            buckets=buckets or prometheus.Histogram.DEFAULT_BUCKETS,
+            **options
+        )
+        self.response_size = prometheus.Histogram(
+            prefix + '_response_size_bytes',
+            'Size of the RabbitMQ management API responses',
+            labels,
+            buckets=[2 ** exponent for exponent in range(8, 30, 2)],
+            **options
+        )
+        self.retries = prometheus.Counter(
+            prefix + '_request_retries_total',
+            'Retried RabbitMQ management API requests',
+            ['method', 'path'],
+            **options
+        )
+        self.errors = prometheus.Counter(
+            prefix + '_request_errors_total',
+            'Failed RabbitMQ management API requests',
+            ['method', 'path', 'error'],
+            **options
+        )
+
+    def after_response(self, event):
+        labels = (event.method, event.template, str(event.status))
+        self.duration.labels(*labels).observe(event.duration)
+        self.response_size.labels(*labels).observe(event.bytes_in)
+        self._count_retries(event)
+
+    def on_error(self, event):
+        self.duration.labels(
+            event.method, event.template, str(event.status or 'error')
+        ).observe(event.duration)
+        self.errors.labels(
+            event.method, event.template, type(event.error).__name__
+        ).inc()
+        self._count_retries(event)
+
+    def _count_retries(self, event):
+        if event.retries:
+            self.retries.labels(event.method, event.template).inc(
+                event.retries
+            )
+
+
+class OpenTelemetryHook(Hook):
+    """
+    Records a client span per request with
+    `OpenTelemetry <https://opentelemetry.io/>`_. Install the API with the
+    ``opentelemetry`` extra.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        :param tracer: The tracer, by default the one of the global tracer
+            provider
+        """
+        self._trace = import_module('opentelemetry.trace')
+        self.tracer = tracer or self._trace.get_tracer('rabbitmq_admin')
+
+    def before_request(self, event):
+        event.data['span'] = self.tracer.start_span(
+            '{0} {1}'.format(event.method, event.template),
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                'http.request.method': event.method,
+                'http.route': event.template,
+                'url.full': event.url,
+            },
+        )
+
+    def after_response(self, event):
+        self._end(event)
+
+    def on_error(self, event):
+        span = event.data['span']
+        span.record_exception(event.error)
+        span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        self._end(event)
+
+    def _end(self, event):
+        span = event.data['span']
+        if event.status is not None:
+            span.set_attribute('http.response.status_code', event.status)
+        span.set_attribute('http.response.body.size', event.bytes_in)
+        span.set_attribute('http.request.body.size', event.bytes_out)
+        span.set_attribute('http.request.resend_count', event.retries)
+        for timing, seconds in event.timings.items():
+            span.set_attribute('rabbitmq_admin.' + timing, seconds)
+        span.end()
@@ -0,0 +1,40 @@
+"""
+Helpers for the messages returned by
+:meth:`RabbitAPIClient.extract_messages`
+"""
+from binascii import a2b_base64
+
+
+def decode_payloads(messages, buffer=None):
+    """
+    Replaces the payloads of the messages with their bytes. Base64 payloads
+    are decoded in one pass straight from the decoded JSON strings, which
+    are released message by message.
+
+    :param messages: The messages, changed in place
+    :type messages: list of dict
+
+    :param buffer: A writable buffer the payloads are decoded into one
+        after another, the payloads are then ``memoryview`` slices of it.
+        ``limit * truncate`` bytes are always enough.
+    :type buffer: bytearray
+
+    :returns: The messages
+    :rtype: list of dict
+    """
+    view = memoryview(buffer).cast('B') if buffer is not None else None
+    offset = 0
+    for message in messages:
+        payload = message['payload']
+        if message.get('payload_encoding') == 'base64':
+            payload = a2b_base64(payload)
+        else:
+            payload = payload.encode()
+        if view is not None:
+            end = offset + len(payload)
+            if end > len(view):
+                raise ValueError('The buffer is too small for the payloads')
+            view[offset:end] = payload
+            payload, offset = view[offset:end], end
+        message['payload'] = payload
+    return messages
@@ -0,0 +1,254 @@
+"""
+Compact objects for the API results. The frequently used scalar fields
+are kept in ``__slots__``, all the other fields, mostly nested statistics,
+are kept encoded and decoded on every access, the decoded values are not
+kept. A queue takes a fraction of the memory of its dict, which matters
+for long-lived snapshots.
+::
+
+    queues = api.list_queues(raw=False)
+    deepest = max(queues, key=lambda queue: queue.messages)
+    deepest.message_stats.publish_details.rate
+"""
+from sys import intern
+
+from rabbitmq_admin.codec import get_codec
+
+_codec = None
+
+
+def _get_codec():
+    global _codec
+    if _codec is None:
+        _codec = get_codec()
+    return _codec
+
+
+class Stats(dict):
+    """
+    A nested object of a model, its keys are also attributes
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            value = self[name]
+        except KeyError:
+            raise AttributeError(name)
+        return Stats(value) if isinstance(value, dict) else value
+
+
+class Model(object):
+    """
+    The base class of the models. The subclasses list their fields in
+    ``__slots__``, the fields missing from the response are ``None``.
+    Models are hashed on their ``IDENTITY`` fields, so they can be kept in
+    sets and used as dict keys
+    """
+
+    __slots__ = ('_extra',)
+
+    #: The fields which identify an object on the server
+    IDENTITY = ('vhost', 'name')
+
+    def __init__(self, data):
+        fields = type(self).__slots__
+        extra = {}
+        for key, value in data.items():
+            if key in fields:
+                # names, vhosts and nodes repeat across the objects
+                if isinstance(value, str):
+                    value = intern(value)
+                setattr(self, key, value)
+            else:
+                extra[key] = value
+        self._extra = _get_codec().dumps(extra) if extra else None
+
+    @classmethod
+    def parse(cls, result):
+        """
+        Turns a decoded response into models: a list, a page of a list, an
+        iterator of objects or a single object
+        """
+        if isinstance(result, dict) and 'items' in result:
+            return dict(result, items=[cls(item) for item in result['items']])
+        if isinstance(result, dict):
+            return cls(result)
+        if isinstance(result, list):
+            return [cls(item) for item in result]
+        return (cls(item) for item in result)
+
+    def __getattr__(self, name):
+        # only called for unset slots and the encoded fields
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name in type(self).__slots__:
+            return None
+        extra = self.extra
+        if name not in extra:
+            raise AttributeError(name)
+        value = extra[name]
+        return Stats(value) if isinstance(value, dict) else value
+
+    @property
+    def extra(self):
+        """
+        The fields which are not slots, decoded on every access. Keep the
+        result to read several of them at once
+        """
+        if self._extra is None:
+            return {}
+        return _get_codec().loads(self._extra)
+
+    def get(self, name, default=None):
+        value = getattr(self, name, None)
+        return default if value is None else value
+
+    def to_dict(self):
+        """
+        :returns: The object as returned by the API
+        :rtype: dict
+        """
+        data = {}
+        for field in type(self).__slots__:
+            try:
+                data[field] = object.__getattribute__(self, field)
+            except AttributeError:
+                continue
+        data.update(self.extra)
+        return data
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, field) for field in self.IDENTITY))
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __repr__(self):
+        return '<{0} {1!r}>'.format(
+            type(self).__name__, self.get('name', self.get('vhost'))
+        )
+
+
+class Queue(Model):
+
+    __slots__ = (
+        'name',
+        'vhost',
+        'node',
+        'type',
+        'state',
+        'durable',
+        'auto_delete',
+        'exclusive',
+        'policy',
+        'consumers',
+        'messages',
+        'messages_ready',
+        'messages_unacknowledged',
+        'message_bytes',
+        'memory',
+    )
+
+
+class Exchange(Model):
+
+    __slots__ = (
+        'name',
+        'vhost',
+        'type',
+        'durable',
+        'auto_delete',
+        'internal',
+        'policy',
+    )
+
+
+class Binding(Model):
+
+    __slots__ = (
+        'source',
+        'vhost',
+        'destination',
+        'destination_type',
+        'routing_key',
+        'properties_key',
+    )
+
+    IDENTITY = (
+        'vhost',
+        'source',
+        'destination',
+        'destination_type',
+        'routing_key',
+        'properties_key',
+    )
+
+    def __repr__(self):
+        return '<Binding {0!r} -> {1!r}>'.format(self.source, self.destination)
+
+
+class Connection(Model):
+
+    __slots__ = (
+        'name',
+        'vhost',
+        'user',
+        'node',
+        'state',
+        'protocol',
+        'channels',
+        'peer_host',
+        'peer_port',
+        'ssl',
+        'connected_at',
+        'recv_oct',
+        'send_oct',
+    )
+
+
+class Channel(Model):
+
+    __slots__ = (
+        'name',
+        'vhost',
+        'user',
+        'node',
+        'number',
+        'state',
+        'consumer_count',
+        'prefetch_count',
+        'messages_unacknowledged',
+        'messages_unconfirmed',
+    )
+
+
+class Node(Model):
+
+    __slots__ = (
+        'name',
+        'type',
+        'running',
+        'uptime',
+        'mem_used',
+        'mem_limit',
+        'fd_used',
+        'fd_total',
+        'sockets_used',
+        'sockets_total',
+        'proc_used',
+        'proc_total',
+        'disk_free',
+        'disk_free_limit',
+    )
+
+    IDENTITY = ('name',)
@@ -0,0 +1,239 @@
+"""
+A background poller sharing the responses of the monitoring endpoints
+between the components of a process, so they do not request the same
+statistics independently:
+::
+
+    poller = Poller(api, {'overview': 10, 'list_nodes': 30})
+    poller.add('list_queues', 60, columns=['name', 'vhost', 'messages'])
+    poller.subscribe(lambda sample: print(sample.name, sample.updated))
+    poller.start()
+
+    poller.snapshot['overview'].value
+"""
+import asyncio
+import heapq
+import logging
+import random
+import time
+from collections import namedtuple
+from threading import Event, Lock, Thread
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+
+class Sample(namedtuple('Sample', ['name', 'value', 'error', 'updated'])):
+    """
+    The latest response of an endpoint
+
+    :param value: The latest successful response, ``None`` before the first
+    :param error: The exception of the latest request if it failed
+    :param updated: The :func:`time.time` of the latest successful response
+    """
+
+    __slots__ = ()
+
+
+class _Endpoint(namedtuple('_Endpoint', ['method', 'interval', 'query'])):
+
+    __slots__ = ()
+
+
+class Poller(object):
+    """
+    Requests every endpoint in its interval from one thread or asyncio
+    task. The readers get the immutable :attr:`snapshot` without locking,
+    it is replaced as a whole after every response.
+
+    :param api: The client, an asyncio one for :meth:`astart`
+    :param endpoints: The intervals in seconds by client method name, e.g.
+        ``{'overview': 10}``
+    :type endpoints: dict
+
+    :param jitter: The share of the interval the polls are randomly moved
+        by, so the pollers of many processes do not synchronize
+    :type jitter: float
+    """
+
+    def __init__(self, api, endpoints=None, jitter=0.1):
+        self.api = api
+        self.jitter = jitter
+        self.endpoints = {}
+        #: The samples by endpoint name
+        self.snapshot = MappingProxyType({})
+        self._subscribers = ()
+        self._schedule = []
+        self._lock = Lock()
+        self._stopped = Event()
+        self._worker = None
+        for method, interval in (endpoints or {}).items():
+            self.add(method, interval)
+
+    def add(self, method, interval, name=None, **query):
+        """
+        Polls a client method
+
+        :param method: The method name, e.g. ``list_queues``
+        :type method: str
+
+        :param interval: The seconds between the polls
+        :type interval: float
+
+        :param name: The name of the sample, by default the method name
+        :type name: str
+
+        The other keyword arguments are passed to the method
+        """
+        name = name or method
+        with self._lock:
+            self.endpoints[name] = _Endpoint(method, interval, query)
+            # the first polls are spread too
+            self._plan(name, random.uniform(0, self.jitter * interval))
+
+    def subscribe(self, callback):
+        """
+        Calls ``callback`` with every new :class:`Sample` in the polling
+        thread or task, it should not block
+        """
+        with self._lock:
+            self._subscribers += (callback,)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = tuple(
+                subscriber for subscriber in self._subscribers
+                if subscriber != callback
+            )
+
+    def get(self, name):
+        """
+        :returns: The latest response of the endpoint or ``None``
+        """
+        sample = self.snapshot.get(name)
+        return sample.value if sample is not None else None
+
+    def _jittered(self, interval):
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _plan(self, name, delay):
+        """
+        Schedules the next poll of an endpoint, the caller holds the lock
+        """
+        self._schedule = [due for due in self._schedule if due[1] != name]
+        self._schedule.append((time.monotonic() + delay, name))
+        heapq.heapify(self._schedule)
+
+    def _next(self):
+        """
+        Schedules the poll after the next one
+
+        :returns: The seconds until the next poll and the endpoint name
+        """
+        with self._lock:
+            due, name = self._schedule[0]
+            delay = max(0, due - time.monotonic())
+            self._plan(
+                name, delay + self._jittered(self.endpoints[name].interval)
+            )
+        return delay, name
+
+    def _call(self, name):
+        endpoint = self.endpoints[name]
+        return getattr(self.api, endpoint.method)(**endpoint.query)
+
+    def _publish(self, name, value=None, error=None):
+        previous = self.snapshot.get(name)
+        if error is None:
+            sample = Sample(name, value, None, time.time())
+        else:
+            sample = previous._replace(error=error) if previous else Sample(
+                name, None, error, None
+            )
+        with self._lock:
+            snapshot = dict(self.snapshot)
+            snapshot[name] = sample
+            self.snapshot = MappingProxyType(snapshot)
+        for subscriber in self._subscribers:
+            try:
+                subscriber(sample)
+            except Exception:
+                logger.exception('A subscriber of %s failed', name)
+        return sample
+
+    def refresh(self, name):
+        """
+        Polls an endpoint now in the calling thread
+
+        :rtype: Sample
+        """
+        try:
+            value = self._call(name)
+        except Exception as error:
+            return self._publish(name, error=error)
+        return self._publish(name, value)
+
+    async def arefresh(self, name):
+        """
+        Polls an endpoint now with an asyncio client, see :meth:`refresh`
+        """
+        try:
+            value = await self._call(name)
+        except Exception as error:
+            return self._publish(name, error=error)
+        return self._publish(name, value)
+
+    def start(self):
+        """
+        Starts polling in a daemon thread
+        """
+        self._check()
+        self._stopped.clear()
+        self._worker = Thread(
+            target=self._run, name='rabbitmq-admin-poller', daemon=True
+        )
+        self._worker.start()
+        return self
+
+    def _check(self):
+        if not self.endpoints:
+            raise ValueError('No endpoints to poll')
+
+    def _run(self):
+        while not self._stopped.is_set():
+            delay, name = self._next()
+            if self._stopped.wait(delay):
+                return
+            self.refresh(name)
+
+    def astart(self):
+        """
+        Starts polling in an asyncio task of the running loop
+        """
+        self._check()
+        self._stopped.clear()
+        self._worker = asyncio.ensure_future(self._arun())
+        return self
+
+    async def _arun(self):
+        while not self._stopped.is_set():
+            delay, name = self._next()
+            await asyncio.sleep(delay)
+            await self.arefresh(name)
+
+    def stop(self):
+        """
+        Stops polling, a running request of a thread is completed first
+        """
+        self._stopped.set()
+        if isinstance(self._worker, asyncio.Future):
+            self._worker.cancel()
+        elif self._worker is not None:
+            self._worker.join()
+        self._worker = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,345 @@
+"""
+Converges a cluster to a desired set of definitions with the fewest
+requests: one :meth:`RabbitAPIClient.get_definitions` call, a diff over
+hashed indexes and only the creates, updates and deletes that are needed.
+"""
+import hashlib
+import json
+from collections import namedtuple
+from functools import partial
+
+
+class Section(namedtuple('Section', ['key', 'fields', 'mutable'])):
+    """
+    How the objects of a definitions section are compared
+
+    :param key: The fields identifying an object
+    :param fields: The compared fields with their server defaults
+    :param mutable: ``False`` if a changed object can only be recreated
+    """
+
+    __slots__ = ()
+
+    def index(self, items):
+        """
+        :returns: The objects by their key
+        :rtype: dict
+        """
+        return {self.key_of(item): item for item in items}
+
+    def key_of(self, item):
+        return tuple(
+            digest(item.get(field) or {}) if field == 'arguments'
+            else item[field]
+            for field in self.key
+        )
+
+    def changed(self, current, desired):
+        """
+        Compares only the fields the desired object sets, so omitted
+        optional fields do not cause updates
+        """
+        fields = [field for field in self.fields if field in desired]
+        return self.project(current, fields) != self.project(desired, fields)
+
+    def project(self, item, fields):
+        return digest({
+            field: normalize(field, item.get(field, self.fields[field]))
+            for field in fields
+        })
+
+
+#: The reconciled sections in the order they are created
+SECTIONS = {
+    'vhosts': Section(('name',), {}, True),
+    'users': Section(
+        ('name',), {'tags': '', 'password_hash': None}, True
+    ),
+    'permissions': Section(
+        ('user', 'vhost'),
+        {'configure': '.*', 'write': '.*', 'read': '.*'},
+        True,
+    ),
+    'policies': Section(
+        ('vhost', 'name'),
+        {'pattern': '', 'definition': {}, 'priority': 0, 'apply-to': 'all'},
+        True,
+    ),
+    'exchanges': Section(
+        ('vhost', 'name'),
+        {
+            'type': 'direct',
+            'durable': True,
+            'auto_delete': False,
+            'internal': False,
+            'arguments': {},
+        },
+        False,
+    ),
+    'queues': Section(
+        ('vhost', 'name'),
+        {'durable': True, 'auto_delete': False, 'arguments': {}},
+        False,
+    ),
+    'bindings': Section(
+        (
+            'vhost',
+            'source',
+            'destination_type',
+            'destination',
+            'routing_key',
+            'arguments',
+        ),
+        {},
+        False,
+    ),
+}
+
+
+def digest(value):
+    """
+    A stable hash of a JSON-compatible value
+    """
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def normalize(field, value):
+    """
+    Makes equivalent values equal, e.g. user tags are a comma separated
+    string before RabbitMQ 3.9 and a list afterwards
+    """
+    if field == 'tags' and isinstance(value, str):
+        value = [tag.strip() for tag in value.split(',')]
+    if field == 'tags':
+        value = sorted(tag for tag in value if tag)
+    return value
+
+
+class SectionDiff(namedtuple('SectionDiff', ['create', 'update', 'delete'])):
+    """
+    The objects to create, update and delete in one section. ``update``
+    holds the desired objects
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return bool(self.create or self.update or self.delete)
+
+
+class DefinitionsDiff(dict):
+    """
+    A :class:`SectionDiff` per section name
+    """
+
+    def __bool__(self):
+        return any(self.values())
+
+    def upserts(self, recreate=False):
+        """
+        The created and updated objects as partial definitions. Updated
+        queues, exchanges and bindings are only included with
+        ``recreate``, since they have to be deleted first
+        """
+        return {
+            name: changes.create + (
+                changes.update if recreate or SECTIONS[name].mutable else []
+            )
+            for name, changes in self.items()
+        }
+
+    def rebinds(self, desired):
+        """
+        The desired bindings of the conflicting queues and exchanges, which
+        are lost when these are recreated
+        """
+        recreated = {
+            (name, item['vhost'], item['name'])
+            for name, items in self.conflicts().items()
+            for item in items
+        }
+        section = SECTIONS['bindings']
+        created = section.index(
+            self['bindings'].create if 'bindings' in self else []
+        )
+        return [
+            binding for binding in desired.get('bindings', [])
+            if not recreated.isdisjoint(_binding_ends(binding))
+            if section.key_of(binding) not in created
+        ]
+
+    def conflicts(self):
+        """
+        The changed objects which can not be updated in place
+        """
+        return {
+            name: changes.update
+            for name, changes in self.items()
+            if changes.update and not SECTIONS[name].mutable
+        }
+
+
+def _binding_ends(binding):
+    """
+    The section, vhost and name of the source and destination of a binding
+    """
+    destination = 'queues' if binding['destination_type'] == 'queue' else (
+        'exchanges'
+    )
+    return (
+        ('exchanges', binding['vhost'], binding['source']),
+        (destination, binding['vhost'], binding['destination']),
+    )
+
+
+def diff_definitions(current, desired, sections=None):
+    """
+    Computes the changes which turn the current definitions into the
+    desired ones. Sections missing from ``desired`` are left alone.
+
+    :param current: The definitions of the server
+    :type current: dict
+
+    :param desired: The desired definitions, in the same format
+    :type desired: dict
+
+    :param sections: The section names to compare, all supported sections
+        present in ``desired`` by default
+    :type sections: list of str
+
+    :rtype: DefinitionsDiff
+    """
+    if sections is None:
+        sections = [name for name in SECTIONS if name in desired]
+
+    diff = DefinitionsDiff()
+    for name in sections:
+        section = SECTIONS[name]
+        have = section.index(current.get(name, []))
+        want = section.index(desired.get(name, []))
+        diff[name] = SectionDiff(
+            create=[item for key, item in want.items() if key not in have],
+            update=[
+                item for key, item in want.items()
+                if key in have and section.changed(have[key], item)
+            ],
+            delete=[item for key, item in have.items() if key not in want],
+        )
+    return diff
+
+
+def _delete_binding(client, **binding):
+    """
+    Deletes a binding. The properties key identifying it is looked up on
+    the server, since it depends on a hash of the binding arguments
+    """
+    if binding['destination_type'] == 'queue':
+        bindings = client.list_queue_bindings
+        delete = client.delete_queue_binding
+    else:
+        bindings = client.list_exchange_bindings
+        delete = client.delete_exchange_binding
+    ends = (binding['source'], binding['destination'], binding['vhost'])
+    section = SECTIONS['bindings']
+    for candidate in bindings(*ends):
+        if section.key_of(candidate) == section.key_of(binding):
+            delete(*ends, candidate['properties_key'])
+
+
+#: Deletes an object of a section given its fields as keyword arguments,
+#: in the order the sections are deleted
+DELETERS = {
+    'bindings': _delete_binding,
+    'queues': lambda client, name, vhost, **fields: (
+        client.delete_queue_for_vhost(name, vhost)
+    ),
+    'exchanges': lambda client, name, vhost, **fields: (
+        client.delete_exchange_for_vhost(name, vhost)
+    ),
+    'policies': lambda client, name, vhost, **fields: (
+        client.delete_policy_for_vhost(vhost, name)
+    ),
+    'permissions': lambda client, user, vhost, **fields: (
+        client.delete_user_permission(user, vhost)
+    ),
+    'users': lambda client, name, **fields: client.delete_user(name),
+    'vhosts': lambda client, name, **fields: client.delete_vhost(name),
+}
+
+
+def _delete(client, diff, items_of, concurrency):
+    results = []
+    for name, deleter in DELETERS.items():
+        if name in diff:
+            results.extend(client.bulk(
+                partial(deleter, client),
+                items_of(diff[name]),
+                concurrency,
+            ))
+    return results
+
+
+def reconcile(client, desired, prune=False, recreate=False, dry_run=False,
+              chunk_size=500, concurrency=1):
+    """
+    Converges the server to the desired definitions. Creates and updates
+    are uploaded with :meth:`RabbitAPIClient.apply_definitions_chunked`,
+    deletes are sent one by one. When nothing changed, the only request is
+    the :meth:`RabbitAPIClient.get_definitions` call.
+
+    Supported sections: vhosts, users, permissions, policies, exchanges,
+    queues and bindings. Users are compared by their tags and
+    ``password_hash``.
+
+    :param client: The client for the server
+    :type client: RabbitAPIClient
+
+    :param desired: The desired definitions
+    :type desired: dict
+
+    :param prune: Set to ``True`` to delete the objects of the compared
+        sections which are missing from ``desired``
+    :type prune: bool
+
+    :param recreate: Set to ``True`` to delete and recreate changed queues,
+        exchanges and bindings. Recreating a queue drops its messages!
+        Otherwise they are left as they are, see
+        :meth:`DefinitionsDiff.conflicts`
+    :type recreate: bool
+
+    :param dry_run: Set to ``True`` to only compute the diff
+    :type dry_run: bool
+
+    :param chunk_size: The maximum number of objects per upload
+    :type chunk_size: int
+
+    :param concurrency: The number of parallel requests
+    :type concurrency: int
+
+    :returns: The diff and a :class:`rabbitmq_admin.bulk.BulkResult` per
+        applied vhost and deleted object
+    :rtype: tuple(DefinitionsDiff, list)
+    """
+    diff = diff_definitions(client.get_definitions(), desired)
+    results = []
+    if dry_run or not diff:
+        return diff, results
+
+    upserts = diff.upserts(recreate)
+    if recreate:
+        results.extend(_delete(
+            client, diff.conflicts(), lambda items: items, concurrency
+        ))
+        upserts['bindings'] = upserts.get('bindings', []) + diff.rebinds(
+            desired
+        )
+    if any(upserts.values()):
+        results.extend(client.apply_definitions_chunked(
+            upserts, chunk_size, concurrency
+        ))
+    if prune:
+        results.extend(_delete(
+            client, diff, lambda changes: changes.delete, concurrency
+        ))
+    return diff, results
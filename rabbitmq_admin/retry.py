@@ -0,0 +1,173 @@
+"""
+Retries of failed requests. Transient errors are retried with decorrelated
+jitter backoff, a ``Retry-After`` header is respected and a shared token
+bucket limits the retries to a fraction of the requests, so an overloaded
+broker does not get a retry storm.
+"""
+import random
+import time
+from email.utils import parsedate_to_datetime
+from threading import Lock
+
+import requests
+
+from rabbitmq_admin.async_base import httpx
+
+#: Errors raised before a response was received
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout) + (
+    (httpx.TransportError,) if httpx is not None else ()
+)
+
+
+class RetryBudget(object):
+    """
+    A token bucket of retries. Every request adds ``ratio`` tokens up to
+    ``capacity`` and every retry takes one, so in the long run at most
+    ``ratio`` retries are made per request
+    """
+
+    def __init__(self, ratio=0.1, capacity=10.0):
+        """
+        :param ratio: The retries allowed per request
+        :type ratio: float
+
+        :param capacity: The maximum number of tokens, the number of
+            retries allowed in a burst
+        :type capacity: float
+        """
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+        self._lock = Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self):
+        """
+        Takes a token for a retry
+
+        :returns: ``False`` if the budget is exhausted
+        :rtype: bool
+        """
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RetryPolicy(object):
+    """
+    Decides which failed requests are retried and how long to wait. A
+    policy may be shared by several clients, they then share the budget.
+    ::
+
+        api = RabbitAPIClient(host, port, auth, retry=RetryPolicy(attempts=5))
+    """
+
+    def __init__(self, attempts=3, base=0.1, cap=10.0,
+                 methods=('GET', 'PUT', 'DELETE'),
+                 statuses=(429, 502, 503, 504), max_retry_after=60.0,
+                 budget=None):
+        """
+        :param attempts: The maximum number of attempts of a request
+        :type attempts: int
+
+        :param base: The shortest wait in seconds
+        :type base: float
+
+        :param cap: The longest wait in seconds
+        :type cap: float
+
+        :param methods: The retried HTTP methods. POST is not idempotent,
+            add it only if repeating your POST requests is safe
+        :type methods: tuple of str
+
+        :param statuses: The retried response statuses
+        :type statuses: tuple of int
+
+        :param max_retry_after: Requests are not retried when the server
+            asks to wait longer than this in ``Retry-After``
+        :type max_retry_after: float
+
+        :param budget: The budget, by default up to 10% retries
+        :type budget: RetryBudget
+        """
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+        self.methods = {method.upper() for method in methods}
+        self.statuses = set(statuses)
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        #: The number of retries made
+        self.retried = 0
+        #: The number of retries refused by the budget
+        self.rejected = 0
+
+    def retries(self, method):
+        return method in self.methods
+
+    def is_transient(self, error):
+        """
+        Whether the error of a request may not happen again
+        """
+        response = getattr(error, 'response', None)
+        if response is not None:
+            return response.status_code in self.statuses
+        return isinstance(error, TRANSIENT_ERRORS)
+
+    def delay(self, attempt, error, previous=None):
+        """
+        Returns the time to wait before the next attempt
+
+        :param attempt: The number of failed attempts
+        :type attempt: int
+
+        :param previous: The previous delay
+        :type previous: float
+
+        :returns: The delay in seconds, ``None`` if the request is not
+            retried
+        :rtype: float
+        """
+        if attempt >= self.attempts or not self.is_transient(error):
+            return None
+        delay = self.retry_after(error)
+        if delay is None:
+            delay = self.backoff(previous)
+        if delay > self.max_retry_after:
+            return None
+        if not self.budget.withdraw():
+            self.rejected += 1
+            return None
+        self.retried += 1
+        return delay
+
+    def backoff(self, previous=None):
+        """
+        Decorrelated jitter: a random delay between ``base`` and three
+        times the previous delay, at most ``cap``
+        """
+        previous = previous or self.base
+        return min(self.cap, random.uniform(self.base, previous * 3))
+
+    def retry_after(self, error):
+        """
+        The delay the server asked for in the ``Retry-After`` header
+
+        :rtype: float
+        """
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After', '')
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at - time.time())
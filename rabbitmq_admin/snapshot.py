@@ -0,0 +1,254 @@
+"""
+Column oriented snapshots of the queues and connections for analytics.
+The numeric fields are kept in ``array`` buffers, shared with NumPy arrays
+when NumPy is installed (the ``analytics`` extra), and the strings are
+interned, so the aggregations do not walk a dict per object. A snapshot is
+built from any iterable of objects, e.g. a stream, without the
+intermediate list:
+::
+
+    snapshot = QueueSnapshot.from_items(
+        api.stream_queues(columns=QueueSnapshot.columns())
+    )
+    snapshot.top('messages', 10).rows()
+    snapshot.group_by('vhost')['/']['messages']
+"""
+from array import array
+from heapq import nlargest
+from importlib import import_module
+from sys import intern
+
+
+def _import_numpy():
+    try:
+        return import_module('numpy')
+    except ImportError:
+        return None
+
+
+def _number(item, path):
+    """
+    Returns the number at the path of the fields, missing ones are ``0``
+    """
+    for field in path:
+        if item is None:
+            return 0.0
+        item = item.get(field)
+    return float(item or 0)
+
+
+class Snapshot(object):
+    """
+    The base class of the snapshots. The subclasses list their string
+    columns and their numeric columns with the path of the field.
+
+    :param use_numpy: Whether to compute with NumPy, by default when it
+        is installed
+    :type use_numpy: bool
+    """
+
+    #: The string columns
+    STRINGS = ()
+    #: The numeric columns and the paths of their fields
+    NUMBERS = ()
+
+    def __init__(self, use_numpy=None):
+        self._numpy = _import_numpy() if use_numpy is not False else None
+        if use_numpy and self._numpy is None:
+            raise ImportError('NumPy is not installed')
+        self.strings = {column: [] for column in self.STRINGS}
+        self.numbers = {column: array('d') for column, _ in self.NUMBERS}
+
+    @classmethod
+    def columns(cls):
+        """
+        :returns: The ``columns`` argument requesting only the fields of
+            the snapshot
+        :rtype: list of str
+        """
+        return list(cls.STRINGS) + ['.'.join(path) for _, path in cls.NUMBERS]
+
+    @classmethod
+    def from_items(cls, items, use_numpy=None):
+        """
+        :param items: The objects, dicts or :mod:`rabbitmq_admin.models`
+        """
+        snapshot = cls(use_numpy)
+        for item in items:
+            snapshot._append(item)
+        return snapshot
+
+    @classmethod
+    async def afrom_items(cls, items, use_numpy=None):
+        """
+        Builds the snapshot from an asynchronous iterable, e.g. a stream of
+        the asyncio client
+        """
+        snapshot = cls(use_numpy)
+        async for item in items:
+            snapshot._append(item)
+        return snapshot
+
+    def _append(self, item):
+        for column, values in self.strings.items():
+            value = item.get(column)
+            values.append(intern(value) if isinstance(value, str) else value)
+        for column, path in self.NUMBERS:
+            self.numbers[column].append(_number(item, path))
+
+    def _derive(self, strings, numbers):
+        snapshot = type(self)(use_numpy=False)
+        snapshot._numpy = self._numpy
+        snapshot.strings = strings
+        snapshot.numbers = numbers
+        return snapshot
+
+    def __len__(self):
+        return len(self.numbers[self.NUMBERS[0][0]])
+
+    def column(self, name):
+        """
+        :returns: A NumPy array sharing the buffer of a numeric column or
+            the ``array`` itself without NumPy, the list of a string column
+        """
+        if name in self.strings:
+            return self.strings[name]
+        if self._numpy is not None:
+            return self._numpy.frombuffer(self.numbers[name])
+        return self.numbers[name]
+
+    def row(self, index):
+        row = {}
+        for columns in (self.strings, self.numbers):
+            for column, values in columns.items():
+                row[column] = values[index]
+        return row
+
+    def rows(self):
+        return [self.row(index) for index in range(len(self))]
+
+    def take(self, indices):
+        """
+        :returns: The snapshot of the rows at the indices, in their order
+        """
+        indices = list(indices)
+        return self._derive(
+            {
+                column: [values[index] for index in indices]
+                for column, values in self.strings.items()
+            },
+            {
+                column: array('d', [values[index] for index in indices])
+                for column, values in self.numbers.items()
+            },
+        )
+
+    def where(self, mask):
+        """
+        :param mask: A boolean per row, e.g. a NumPy comparison of a column
+        :returns: The snapshot of the rows where the mask is true
+        """
+        if self._numpy is not None:
+            return self.take(self._numpy.flatnonzero(mask).tolist())
+        return self.take(index for index, keep in enumerate(mask) if keep)
+
+    def filter(self, column, minimum=None, maximum=None):
+        """
+        :returns: The snapshot of the rows whose value of the numeric column
+            is within the inclusive bounds
+        """
+        values = self.column(column)
+        low = float('-inf') if minimum is None else minimum
+        high = float('inf') if maximum is None else maximum
+        if self._numpy is not None:
+            return self.where((values >= low) & (values <= high))
+        return self.where(low <= value <= high for value in values)
+
+    def top(self, column, count=10):
+        """
+        :returns: The snapshot of the rows with the largest values of the
+            numeric column, the largest first
+        """
+        values = self.column(column)
+        if self._numpy is None:
+            return self.take(
+                nlargest(count, range(len(values)), key=values.__getitem__)
+            )
+        numpy = self._numpy
+        indices = numpy.arange(len(values))
+        if count < len(values):
+            indices = numpy.argpartition(-values, count)[:count]
+        order = numpy.argsort(-values[indices], kind='stable')
+        return self.take(indices[order].tolist())
+
+    def sum(self, column):
+        return float(sum(self.numbers[column]))
+
+    def group_by(self, key, columns=None):
+        """
+        Sums the numeric columns per value of a string column
+
+        :param key: The string column, e.g. ``vhost`` or ``node``
+        :type key: str
+
+        :param columns: The numeric columns to sum, by default all of them
+        :type columns: list of str
+
+        :returns: The ``count`` of rows and the sums per key value
+        :rtype: dict
+        """
+        codes = {}
+        groups = array('l', [
+            codes.setdefault(value, len(codes)) for value in self.strings[key]
+        ])
+        result = {value: {'count': 0} for value in codes}
+        keys = list(codes)
+        for column in ['count'] + list(columns or self.numbers):
+            for code, total in enumerate(self._sums(groups, column, keys)):
+                result[keys[code]][column] = total
+        return result
+
+    def _sums(self, groups, column, keys):
+        weights = None if column == 'count' else self.numbers[column]
+        if self._numpy is not None:
+            groups = self._numpy.frombuffer(groups, dtype=groups.typecode)
+            return self._numpy.bincount(
+                groups, weights=weights, minlength=len(keys)
+            ).tolist()
+        sums = [0] * len(keys) if weights is None else [0.0] * len(keys)
+        for index, code in enumerate(groups):
+            sums[code] += 1 if weights is None else weights[index]
+        return sums
+
+
+class QueueSnapshot(Snapshot):
+    """
+    A snapshot of :meth:`~rabbitmq_admin.RabbitAPIClient.list_queues`
+    """
+
+    STRINGS = ('name', 'vhost', 'node', 'type', 'state')
+    NUMBERS = (
+        ('messages', ('messages',)),
+        ('messages_ready', ('messages_ready',)),
+        ('messages_unacknowledged', ('messages_unacknowledged',)),
+        ('consumers', ('consumers',)),
+        ('memory', ('memory',)),
+        ('publish_rate', ('message_stats', 'publish_details', 'rate')),
+        ('deliver_rate', ('message_stats', 'deliver_get_details', 'rate')),
+        ('ack_rate', ('message_stats', 'ack_details', 'rate')),
+    )
+
+
+class ConnectionSnapshot(Snapshot):
+    """
+    A snapshot of :meth:`~rabbitmq_admin.RabbitAPIClient.list_connections`
+    """
+
+    STRINGS = ('name', 'vhost', 'user', 'node', 'state', 'protocol')
+    NUMBERS = (
+        ('channels', ('channels',)),
+        ('recv_oct', ('recv_oct',)),
+        ('send_oct', ('send_oct',)),
+        ('recv_rate', ('recv_oct_details', 'rate')),
+        ('send_rate', ('send_oct_details', 'rate')),
+    )
@@ -0,0 +1,132 @@
+import codecs
+import json
+import re
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+#: The rest of the buffer after a number which may still continue it
+NUMBER_TAIL = re.compile(r'[0-9.eE+-]*\Z')
+
+
+class JSONArrayParser(object):
+    """
+    Incrementally decodes the elements of a top-level JSON array. Feed it
+    the response body chunk by chunk, only the undecoded tail of the body
+    is kept in memory:
+    ::
+
+        parser = JSONArrayParser()
+        for chunk in response.iter_content(65536):
+            for item in parser.feed(chunk):
+                ...
+        for item in parser.close():
+            ...
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._final = False
+        self._expect = self._open
+
+    def feed(self, data):
+        """
+        Decodes the elements which are complete after this chunk
+
+        :param data: The next chunk of the body
+        :type data: bytes
+
+        :returns: The decoded elements
+        :rtype: list
+        """
+        return self._parse(self._utf8.decode(data))
+
+    def close(self):
+        """
+        Decodes the rest of the body and checks that the array is closed
+
+        :returns: The decoded elements
+        :rtype: list
+        """
+        self._final = True
+        items = self._parse(self._utf8.decode(b'', final=True))
+        if self._expect != self._end:
+            raise ValueError('Unexpected end of the JSON array')
+        return items
+
+    def _parse(self, text):
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        items = []
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos == len(self._buffer) or not self._expect(items):
+                return items
+
+    def _open(self, items):
+        if self._buffer[self._pos] != '[':
+            raise ValueError('Expected a JSON array')
+        self._pos += 1
+        self._expect = self._first
+        return True
+
+    def _first(self, items):
+        if self._buffer[self._pos] == ']':
+            self._pos += 1
+            self._expect = self._end
+            return True
+        return self._item(items)
+
+    def _item(self, items):
+        try:
+            item, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except ValueError:
+            if self._final:
+                raise
+            return False
+        if not self._complete(end):
+            return False
+        items.append(item)
+        self._pos = end
+        self._expect = self._next
+        return True
+
+    def _complete(self, end):
+        """
+        Whether the element decoded up to ``end`` can not continue in the
+        next chunk. A number or a literal is only complete once another
+        character follows it, ``1.`` and ``1e`` are decoded as ``1``
+        """
+        if self._final or self._buffer[self._pos] in '{["':
+            return True
+        return not NUMBER_TAIL.match(self._buffer, end)
+
+    def _next(self, items):
+        char = self._buffer[self._pos]
+        self._pos += 1
+        if char == ',':
+            self._expect = self._item
+        elif char == ']':
+            self._expect = self._end
+        else:
+            raise ValueError(
+                'Expected "," or "]" in the JSON array, got {0!r}'.format(char)
+            )
+        return True
+
+    def _end(self, items):
+        raise ValueError('Extra data after the JSON array')
+
+
+def iter_json_array(chunks):
+    """
+    Yields the elements of a JSON array from an iterable of byte chunks
+
+    :param chunks: The chunks of the body
+    :type chunks: iterable of bytes
+    """
+    parser = JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
@@ -223,6 +223,12 @@ class RabbitAPIClientTests(TestCase):
             self.api.list_bindings_by_queue(self.queue_name, '/')
         )
 
+    def test_stream_bindings(self):
+        self.assertEqual(
+            list(self.api.stream_bindings(vhost='/')),
+            self.api.list_bindings_for_vhost('/')
+        )
+
     def test_get_messages(self):
         message = self.api.extract_messages(self.queue_name, '/')[0]
         self.assertEqual(message['payload'], 'Test Message')
@@ -434,12 +440,50 @@ class RabbitAPIClientTests(TestCase):
             1
         )
 
+    def test_list_queues_columns(self):
+        self.assertEqual(
+            self.api.list_queues(columns=['name', 'vhost']),
+            [{'name': self.queue_name, 'vhost': '/'}]
+        )
+
+    def test_get_queue_disable_stats(self):
+        response = self.api.get_queue_for_vhost(
+            self.queue_name, '/', disable_stats=True
+        )
+        self.assertNotIn('message_stats', response)
+
+    def test_stream_queues(self):
+        self.assertEqual(
+            [queue['name'] for queue in self.api.stream_queues()],
+            [self.queue_name]
+        )
+
     def test_list_queues_for_vhost(self):
         self.assertEqual(
             len(self.api.list_queues_for_vhost('/')),
             1
         )
 
+    def test_list_queues_page(self):
+        response = self.api.list_queues_page(page_size=10, name='test_')
+        self.assertEqual(response['page'], 1)
+        self.assertEqual(
+            [queue['name'] for queue in response['items']],
+            [self.queue_name]
+        )
+
+    def test_iter_queues(self):
+        self.assertEqual(
+            [queue['name'] for queue in self.api.iter_queues(vhost='/')],
+            [self.queue_name]
+        )
+
+    def test_iter_exchanges(self):
+        self.assertEqual(
+            len(list(self.api.iter_exchanges(page_size=2, prefetch=True))),
+            7
+        )
+
     def test_get_create_delete_queue_for_vhost(self):
         name = 'my_queue'
         body = {
@@ -466,3 +510,23 @@ class RabbitAPIClientTests(TestCase):
 
         with self.assertRaises(HTTPError):
             self.api.get_queue_for_vhost(name, '/')
+
+    def test_bulk_create_delete_queues(self):
+        names = ['bulk_queue_{0}'.format(i) for i in range(20)]
+
+        results = self.api.bulk_create_queues(
+            {'queue': name, 'vhost': '/', 'body': {'durable': False}}
+            for name in names
+        )
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(len(self.api.list_queues_for_vhost('/')), 21)
+
+        results = self.api.bulk_delete_queues(
+            [{'queue': name, 'vhost': '/'} for name in names + ['missing']],
+            concurrency=4,
+        )
+        self.assertEqual(
+            [result.ok for result in results],
+            [True] * 20 + [False]
+        )
+        self.assertEqual(len(self.api.list_queues_for_vhost('/')), 1)
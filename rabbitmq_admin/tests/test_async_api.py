@@ -0,0 +1,199 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+import httpx
+
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.cache import ResponseCache, ValidatorCache
+
+
+class AsyncRabbitAPIClientTests(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(self.handler),
+        )
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    def handler(self, request):
+        self.requests.append(request)
+        if request.url.raw_path == b'/api/queues/%2F/missing':
+            return httpx.Response(404, json={'error': 'Object Not Found'})
+        if request.url.path.startswith('/api/queues') and (
+            'page' in request.url.params
+        ):
+            page = int(request.url.params['page'])
+            return httpx.Response(200, json={
+                'items': [{'name': 'q{0}'.format(page)}],
+                'page': page,
+                'page_count': 3,
+            })
+        if request.url.path == '/api/bindings':
+            return httpx.Response(200, json=[{'source': 'a'}, {'source': 'b'}])
+        if request.url.path == '/api/definitions':
+            return self.definitions(request)
+        if request.method == 'GET':
+            return httpx.Response(200, json={
+                'path': request.url.raw_path.decode(),
+            })
+        return httpx.Response(204)
+
+    def definitions(self, request):
+        if request.headers.get('if-none-match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={'queues': []}, headers={'ETag': '"v1"'}
+        )
+
+    async def test_get(self):
+        response = await self.api.get_queue_for_vhost('my/queue', '/')
+
+        self.assertEqual(
+            response,
+            {'path': '/api/queues/%2F/my%2Fqueue'}
+        )
+        request = self.requests[0]
+        self.assertEqual(request.headers['content-type'], 'application/json')
+        self.assertTrue(request.headers['authorization'].startswith('Basic'))
+
+    async def test_get_with_params(self):
+        await self.api.get_node('rabbit@node', memory=True)
+
+        self.assertEqual(
+            self.requests[0].url.params['memory'],
+            'true'
+        )
+
+    async def test_put(self):
+        response = await self.api.create_vhost('vhost', tracing=True)
+
+        self.assertIsNone(response)
+        request = self.requests[0]
+        self.assertEqual(request.method, 'PUT')
+        self.assertEqual(json.loads(request.content), {'tracing': True})
+
+    async def test_delete_with_headers(self):
+        await self.api.delete_connection('conn', reason='maintenance')
+
+        request = self.requests[0]
+        self.assertEqual(request.method, 'DELETE')
+        self.assertEqual(request.headers['x-reason'], 'maintenance')
+
+    async def test_raise_for_status(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.api.get_queue_for_vhost('missing', '/')
+
+    async def test_concurrent_requests(self):
+        names = ['q{0}'.format(i) for i in range(50)]
+
+        responses = await asyncio.gather(*(
+            self.api.get_queue_for_vhost(name, '/') for name in names
+        ))
+
+        self.assertEqual(len(responses), 50)
+        self.assertEqual(len(self.requests), 50)
+
+    async def test_iter_queues(self):
+        names = [
+            queue['name']
+            async for queue in self.api.iter_queues(prefetch=True)
+        ]
+
+        self.assertEqual(names, ['q1', 'q2', 'q3'])
+
+    async def test_stream_bindings(self):
+        items = [item async for item in self.api.stream_bindings()]
+
+        self.assertEqual(items, [{'source': 'a'}, {'source': 'b'}])
+
+    async def test_purge_queues(self):
+        results = await self.api.purge_queues('/', '^q[12]$')
+
+        self.assertEqual(
+            [result.item['queue'] for result in results], ['q1', 'q2', 'q3']
+        )
+        page = self.requests[0].url.params
+        self.assertEqual(
+            (page['name'], page['use_regex'], page['columns']),
+            ('^q[12]$', 'true', 'name'),
+        )
+        self.assertEqual(
+            self.requests[-1].url.raw_path, b'/api/queues/%2F/q3/contents'
+        )
+
+    async def test_bulk_create_queues(self):
+        specs = [
+            {'queue': name, 'vhost': '/', 'body': {}}
+            for name in ('q1', 'missing', 'q2')
+        ]
+
+        results = await self.api.bulk_create_queues(specs, concurrency=2)
+
+        self.assertEqual(
+            [result.ok for result in results],
+            [True, False, True]
+        )
+        self.assertIsInstance(results[1].error, httpx.HTTPStatusError)
+
+    async def test_apply_definitions_chunked(self):
+        definitions = {
+            'vhosts': [{'name': '/'}],
+            'queues': [
+                {'name': 'q', 'vhost': '/'},
+                {'name': 'r', 'vhost': '/'},
+            ],
+        }
+
+        results = await self.api.apply_definitions_chunked(
+            definitions, chunk_size=1
+        )
+
+        self.assertEqual([result.item for result in results], ['/'])
+        self.assertEqual(
+            [json.loads(request.content) for request in self.requests],
+            [
+                {'vhosts': [{'name': '/'}]},
+                {'queues': [{'name': 'q', 'vhost': '/'}]},
+                {'queues': [{'name': 'r', 'vhost': '/'}]},
+            ]
+        )
+
+    async def test_cache(self):
+        self.api.cache = ResponseCache()
+
+        responses = await asyncio.gather(*(
+            self.api.overview() for _ in range(10)
+        ))
+        await self.api.create_vhost('vhost')
+        await self.api.overview()
+
+        self.assertEqual(responses, [{'path': '/api/overview'}] * 10)
+        self.assertEqual(
+            [request.method for request in self.requests],
+            ['GET', 'PUT', 'GET']
+        )
+
+    async def test_conditional_get(self):
+        self.api.conditional = ValidatorCache()
+
+        first = await self.api.get_definitions()
+        second = await self.api.get_definitions()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.api.conditional.not_modified, 1)
+        self.assertEqual(
+            self.requests[1].headers['if-none-match'], '"v1"'
+        )
+
+    async def test_context_manager(self):
+        async with self.api as api:
+            self.assertIs(api, self.api)
+
+        self.assertTrue(self.api.session.is_closed)
@@ -34,7 +34,81 @@ class ResourceTests(TestCase):
         self.assertEqual(self.resource.timeout, self.timeout)
         self.assertEqual(self.resource.verify, self.verify)
 
-    @patch.object(requests, 'put', autospec=True)
+    def test_session_pool(self):
+        adapter = self.resource.session.get_adapter(self.url)
+        self.assertEqual(adapter._pool_connections, 10)
+        self.assertEqual(adapter._pool_maxsize, 10)
+        self.assertIs(
+            self.resource.session.get_adapter('https://127.0.0.1'),
+            adapter
+        )
+
+    @patch.object(requests.Session, 'close', autospec=True)
+    def test_context_manager(self, mock_close):
+        with self.resource as resource:
+            self.assertIs(resource, self.resource)
+
+        mock_close.assert_called_once_with(self.resource.session)
+
+    @patch.object(requests.Session, 'get', autospec=True)
+    def test_get_reuses_session(self, mock_get):
+        mock_get.return_value.content = b'{"name": "rabbit"}'
+
+        self.resource._get(self.url, auth=self.auth)
+        self.resource._get(self.url, auth=self.auth)
+
+        self.assertEqual(mock_get.call_count, 2)
+        for call in mock_get.call_args_list:
+            self.assertIs(call.args[0], self.resource.session)
+
+    @patch.object(Resource, '_get')
+    def test_api_get_query(self, mock_get):
+        self.resource._api_get(
+            '/api/queues',
+            columns=['name', 'messages'],
+            disable_stats=True,
+            params={'page': 1, 'name': None},
+        )
+
+        self.assertEqual(
+            mock_get.call_args.kwargs['params'],
+            {'page': 1, 'columns': 'name,messages', 'disable_stats': 'true'}
+        )
+
+    @patch.object(requests.Session, 'get', autospec=True)
+    def test_get_stream(self, mock_get):
+        mock_response = mock_get.return_value
+        mock_response.iter_content.return_value = [b'[{"a": 1},', b'{"b": 2}]']
+
+        items = self.resource._api_get('/api/queues', stream=True)
+
+        mock_response.iter_content.assert_not_called()
+        self.assertEqual(list(items), [{'a': 1}, {'b': 2}])
+        self.assertTrue(mock_get.call_args.kwargs['stream'])
+        mock_response.json.assert_not_called()
+        mock_response.__exit__.assert_called_once()
+
+    @patch.object(requests.Session, 'put', autospec=True)
+    def test_put_codec(self, mock_put):
+        resource = Resource(self.host, self.port, self.auth, codec='json')
+
+        resource._put(self.url, auth=self.auth, data={'hello': 'world'})
+
+        self.assertEqual(
+            mock_put.call_args.kwargs['data'],
+            b'{"hello":"world"}'
+        )
+
+    @patch.object(requests.Session, 'post', autospec=True)
+    def test_post_decode(self, mock_post):
+        mock_post.return_value.content = b'[{"payload": "hi"}]'
+
+        self.assertEqual(
+            self.resource._post(self.url, auth=self.auth),
+            [{'payload': 'hi'}]
+        )
+
+    @patch.object(requests.Session, 'put', autospec=True)
     def test_put_no_data(self, mock_put):
 
         mock_response = Mock()
@@ -61,20 +135,20 @@ class ResourceTests(TestCase):
             verify=False
         )
 
-    @patch.object(requests, 'post', autospec=True)
+    @patch.object(requests.Session, 'post', autospec=True)
     def test_post_no_data(self, mock_post):
 
-        mock_response = Mock()
+        mock_response = Mock(content=b'')
         mock_post.return_value = mock_response
 
         self.resource._post(self.url, auth=self.auth)
 
         mock_response.raise_for_status.assert_called_once_with()
 
-    @patch.object(requests, 'post', autospec=True)
+    @patch.object(requests.Session, 'post', autospec=True)
     def test_post(self, mock_post):
 
-        mock_response = Mock()
+        mock_response = Mock(content=b'')
         mock_post.return_value = mock_response
 
         self.resource._post(self.url, auth=self.auth, data={'hello': 'world'})
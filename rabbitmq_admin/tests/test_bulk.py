@@ -0,0 +1,114 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests import HTTPError
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.bulk import iter_bulk, split_item
+
+
+class BulkTests(TestCase):
+
+    def test_split_item(self):
+        self.assertEqual(split_item({'a': 1}), ((), {'a': 1}))
+        self.assertEqual(split_item(('a', 1)), (('a', 1), {}))
+        self.assertEqual(split_item('a'), (('a',), {}))
+
+    def test_iter_bulk_order_and_errors(self):
+        def func(number):
+            if number % 3 == 0:
+                raise HTTPError('boom')
+            return number * 2
+
+        results = list(iter_bulk(func, range(10), concurrency=4))
+
+        self.assertEqual([result.item for result in results], list(range(10)))
+        self.assertEqual(
+            [result.result for result in results if result.ok],
+            [2, 4, 8, 10, 14, 16]
+        )
+        self.assertTrue(all(
+            isinstance(result.error, HTTPError)
+            for result in results if not result.ok
+        ))
+
+    def test_iter_bulk_is_bounded(self):
+        consumed = []
+
+        def items():
+            for number in range(100):
+                consumed.append(number)
+                yield number
+
+        results = iter_bulk(abs, items(), concurrency=2)
+        next(results)
+
+        self.assertLessEqual(len(consumed), 4)
+        self.assertEqual(len(list(results)), 99)
+
+    @patch.object(RabbitAPIClient, '_put')
+    def test_bulk_create_queues(self, mock_put):
+        mock_put.side_effect = [None, HTTPError('exists'), None]
+        api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+        specs = [
+            {'queue': 'q{0}'.format(i), 'vhost': '/', 'body': {}}
+            for i in range(3)
+        ]
+
+        results = api.bulk_create_queues(specs, concurrency=1)
+
+        self.assertEqual(
+            [result.ok for result in results],
+            [True, False, True]
+        )
+        self.assertEqual(
+            mock_put.call_args_list[1].kwargs['url'],
+            api.url + '/api/queues/%2F/q1'
+        )
+
+    @patch.object(RabbitAPIClient, '_delete')
+    def test_bulk_by_name(self, mock_delete):
+        api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+
+        results = api.bulk('delete_vhost', ['a', 'b'], concurrency=2)
+
+        self.assertEqual([result.item for result in results], ['a', 'b'])
+        self.assertEqual(mock_delete.call_count, 2)
+
+    @patch.object(RabbitAPIClient, '_post')
+    @patch.object(RabbitAPIClient, '_delete')
+    @patch.object(RabbitAPIClient, '_get')
+    def test_purge_queues(self, mock_get, mock_delete, mock_post):
+        mock_get.return_value = {
+            'items': [{'name': 'retry.1'}, {'name': 'retry.2'}],
+            'page': 1,
+            'page_count': 1,
+        }
+        mock_delete.side_effect = [None, HTTPError('not found')]
+        api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+
+        results = api.purge_queues('/', r'^retry\.', concurrency=1)
+
+        self.assertEqual(
+            [(result.item['queue'], result.ok) for result in results],
+            [('retry.1', True), ('retry.2', False)],
+        )
+        params = mock_get.call_args.kwargs['params']
+        self.assertEqual(
+            (params['name'], params['use_regex'], params['columns']),
+            (r'^retry\.', 'true', 'name'),
+        )
+        self.assertEqual(
+            mock_delete.call_args_list[0].kwargs['url'],
+            api.url + '/api/queues/%2F/retry.1/contents'
+        )
+
+        api.queue_actions('/', '^retry', 'sync')
+
+        self.assertEqual(
+            mock_post.call_args.kwargs['url'],
+            api.url + '/api/queues/%2F/retry.2/actions'
+        )
+        self.assertEqual(
+            mock_post.call_args.kwargs['data'], {'action': 'sync'}
+        )
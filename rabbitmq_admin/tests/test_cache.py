@@ -0,0 +1,286 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.cache import ResponseCache, ValidatorCache
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ResponseCacheTests(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(
+            ttl=1,
+            ttls={'/api/overview': 5, '/api/queues/*': 0},
+            maxsize=2,
+            clock=self.clock,
+        )
+
+    def test_ttl(self):
+        fetch = Mock(side_effect=[1, 2])
+
+        self.assertEqual(self.cache.get_or_fetch('/api/nodes', {}, fetch), 1)
+        self.clock.now = 0.5
+        self.assertEqual(self.cache.get_or_fetch('/api/nodes', {}, fetch), 1)
+        self.clock.now = 1.5
+        self.assertEqual(self.cache.get_or_fetch('/api/nodes', {}, fetch), 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_ttl_per_path(self):
+        self.assertEqual(self.cache.ttl_for('/api/overview'), 5)
+        self.assertEqual(self.cache.ttl_for('/api/queues/%2F'), 0)
+        self.assertEqual(self.cache.ttl_for('/api/queues'), 1)
+
+        fetch = Mock(side_effect=[1, 2])
+        self.cache.get_or_fetch('/api/queues/%2F', {}, fetch)
+        self.cache.get_or_fetch('/api/queues/%2F', {}, fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_params_are_part_of_the_key(self):
+        fetch = Mock(side_effect=[1, 2])
+
+        self.cache.get_or_fetch('/api/nodes', {'a': 1}, fetch)
+        self.cache.get_or_fetch('/api/nodes', {'a': 2}, fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_lru(self):
+        for path in ('/api/a', '/api/b', '/api/a', '/api/c'):
+            self.cache.get_or_fetch(path, {}, Mock(return_value=path))
+
+        self.assertEqual(
+            [key.split('?')[0] for key in self.cache._entries],
+            ['/api/a', '/api/c']
+        )
+
+    def test_single_flight(self):
+        started = threading.Event()
+        release = threading.Event()
+        fetch = Mock()
+
+        def slow_fetch():
+            started.set()
+            release.wait(5)
+            fetch()
+            return 'value'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                self.cache.get_or_fetch('/api/nodes', {}, slow_fetch)
+            ))
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(results, ['value'] * 5)
+        fetch.assert_called_once_with()
+
+    def test_error_is_not_cached(self):
+        fetch = Mock(side_effect=[ValueError('boom'), 1])
+
+        with self.assertRaises(ValueError):
+            self.cache.get_or_fetch('/api/nodes', {}, fetch)
+        self.assertEqual(self.cache.get_or_fetch('/api/nodes', {}, fetch), 1)
+
+    def test_invalidate(self):
+        for path in ('/api/queues', '/api/bindings/%2F', '/api/users'):
+            self.cache.maxsize = 10
+            self.cache.get_or_fetch(path, {}, Mock(return_value=path))
+
+        self.cache.invalidate('/api/queues/%2F/new')
+
+        self.assertEqual(
+            [key.split('?')[0] for key in self.cache._entries],
+            ['/api/users']
+        )
+
+    def test_invalidate_definitions(self):
+        self.cache.maxsize = 10
+        for path in ('/api/queues', '/api/users', '/api/nodes'):
+            self.cache.get_or_fetch(path, {}, Mock(return_value=path))
+
+        self.cache.invalidate('/api/definitions')
+
+        self.assertEqual(len(self.cache._entries), 0)
+
+    def test_closed_connection_invalidates_consumers(self):
+        self.cache.maxsize = 10
+        for path in ('/api/consumers', '/api/exchanges'):
+            self.cache.get_or_fetch(path, {}, Mock(return_value=path))
+
+        self.cache.invalidate('/api/connections/name')
+
+        self.assertEqual(
+            [key.split('?')[0] for key in self.cache._entries],
+            ['/api/exchanges']
+        )
+
+    def test_write_during_fetch(self):
+        def fetch():
+            self.cache.invalidate('/api/nodes')
+            return 'stale'
+
+        self.cache.get_or_fetch('/api/nodes', {}, fetch)
+
+        self.assertEqual(len(self.cache._entries), 0)
+
+
+class ResourceCacheTests(TestCase):
+
+    def setUp(self):
+        self.api = RabbitAPIClient(
+            '127.0.0.1', 15672, ('guest', 'guest'), cache=ResponseCache()
+        )
+
+    @patch.object(RabbitAPIClient, '_get', return_value={'name': 'x'})
+    def test_cached_get(self, mock_get):
+        self.api.overview()
+        self.api.overview()
+        self.api.overview(columns=['node'])
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(RabbitAPIClient, '_put')
+    @patch.object(RabbitAPIClient, '_get', return_value=[])
+    def test_write_invalidates(self, mock_get, mock_put):
+        self.api.list_queues_for_vhost('/')
+        self.api.create_queue_for_vhost('q', '/', {})
+        self.api.list_queues_for_vhost('/')
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(RabbitAPIClient, '_post')
+    @patch.object(RabbitAPIClient, '_get', return_value=[])
+    def test_post_definitions_invalidates(self, mock_get, mock_post):
+        self.api.list_queues()
+        self.api.post_definitions({'queues': [{'name': 'q', 'vhost': '/'}]})
+        self.api.list_queues()
+
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class ValidatorCacheTests(TestCase):
+
+    def setUp(self):
+        self.validators = ValidatorCache()
+        self.api = RabbitAPIClient(
+            '127.0.0.1', 15672, ('guest', 'guest'),
+            conditional=self.validators,
+        )
+        self.decode = Mock(wraps=self.api._decode)
+
+    def response(self, status_code=200, content=b'[]', headers=None):
+        return Mock(
+            status_code=status_code, content=content, headers=headers or {}
+        )
+
+    def test_validators_are_sent(self):
+        self.validators.resolve('key', self.response(headers={
+            'ETag': '"abc"',
+            'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        }), self.decode)
+
+        self.assertEqual(self.validators.headers('key', {'a': 'b'}), {
+            'a': 'b',
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT',
+        })
+        self.assertEqual(self.validators.headers('other'), {})
+
+    def test_not_modified(self):
+        first = self.validators.resolve(
+            'key', self.response(content=b'[1]', headers={'ETag': '"a"'}),
+            self.decode,
+        )
+        second = self.validators.resolve(
+            'key', self.response(304, b''), self.decode
+        )
+
+        self.assertIs(first, second)
+        self.decode.assert_called_once()
+        self.assertEqual(self.validators.not_modified, 1)
+        self.assertEqual(self.validators.saved_bytes, 3)
+
+    def test_unchanged_body(self):
+        first = self.validators.resolve(
+            'key', self.response(content=b'[1]'), self.decode
+        )
+        second = self.validators.resolve(
+            'key', self.response(content=b'[1]'), self.decode
+        )
+        third = self.validators.resolve(
+            'key', self.response(content=b'[2]'), self.decode
+        )
+
+        self.assertIs(first, second)
+        self.assertEqual(third, [2])
+        self.assertEqual(
+            (self.validators.hits, self.validators.misses), (1, 2)
+        )
+
+    def test_lru(self):
+        self.validators.maxsize = 1
+        self.validators.resolve('a', self.response(), self.decode)
+        self.validators.resolve('b', self.response(), self.decode)
+
+        self.assertEqual(list(self.validators._entries), ['b'])
+
+    @patch('requests.Session.get')
+    def test_conditional_get(self, mock_get):
+        mock_get.side_effect = [
+            self.response(content=b'{"a":1}', headers={'ETag': '"v1"'}),
+            self.response(304, b''),
+        ]
+
+        first = self.api.get_definitions()
+        second = self.api.get_definitions()
+
+        self.assertIs(first, second)
+        first_headers, second_headers = (
+            call[1]['headers'] for call in mock_get.call_args_list
+        )
+        self.assertNotIn('If-None-Match', first_headers)
+        self.assertEqual(second_headers['If-None-Match'], '"v1"')
+        self.assertEqual(self.validators.not_modified, 1)
+
+    @patch('requests.Session.get')
+    def test_not_modified_after_eviction(self, mock_get):
+        self.validators.maxsize = 1
+        responses = iter([
+            self.response(content=b'{"a":1}', headers={'ETag': '"v1"'}),
+            self.response(304, b''),
+        ])
+
+        def get(*args, **kwargs):
+            if kwargs['headers'].get('If-None-Match'):
+                # another response replaces the entry while this one is
+                # sent
+                self.validators.resolve(
+                    'other', self.response(), self.decode
+                )
+            return next(responses)
+
+        mock_get.side_effect = get
+
+        first = self.api.get_definitions()
+        second = self.api.get_definitions()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.validators.not_modified, 1)
@@ -0,0 +1,90 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock, patch
+
+from rabbitmq_admin.changes import Change, ChangeFeed
+
+
+def queue(name, messages, vhost='/', **fields):
+    return dict(fields, name=name, vhost=vhost, messages=messages)
+
+
+class ChangeFeedTests(TestCase):
+
+    def setUp(self):
+        self.api = Mock()
+        self.api.stream_queues.side_effect = lambda **query: iter(
+            self.queues
+        )
+        self.feed = ChangeFeed(self.api, fields=('messages',))
+
+    def test_changes(self):
+        self.queues = [queue('a', 1), queue('b', 2)]
+        self.assertEqual(self.feed.poll(), [])
+
+        self.queues = [queue('a', 1), queue('b', 5), queue('c', 0)]
+        self.assertEqual(self.feed.poll(), [
+            Change('changed', ('/', 'b'), queue('b', 5), {'messages': 2}),
+            Change('added', ('/', 'c'), queue('c', 0), None),
+        ])
+
+        self.queues = [queue('c', 0)]
+        self.assertEqual(
+            [(change.kind, change.key) for change in self.feed.poll()],
+            [('removed', ('/', 'a')), ('removed', ('/', 'b'))],
+        )
+        self.api.stream_queues.assert_called_with(
+            columns=['vhost', 'name', 'messages']
+        )
+
+    def test_initial(self):
+        self.feed.initial = True
+        self.queues = [queue('a', 1)]
+
+        self.assertEqual(
+            [change.kind for change in self.feed.poll()], ['added']
+        )
+
+    def test_unhashable_fields(self):
+        self.feed = ChangeFeed(self.api, fields=('arguments', 'stats.rate'))
+        self.queues = [queue('a', 1, arguments={'x': 1}, stats={'rate': 1})]
+        self.feed.poll()
+        self.queues = [queue('a', 1, arguments={'x': 2}, stats={'rate': 1})]
+
+        change, = self.feed.poll()
+
+        self.assertEqual(
+            change.previous, {'arguments': {'x': 1}, 'stats.rate': 1}
+        )
+
+    @patch('rabbitmq_admin.changes.time.sleep')
+    def test_run(self, mock_sleep):
+        polls = iter([[queue('a', 1)], [queue('a', 2)], [queue('a', 3)]])
+        self.api.stream_queues.side_effect = lambda **query: next(polls)
+        changes = []
+
+        def callback(change):
+            changes.append(change.item['messages'])
+            if len(changes) == 2:
+                self.feed.stop()
+
+        self.feed.run(callback, interval=5)
+
+        self.assertEqual(changes, [2, 3])
+        self.assertEqual(mock_sleep.call_count, 2)
+
+
+class AsyncChangeFeedTests(IsolatedAsyncioTestCase):
+
+    async def test_apoll(self):
+        polls = iter([[queue('a', 1)], [queue('a', 1), queue('b', 1)]])
+
+        async def stream_queues(**query):
+            for item in next(polls):
+                yield item
+
+        feed = ChangeFeed(Mock(stream_queues=stream_queues))
+
+        self.assertEqual(await feed.apoll(), [])
+        self.assertEqual(
+            [change.key for change in await feed.apoll()], [('/', 'b')]
+        )
@@ -0,0 +1,226 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock, patch
+
+import httpx
+import requests
+
+from rabbitmq_admin.cache import ValidatorCache
+from rabbitmq_admin.cluster import (
+    AsyncClusterRabbitAPIClient,
+    ClusterRabbitAPIClient,
+    NodePool,
+)
+
+
+class NodePoolTests(TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.pool = NodePool(
+            ['http://a', 'http://b', 'http://c'],
+            clock=lambda: self.now,
+        )
+        self.a, self.b, self.c = self.pool.endpoints
+
+    def test_round_robin(self):
+        picked = [self.pool.pick().url for _ in range(4)]
+
+        self.assertEqual(picked, [
+            'http://a', 'http://b', 'http://c', 'http://a'
+        ])
+
+    def test_least_latency(self):
+        self.pool._choose = self.pool._least_latency
+        self.pool.succeeded(self.a, 1.0)
+        self.pool.succeeded(self.b, 0.1)
+        self.pool.succeeded(self.c, 0.5)
+
+        self.assertIs(self.pool.pick(), self.b)
+
+    def test_pinned(self):
+        self.pool.failed(self.a)
+
+        self.assertIs(self.pool.pick(pinned=True), self.b)
+
+    def test_backoff(self):
+        self.pool.failed(self.a)
+        self.pool.failed(self.a)
+        self.assertEqual(self.a.retry_at, 2.0)
+        self.assertNotIn(self.a, [self.pool.pick() for _ in range(6)])
+
+        self.now = 2.0
+        self.assertIn(self.a, [self.pool.pick() for _ in range(6)])
+
+        self.pool.succeeded(self.a, 0.1)
+        self.assertEqual((self.a.failures, self.a.retry_at), (0, 0.0))
+
+    def test_all_failed(self):
+        for endpoint in (self.b, self.a, self.c):
+            self.pool.failed(endpoint)
+            self.now += 1
+        self.now = 0.5
+
+        self.assertIs(self.pool.pick(), self.b)
+
+    def test_add(self):
+        self.pool.add(['http://c', 'http://d', 'http://d'])
+
+        self.assertEqual(
+            [endpoint.url for endpoint in self.pool.endpoints],
+            ['http://a', 'http://b', 'http://c', 'http://d'],
+        )
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            NodePool(['http://a'], strategy='random')
+
+
+class ClusterRabbitAPIClientTests(TestCase):
+
+    def setUp(self):
+        self.api = ClusterRabbitAPIClient(
+            ['a:15672', 'b', ('c', 15673)], auth=('guest', 'guest')
+        )
+
+    def test_endpoints(self):
+        self.assertEqual(
+            [endpoint.url for endpoint in self.api.nodes.endpoints],
+            ['http://a:15672', 'http://b:15672', 'http://c:15673'],
+        )
+
+    @patch('requests.Session.get')
+    def test_reads_are_spread(self, mock_get):
+        mock_get.return_value = Mock(content=b'{}')
+
+        for _ in range(3):
+            self.api.overview()
+
+        self.assertEqual(
+            [call[1]['url'] for call in mock_get.call_args_list],
+            [
+                'http://a:15672/api/overview',
+                'http://b:15672/api/overview',
+                'http://c:15673/api/overview',
+            ],
+        )
+
+    @patch('requests.Session.get')
+    def test_validators_are_shared(self, mock_get):
+        self.api.conditional = ValidatorCache()
+        mock_get.side_effect = [
+            Mock(status_code=200, content=b'{}', headers={'ETag': '"v1"'}),
+            Mock(status_code=304, content=b'', headers={}),
+        ]
+
+        first = self.api.overview()
+        second = self.api.overview()
+
+        self.assertIs(first, second)
+        self.assertEqual(list(self.api.conditional._entries), [
+            self.api.conditional.key('/api/overview', {})
+        ])
+        self.assertEqual(
+            mock_get.call_args[1]['headers']['If-None-Match'], '"v1"'
+        )
+
+    @patch('requests.Session.get')
+    def test_get_failover(self, mock_get):
+        error = requests.HTTPError(response=Mock(status_code=503))
+        mock_get.side_effect = [
+            requests.ConnectionError(),
+            Mock(raise_for_status=Mock(side_effect=error)),
+            Mock(content=b'[]'),
+        ]
+
+        self.assertEqual(self.api.list_nodes(), [])
+        self.assertEqual(
+            sorted(endpoint.failures for endpoint in self.api.nodes.endpoints),
+            [0, 1, 1],
+        )
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_get_all_nodes_fail(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError()
+
+        with self.assertRaises(requests.ConnectionError):
+            self.api.list_nodes()
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_client_error_is_not_retried(self, mock_get):
+        error = requests.HTTPError(response=Mock(status_code=404))
+        mock_get.return_value = Mock(raise_for_status=Mock(side_effect=error))
+
+        with self.assertRaises(requests.HTTPError):
+            self.api.get_vhost('missing')
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.api.nodes.endpoints[0].failures, 0)
+
+    @patch('requests.Session.put')
+    def test_writes_are_pinned_and_not_retried(self, mock_put):
+        self.api.pin_writes = True
+        mock_put.side_effect = [Mock(), requests.ConnectionError(), Mock()]
+
+        self.api.create_vhost('a')
+        with self.assertRaises(requests.ConnectionError):
+            self.api.create_vhost('b')
+        self.api.create_vhost('c')
+
+        self.assertEqual(
+            [call[1]['url'] for call in mock_put.call_args_list],
+            [
+                'http://a:15672/api/vhosts/a',
+                'http://a:15672/api/vhosts/b',
+                'http://b:15672/api/vhosts/c',
+            ],
+        )
+
+    @patch.object(ClusterRabbitAPIClient, 'list_nodes')
+    def test_discover_nodes(self, mock_list_nodes):
+        mock_list_nodes.return_value = [
+            {'name': 'rabbit@a', 'running': True},
+            {'name': 'rabbit@d', 'running': True},
+            {'name': 'rabbit@e', 'running': False},
+        ]
+
+        self.api.discover_nodes()
+
+        self.assertEqual(
+            [endpoint.url for endpoint in self.api.nodes.endpoints][3:],
+            ['http://d:15672'],
+        )
+
+
+class AsyncClusterRabbitAPIClientTests(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.api = AsyncClusterRabbitAPIClient(
+            ['a', 'b'],
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(self.handler),
+        )
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    def handler(self, request):
+        self.requests.append(request)
+        if request.url.host == 'a':
+            raise httpx.ConnectError('refused', request=request)
+        if request.url.path == '/api/bindings':
+            return httpx.Response(200, json=[{'source': 'x'}])
+        return httpx.Response(200, json={'host': request.url.host})
+
+    async def test_get_failover(self):
+        self.assertEqual(await self.api.overview(), {'host': 'b'})
+        self.assertEqual(await self.api.overview(), {'host': 'b'})
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_stream(self):
+        self.api.nodes.failed(self.api.nodes.endpoints[0])
+
+        items = [item async for item in self.api.stream_bindings()]
+
+        self.assertEqual(items, [{'source': 'x'}])
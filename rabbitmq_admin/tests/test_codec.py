@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from rabbitmq_admin.codec import CODECS, JSONCodec, get_codec
+
+
+class CodecTests(TestCase):
+
+    def setUp(self):
+        self.document = {
+            'name': 'queue ŕ',
+            'messages': 2 ** 40,
+            'rate': 0.5,
+            'arguments': {'x-max-length': 10},
+            'durable': True,
+            'node': None,
+            'consumers': [],
+        }
+
+    def installed(self):
+        for name in CODECS:
+            try:
+                yield get_codec(name)
+            except ImportError:
+                continue
+
+    def test_roundtrip(self):
+        for codec in self.installed():
+            with self.subTest(codec=codec.name):
+                encoded = codec.dumps(self.document)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(codec.loads(encoded), self.document)
+
+    def test_default_codec(self):
+        self.assertEqual(
+            get_codec().name,
+            next(self.installed()).name
+        )
+
+    def test_instance(self):
+        codec = JSONCodec()
+        self.assertIs(get_codec(codec), codec)
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            get_codec('yaml')
@@ -0,0 +1,75 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests import HTTPError
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.definitions import split_definitions
+
+
+class DefinitionsTests(TestCase):
+
+    def setUp(self):
+        self.definitions = {
+            'rabbit_version': '3.7.7',
+            'vhosts': [{'name': '/'}, {'name': 'v2'}],
+            'users': [{'name': 'guest'}],
+            'permissions': [{'user': 'guest', 'vhost': 'v2'}],
+            'queues': [
+                {'name': 'q{0}'.format(i), 'vhost': vhost}
+                for vhost in ('/', 'v2')
+                for i in range(5)
+            ],
+            'exchanges': [{'name': 'e', 'vhost': 'v2'}],
+            'bindings': [{'source': 'e', 'destination': 'q1', 'vhost': 'v2'}],
+        }
+
+    def test_split_definitions(self):
+        head, vhosts = split_definitions(self.definitions, chunk_size=2)
+
+        self.assertEqual(
+            [list(chunk) for chunk in head],
+            [['vhosts'], ['users'], ['permissions']]
+        )
+        self.assertEqual(
+            [list(chunk) for chunk in vhosts['v2']],
+            [['exchanges'], ['queues'], ['queues'], ['queues'], ['bindings']]
+        )
+        self.assertEqual(
+            [len(chunk['queues']) for chunk in vhosts['/']],
+            [2, 2, 1]
+        )
+
+    @patch.object(RabbitAPIClient, '_post')
+    def test_apply_definitions_chunked(self, mock_post):
+        api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+        reports = []
+
+        results = api.apply_definitions_chunked(
+            self.definitions,
+            chunk_size=3,
+            concurrency=2,
+            progress=lambda done, total, chunk: reports.append((done, total)),
+        )
+
+        self.assertEqual(mock_post.call_count, 9)
+        self.assertEqual(reports[-1], (9, 9))
+        self.assertEqual(
+            sorted(result.item for result in results if result.ok),
+            ['/', 'v2']
+        )
+
+    @patch.object(RabbitAPIClient, '_post')
+    def test_vhost_failure(self, mock_post):
+        def post(**kwargs):
+            if kwargs['data'].get('exchanges'):
+                raise HTTPError('conflict')
+
+        mock_post.side_effect = post
+        api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+
+        results = api.apply_definitions_chunked(self.definitions)
+
+        failed = {result.item: result.error for result in results}
+        self.assertIsNone(failed['/'])
+        self.assertIsInstance(failed['v2'], HTTPError)
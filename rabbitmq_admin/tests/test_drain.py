@@ -0,0 +1,142 @@
+import gzip
+import json
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock
+
+from rabbitmq_admin.drain import (
+    BatchSizer,
+    CallbackSink,
+    Checkpoint,
+    Drain,
+    JSONLinesSink,
+)
+
+
+class FakeQueue(object):
+
+    def __init__(self, size):
+        self.messages = [
+            {'payload': 'm{0}'.format(index), 'payload_bytes': 10}
+            for index in range(size)
+        ]
+        self.counts = []
+
+    def extract_messages(self, queue, vhost, limit=1, **kwargs):
+        self.counts.append(limit)
+        batch, self.messages = self.messages[:limit], self.messages[limit:]
+        if kwargs['mode'] == 'ack_requeue_true':
+            self.messages = batch + self.messages
+        return batch
+
+
+class BatchSizerTests(TestCase):
+
+    def test_update(self):
+        sizer = BatchSizer(initial=100, maximum=1000, target=1.0,
+                           max_bytes=1000)
+
+        sizer.update(100, 0.1, 100)
+        self.assertEqual(sizer.size, 200)
+        sizer.update(200, 4, 100)
+        self.assertEqual(sizer.size, 100)
+        sizer.update(100, 0.5, 500)
+        self.assertEqual(sizer.size, 200)
+        sizer.update(150, 0.1, 10)
+        self.assertEqual(sizer.size, 200)
+
+
+class DrainTests(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.queue = FakeQueue(25)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_messages(self):
+        drain = Drain(self.queue, 'queue', '/', sizer=BatchSizer(initial=4))
+
+        messages = list(drain.messages())
+
+        self.assertEqual(len(messages), 25)
+        self.assertEqual(self.queue.counts, [4, 8, 16])
+        self.assertEqual(drain.stats.messages, 25)
+        self.assertEqual(drain.stats.bytes, 250)
+
+    def test_limit(self):
+        drain = Drain(self.queue, 'queue', '/', limit=10,
+                      sizer=BatchSizer(initial=4))
+
+        self.assertEqual(len(list(drain.messages())), 10)
+        self.assertEqual(self.queue.counts, [4, 6])
+
+    def test_peek_reads_the_head_once(self):
+        drain = Drain(self.queue, 'queue', '/', limit=5,
+                      mode='ack_requeue_true')
+
+        self.assertEqual(len(list(drain.messages())), 5)
+        self.assertEqual(self.queue.counts, [5])
+        with self.assertRaises(ValueError):
+            Drain(self.queue, 'queue', '/', mode='ack_requeue_true')
+
+    def test_run_with_checkpoint(self):
+        checkpoint = Checkpoint(self.path('checkpoint'))
+        batches = []
+        with JSONLinesSink(self.path('messages.jsonl.gz')) as sink:
+            Drain(
+                self.queue, 'queue', '/', limit=10,
+                sizer=BatchSizer(initial=4), checkpoint=checkpoint,
+            ).run(sink, on_batch=lambda stats: batches.append(stats.messages))
+
+        self.assertEqual(batches, [4, 10])
+        with gzip.open(self.path('messages.jsonl.gz')) as lines:
+            self.assertEqual(
+                [json.loads(line)['payload'] for line in lines][-1], 'm9'
+            )
+
+        resumed = Drain(self.queue, 'queue', '/', limit=12,
+                        checkpoint=checkpoint)
+
+        self.assertEqual(resumed.sizer.size, 8)
+        self.assertEqual(len(list(resumed.messages())), 2)
+        self.assertEqual(resumed.stats.messages, 12)
+
+    def test_callback_sink(self):
+        sink = CallbackSink(Mock())
+
+        stats = Drain(self.queue, 'queue', '/').run(sink)
+
+        self.assertEqual(sink.callback.call_count, 25)
+        self.assertEqual(stats.batches, 1)
+
+    def test_duck_typed_sink(self):
+        sink = Mock(spec=['write', 'flush', 'close'])
+
+        Drain(self.queue, 'queue', '/', sizer=BatchSizer(initial=10)).run(
+            sink
+        )
+
+        self.assertEqual(sink.write.call_count, 25)
+        self.assertEqual(sink.flush.call_count, 2)
+
+
+class AsyncDrainTests(IsolatedAsyncioTestCase):
+
+    async def test_arun(self):
+        queue = FakeQueue(3)
+
+        async def extract_messages(*args, **kwargs):
+            return queue.extract_messages(*args, **kwargs)
+
+        messages = []
+        stats = await Drain(
+            Mock(extract_messages=extract_messages), 'queue', '/',
+            sizer=BatchSizer(initial=2),
+        ).arun(CallbackSink(messages.append))
+
+        self.assertEqual(len(messages), 3)
+        self.assertEqual(stats.batches, 2)
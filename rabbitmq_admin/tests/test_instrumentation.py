@@ -0,0 +1,272 @@
+from datetime import timedelta
+from importlib.util import find_spec
+from unittest import IsolatedAsyncioTestCase, TestCase, skipUnless
+from unittest.mock import MagicMock, Mock, patch
+
+import httpx
+import requests
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.instrumentation import (
+    Hook,
+    OpenTelemetryHook,
+    PrometheusHook,
+    RequestEvent,
+    path_template,
+)
+from rabbitmq_admin.retry import RetryPolicy
+
+
+class RecordingHook(Hook):
+
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(('before_request', event))
+
+    def after_response(self, event):
+        self.calls.append(('after_response', event))
+
+    def on_error(self, event):
+        self.calls.append(('on_error', event))
+
+
+def response(status_code=200, content=b'[]'):
+    return Mock(
+        status_code=status_code,
+        content=content,
+        elapsed=timedelta(milliseconds=5),
+    )
+
+
+class PathTemplateTests(TestCase):
+
+    def test_path_template(self):
+        self.assertEqual(
+            path_template('http://host:15672/api/queues/%2F/my%2Fqueue'),
+            '/api/queues/{vhost}/{queue}',
+        )
+        self.assertEqual(
+            path_template('/api/bindings/%2F/e/a/q/b/~'),
+            '/api/bindings/{vhost}/e/{exchange}/q/{queue}/{props}',
+        )
+        self.assertEqual(
+            path_template('/api/policies/%2F/name/'),
+            '/api/policies/{vhost}/{policy}',
+        )
+        self.assertEqual(path_template('/api/overview'), '/api/overview')
+        self.assertEqual(
+            path_template('/api/unknown/a/b'), '/api/unknown/{}/{}'
+        )
+
+
+class ResourceHooksTests(TestCase):
+
+    def setUp(self):
+        self.hook = RecordingHook()
+        self.api = RabbitAPIClient(
+            '127.0.0.1', 15672, ('guest', 'guest'), hooks=[self.hook]
+        )
+
+    @patch('requests.Session.get')
+    def test_after_response(self, mock_get):
+        mock_get.return_value = response(content=b'[1, 2]')
+
+        self.api.list_queues_for_vhost('/')
+
+        self.assertEqual(
+            [name for name, _ in self.hook.calls],
+            ['before_request', 'after_response'],
+        )
+        event = self.hook.calls[-1][1]
+        self.assertEqual(event.method, 'GET')
+        self.assertEqual(event.path, '/api/queues/%2F')
+        self.assertEqual(event.template, '/api/queues/{vhost}')
+        self.assertEqual((event.status, event.bytes_in), (200, 6))
+        self.assertEqual(event.timings['ttfb'], 0.005)
+        self.assertEqual(set(event.timings), {'total', 'ttfb', 'decode'})
+
+    @patch('requests.Session.put')
+    def test_bytes_out(self, mock_put):
+        mock_put.return_value = response(204, b'')
+
+        self.api.create_vhost('vhost', tracing=True)
+
+        self.assertEqual(
+            self.hook.calls[-1][1].bytes_out, len(b'{"tracing":true}')
+        )
+
+    @patch('requests.Session.get')
+    def test_on_error(self, mock_get):
+        error = requests.HTTPError(response=Mock(status_code=404))
+        mock_get.return_value = response(404)
+        mock_get.return_value.raise_for_status.side_effect = error
+
+        with self.assertRaises(requests.HTTPError):
+            self.api.get_vhost('missing')
+
+        name, event = self.hook.calls[-1]
+        self.assertEqual((name, event.status), ('on_error', 404))
+        self.assertIs(event.error, error)
+
+    @patch('rabbitmq_admin.base.time.sleep')
+    @patch('requests.Session.get')
+    def test_retries(self, mock_get, mock_sleep):
+        self.api.retry = RetryPolicy()
+        mock_get.side_effect = [requests.ConnectionError(), response()]
+
+        self.api.list_nodes()
+
+        self.assertEqual(self.hook.calls[-1][1].retries, 1)
+
+    @patch('requests.Session.get')
+    def test_stream(self, mock_get):
+        mock_get.return_value = MagicMock(
+            status_code=200, elapsed=timedelta(milliseconds=5)
+        )
+        mock_get.return_value.iter_content.return_value = iter(
+            [b'[{"name": "a"},', b' {"name": "b"}]']
+        )
+
+        queues = self.api.stream_queues()
+        self.assertEqual(next(queues), {'name': 'a'})
+        self.assertEqual(
+            [name for name, _ in self.hook.calls], ['before_request']
+        )
+        self.assertEqual(list(queues), [{'name': 'b'}])
+
+        name, event = self.hook.calls[-1]
+        self.assertEqual(name, 'after_response')
+        self.assertEqual(event.template, '/api/queues')
+        self.assertEqual((event.status, event.bytes_in), (200, 30))
+
+    @patch('requests.Session.get')
+    def test_stream_closed(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=200)
+        mock_get.return_value.iter_content.return_value = iter(
+            [b'[{"name": "a"},', b' {"name": "b"}]']
+        )
+
+        queues = self.api.stream_queues()
+        next(queues)
+        queues.close()
+
+        self.assertEqual(
+            [name for name, _ in self.hook.calls],
+            ['before_request', 'after_response'],
+        )
+
+    @patch('requests.Session.get')
+    def test_stream_error(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=200)
+        mock_get.return_value.iter_content.return_value = iter([b'[1, 2'])
+
+        with self.assertRaises(ValueError):
+            list(self.api.stream_queues())
+
+        name, event = self.hook.calls[-1]
+        self.assertEqual(name, 'on_error')
+        self.assertIsInstance(event.error, ValueError)
+
+
+class AsyncResourceHooksTests(IsolatedAsyncioTestCase):
+
+    async def test_after_response(self):
+        hook = RecordingHook()
+        api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=[1])
+            ),
+            hooks=[hook],
+        )
+        async with api:
+            await api.get_queue_for_vhost('queue', '/')
+
+        event = hook.calls[-1][1]
+        self.assertEqual(event.template, '/api/queues/{vhost}/{queue}')
+        self.assertEqual((event.status, event.bytes_in), (200, 3))
+
+    async def test_stream(self):
+        hook = RecordingHook()
+        api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=b'[1, 2]')
+            ),
+            hooks=[hook],
+        )
+        async with api:
+            queues = api.stream_queues()
+            self.assertEqual(await queues.__anext__(), 1)
+            self.assertEqual(
+                [name for name, _ in hook.calls], ['before_request']
+            )
+            await queues.aclose()
+
+        name, event = hook.calls[-1]
+        self.assertEqual(name, 'after_response')
+        self.assertEqual((event.status, event.bytes_in), (200, 6))
+        self.assertIn('total', event.timings)
+
+
+class TracedEventTests(IsolatedAsyncioTestCase):
+
+    async def test_trace(self):
+        event = RequestEvent('GET', '/api/overview')
+        for name in (
+            'connection.connect_tcp.started',
+            'connection.connect_tcp.complete',
+            'http11.send_request_headers.started',
+            'http11.receive_response_headers.complete',
+        ):
+            await event.trace(name, {})
+
+        event.finish()
+
+        self.assertEqual(
+            set(event.timings), {'total', 'connect', 'ttfb'}
+        )
+
+
+@skipUnless(find_spec('prometheus_client'), 'prometheus_client is missing')
+class PrometheusHookTests(TestCase):
+
+    def test_metrics(self):
+        prometheus = __import__('prometheus_client')
+        registry = prometheus.CollectorRegistry()
+        hook = PrometheusHook(registry=registry)
+        event = RequestEvent('GET', '/api/queues/%2F')
+        event.status = 200
+        event.finish()
+
+        hook.after_response(event)
+
+        self.assertEqual(registry.get_sample_value(
+            'rabbitmq_admin_request_duration_seconds_count',
+            {'method': 'GET', 'path': '/api/queues/{vhost}', 'status': '200'},
+        ), 1)
+
+
+@skipUnless(find_spec('opentelemetry'), 'opentelemetry is missing')
+class OpenTelemetryHookTests(TestCase):
+
+    def test_span(self):
+        tracer = Mock()
+        hook = OpenTelemetryHook(tracer)
+        event = RequestEvent('GET', '/api/queues/%2F')
+
+        hook.before_request(event)
+        event.finish()
+        hook.after_response(event)
+
+        self.assertEqual(
+            tracer.start_span.call_args[0][0], 'GET /api/queues/{vhost}'
+        )
+        tracer.start_span.return_value.end.assert_called_once_with()
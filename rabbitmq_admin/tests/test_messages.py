@@ -0,0 +1,165 @@
+import base64
+import json
+from datetime import timedelta
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock, patch
+
+import httpx
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.messages import decode_payloads
+
+PAYLOAD = bytes(range(256)) * 4
+
+
+def messages():
+    return [
+        {
+            'payload': base64.b64encode(PAYLOAD).decode(),
+            'payload_encoding': 'base64',
+            'payload_bytes': len(PAYLOAD),
+        },
+        {'payload': 'text', 'payload_encoding': 'string'},
+    ]
+
+
+class DecodePayloadsTests(TestCase):
+
+    def test_bytes(self):
+        decoded = decode_payloads(messages())
+
+        self.assertEqual(
+            [message['payload'] for message in decoded], [PAYLOAD, b'text']
+        )
+
+    def test_buffer(self):
+        buffer = bytearray(2048)
+
+        decoded = decode_payloads(messages(), buffer)
+
+        self.assertIsInstance(decoded[0]['payload'], memoryview)
+        self.assertEqual(decoded[0]['payload'], PAYLOAD)
+        self.assertEqual(bytes(decoded[1]['payload']), b'text')
+        self.assertEqual(buffer[1024:1028], b'text')
+
+    def test_small_buffer(self):
+        with self.assertRaises(ValueError):
+            decode_payloads(messages(), bytearray(1025))
+
+
+class ExtractMessagesTests(TestCase):
+
+    @patch('requests.Session.post')
+    def test_binary(self, mock_post):
+        mock_post.return_value = Mock(
+            status_code=200,
+            content=json.dumps(messages()).encode(),
+            elapsed=timedelta(),
+        )
+        api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+
+        result = api.extract_messages('queue', '/', 2, binary=True,
+                                      truncate=4096)
+
+        self.assertEqual(result[0]['payload'], PAYLOAD)
+        self.assertEqual(
+            json.loads(mock_post.call_args[1]['data']),
+            {'count': 2, 'ackmode': 'ack_requeue_false',
+             'encoding': 'base64', 'truncate': 4096},
+        )
+
+
+class AsyncExtractMessagesTests(IsolatedAsyncioTestCase):
+
+    async def test_buffer(self):
+        api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=messages())
+            ),
+        )
+        buffer = bytearray(2048)
+
+        async with api:
+            result = await api.extract_messages('queue', '/', buffer=buffer)
+
+        self.assertEqual(result[0]['payload'], PAYLOAD)
+        self.assertEqual(buffer[:1024], PAYLOAD)
+
+
+class PublishTests(TestCase):
+
+    def setUp(self):
+        self.api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+
+    @patch('requests.Session.post')
+    def test_publish_bytes(self, mock_post):
+        mock_post.return_value = Mock(
+            status_code=200, content=b'{"routed":true}', elapsed=timedelta()
+        )
+
+        result = self.api.publish_message('amq.default', '/', 'queue',
+                                          b'\x00\xff')
+
+        self.assertEqual(result, {'routed': True})
+        self.assertEqual(
+            mock_post.call_args[1]['url'],
+            'http://127.0.0.1:15672/api/exchanges/%2F/amq.default/publish',
+        )
+        self.assertEqual(json.loads(mock_post.call_args[1]['data']), {
+            'properties': {},
+            'routing_key': 'queue',
+            'payload': 'AP8=',
+            'payload_encoding': 'base64',
+        })
+
+    @patch('requests.Session.post')
+    def test_publish_many(self, mock_post):
+        mock_post.return_value = Mock(
+            status_code=200, content=b'{"routed":false}', elapsed=timedelta()
+        )
+        messages = (
+            {'exchange': 'e', 'vhost': '/', 'routing_key': str(index),
+             'payload': 'text'}
+            for index in range(100)
+        )
+
+        results = list(self.api.publish_many(messages, concurrency=4))
+
+        self.assertEqual(len(results), 100)
+        self.assertEqual(
+            [result.item['routing_key'] for result in results[:3]],
+            ['0', '1', '2'],
+        )
+        self.assertFalse(any(result.result['routed'] for result in results))
+
+
+class AsyncPublishTests(IsolatedAsyncioTestCase):
+
+    async def test_publish_many(self):
+        def handler(request):
+            routed = json.loads(request.content)['routing_key'] != 'missing'
+            return httpx.Response(200, json={'routed': routed})
+
+        api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(handler),
+        )
+        messages = (
+            {'exchange': 'e', 'vhost': '/', 'routing_key': key,
+             'payload': 'text'}
+            for key in ('a', 'missing', 'b')
+        )
+
+        async with api:
+            routed = [
+                result.result['routed']
+                async for result in api.publish_many(messages, concurrency=2)
+            ]
+
+        self.assertEqual(routed, [True, False, True])
@@ -0,0 +1,154 @@
+import json
+import pickle
+import tracemalloc
+from datetime import timedelta
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock, patch
+
+import httpx
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.models import Binding, Queue
+
+QUEUE = {
+    'name': 'test_queue',
+    'vhost': '/',
+    'messages': 3,
+    'arguments': {'x-queue-type': 'classic'},
+    'message_stats': {'publish': 10, 'publish_details': {'rate': 0.5}},
+}
+
+
+class ModelTests(TestCase):
+
+    def test_fields(self):
+        queue = Queue(QUEUE)
+
+        self.assertEqual((queue.name, queue.vhost), ('test_queue', '/'))
+        self.assertEqual(queue.messages, 3)
+        self.assertIsNone(queue.consumers)
+        self.assertEqual(queue.get('consumers', 0), 0)
+        with self.assertRaises(AttributeError):
+            queue.missing
+
+    def test_extra_fields_are_decoded_lazily(self):
+        queue = Queue(QUEUE)
+
+        self.assertIsInstance(queue._extra, bytes)
+        self.assertEqual(queue.message_stats.publish_details.rate, 0.5)
+        self.assertEqual(queue.arguments['x-queue-type'], 'classic')
+        self.assertEqual(queue.message_stats.publish, 10)
+        self.assertIsInstance(queue._extra, bytes)
+
+    def test_nested_access_keeps_memory(self):
+        queues = [
+            dict(QUEUE, name='queue-{0}'.format(number))
+            for number in range(500)
+        ]
+        tracemalloc.start()
+        try:
+            models = Queue.parse(queues)
+            before = tracemalloc.get_traced_memory()[0]
+            for queue in models:
+                queue.message_stats.publish_details.rate
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        # not a decoded copy per queue
+        self.assertLess(after - before, 16 * 1024)
+
+    def test_to_dict(self):
+        self.assertEqual(Queue(QUEUE).to_dict(), QUEUE)
+        self.assertEqual(Queue({'name': 'q'}).to_dict(), {'name': 'q'})
+
+    def test_hash(self):
+        queues = {Queue(QUEUE), Queue(QUEUE), Queue(dict(QUEUE, name='b'))}
+
+        self.assertEqual(len(queues), 2)
+        self.assertIn(Queue(QUEUE), queues)
+        self.assertEqual(
+            hash(Binding({'source': 'a', 'destination': 'b'})),
+            hash(Binding({'source': 'a', 'destination': 'b'})),
+        )
+
+    def test_pickle(self):
+        queue = pickle.loads(pickle.dumps(Queue(QUEUE)))
+
+        self.assertEqual(queue, Queue(QUEUE))
+        self.assertEqual(queue.message_stats.publish, 10)
+
+    def test_parse(self):
+        self.assertEqual(Queue.parse([QUEUE]), [Queue(QUEUE)])
+        self.assertEqual(Queue.parse(QUEUE), Queue(QUEUE))
+        self.assertEqual(
+            Queue.parse({'items': [QUEUE], 'page': 1})['items'],
+            [Queue(QUEUE)],
+        )
+        self.assertEqual(list(Queue.parse(iter([QUEUE]))), [Queue(QUEUE)])
+
+    def test_repr(self):
+        self.assertEqual(repr(Queue(QUEUE)), "<Queue 'test_queue'>")
+        self.assertEqual(
+            repr(Binding({'source': 'a', 'destination': 'b'})),
+            "<Binding 'a' -> 'b'>",
+        )
+
+
+class ClientModelsTests(TestCase):
+
+    def setUp(self):
+        self.api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+
+    @patch('requests.Session.get')
+    def test_raw_false(self, mock_get):
+        mock_get.return_value = Mock(
+            status_code=200,
+            content=json.dumps([QUEUE]).encode(),
+            elapsed=timedelta(),
+        )
+
+        self.assertEqual(self.api.list_queues(), [QUEUE])
+        self.assertEqual(self.api.list_queues(raw=False), [Queue(QUEUE)])
+        self.assertNotIn('raw', mock_get.call_args[1]['params'])
+
+    @patch('requests.Session.get')
+    def test_iter_queues(self, mock_get):
+        mock_get.return_value = Mock(
+            status_code=200,
+            content=json.dumps({
+                'items': [QUEUE], 'page': 1, 'page_count': 1,
+            }).encode(),
+            elapsed=timedelta(),
+        )
+
+        self.assertEqual(
+            list(self.api.iter_queues(raw=False)), [Queue(QUEUE)]
+        )
+
+
+class AsyncClientModelsTests(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=[QUEUE])
+            ),
+        )
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    async def test_raw_false(self):
+        self.assertEqual(
+            await self.api.list_queues(raw=False), [Queue(QUEUE)]
+        )
+
+    async def test_stream_queues(self):
+        queues = [queue async for queue in self.api.stream_queues(raw=False)]
+
+        self.assertEqual(queues, [Queue(QUEUE)])
@@ -0,0 +1,79 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from rabbitmq_admin.api import RabbitAPIClient
+
+
+def make_pages(items, page_size):
+    page_count = (len(items) + page_size - 1) // page_size
+    return [
+        {
+            'items': items[start:start + page_size],
+            'page': number + 1,
+            'page_count': page_count,
+            'page_size': page_size,
+        }
+        for number, start in enumerate(range(0, len(items), page_size))
+    ] or [{'items': [], 'page': 1, 'page_count': 0, 'page_size': page_size}]
+
+
+class PaginationTests(TestCase):
+
+    def setUp(self):
+        self.api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+        self.items = [{'name': 'q{0}'.format(i)} for i in range(7)]
+
+    def fake_get(self, pages):
+        def _get(**kwargs):
+            return pages[int(kwargs['params']['page']) - 1]
+        return _get
+
+    def test_list_queues_page_params(self):
+        with patch.object(RabbitAPIClient, '_get') as mock_get:
+            self.api.list_queues_page(
+                2, 50, vhost='/', name='^q', use_regex=True, sort='messages'
+            )
+
+        kwargs = mock_get.call_args.kwargs
+        self.assertEqual(kwargs['url'], self.api.url + '/api/queues/%2F')
+        self.assertEqual(kwargs['params'], {
+            'page': 2,
+            'page_size': 50,
+            'name': '^q',
+            'use_regex': 'true',
+            'sort': 'messages',
+            'sort_reverse': 'false',
+        })
+
+    def test_iter_queues(self):
+        pages = make_pages(self.items, 3)
+        with patch.object(RabbitAPIClient, '_get',
+                          side_effect=self.fake_get(pages)) as mock_get:
+            result = list(self.api.iter_queues(page_size=3))
+
+        self.assertEqual(result, self.items)
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_iter_queues_prefetch(self):
+        pages = make_pages(self.items, 2)
+        with patch.object(RabbitAPIClient, '_get',
+                          side_effect=self.fake_get(pages)) as mock_get:
+            result = list(self.api.iter_queues(page_size=2, prefetch=True))
+
+        self.assertEqual(result, self.items)
+        self.assertEqual(mock_get.call_count, 4)
+
+    def test_iter_queues_empty(self):
+        pages = make_pages([], 2)
+        with patch.object(RabbitAPIClient, '_get',
+                          side_effect=self.fake_get(pages)):
+            self.assertEqual(list(self.api.iter_connections()), [])
+
+    def test_iter_is_lazy(self):
+        pages = make_pages(self.items, 3)
+        with patch.object(RabbitAPIClient, '_get',
+                          side_effect=self.fake_get(pages)) as mock_get:
+            iterator = self.api.iter_channels(page_size=3)
+            next(iterator)
+
+        self.assertEqual(mock_get.call_count, 1)
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock
+
+from rabbitmq_admin.poller import Poller
+
+
+class PollerTests(TestCase):
+
+    def setUp(self):
+        self.api = Mock()
+        self.api.overview.return_value = {'cluster_name': 'rabbit'}
+        self.api.list_queues.return_value = [{'name': 'q'}]
+        self.poller = Poller(self.api, {'overview': 10}, jitter=0)
+
+    def test_refresh(self):
+        samples = []
+        self.poller.subscribe(samples.append)
+        self.poller.add('list_queues', 60, name='queues', columns=['name'])
+
+        self.poller.refresh('overview')
+        self.poller.refresh('queues')
+
+        self.assertEqual(
+            self.poller.get('overview'), {'cluster_name': 'rabbit'}
+        )
+        self.assertEqual(self.poller.snapshot['queues'].value, [{'name': 'q'}])
+        self.api.list_queues.assert_called_once_with(columns=['name'])
+        self.assertEqual(
+            [sample.name for sample in samples], ['overview', 'queues']
+        )
+        with self.assertRaises(TypeError):
+            self.poller.snapshot['overview'] = None
+
+    def test_error_keeps_the_value(self):
+        self.poller.refresh('overview')
+        error = ConnectionError()
+        self.api.overview.side_effect = error
+
+        sample = self.poller.refresh('overview')
+
+        self.assertEqual(sample.value, {'cluster_name': 'rabbit'})
+        self.assertIs(sample.error, error)
+
+    def test_failing_subscriber(self):
+        self.poller.subscribe(Mock(side_effect=ValueError))
+        callback = Mock()
+        self.poller.subscribe(callback)
+
+        with self.assertLogs('rabbitmq_admin.poller'):
+            self.poller.refresh('overview')
+
+        callback.assert_called_once_with(self.poller.snapshot['overview'])
+        self.poller.unsubscribe(callback)
+        self.assertEqual(len(self.poller._subscribers), 1)
+
+    def test_thread(self):
+        polled = threading.Event()
+        self.poller.subscribe(lambda sample: polled.set())
+
+        with self.poller:
+            self.assertTrue(polled.wait(5))
+
+        self.assertIsNone(self.poller._worker)
+
+    def test_schedule(self):
+        self.poller = Poller(self.api, {'overview': 10, 'list_nodes': 1})
+
+        names = [self.poller._next()[1] for _ in range(3)]
+
+        self.assertEqual(names.count('overview'), 1)
+
+    def test_no_endpoints(self):
+        with self.assertRaises(ValueError):
+            Poller(self.api).start()
+
+
+class AsyncPollerTests(IsolatedAsyncioTestCase):
+
+    async def test_astart(self):
+        async def overview():
+            return {'cluster_name': 'rabbit'}
+
+        polled = asyncio.Event()
+        poller = Poller(Mock(overview=overview), {'overview': 10})
+        poller.subscribe(lambda sample: polled.set())
+
+        poller.astart()
+        await asyncio.wait_for(polled.wait(), 5)
+        poller.stop()
+
+        self.assertEqual(poller.get('overview'), {'cluster_name': 'rabbit'})
@@ -0,0 +1,148 @@
+from copy import deepcopy
+from unittest import TestCase
+from unittest.mock import patch
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.reconcile import diff_definitions, reconcile
+
+
+class ReconcileTests(TestCase):
+
+    def setUp(self):
+        self.current = {
+            'vhosts': [{'name': '/'}],
+            'users': [
+                {'name': 'guest', 'password_hash': 'h', 'tags': 'a,b'},
+            ],
+            'queues': [
+                {
+                    'name': 'q{0}'.format(i),
+                    'vhost': '/',
+                    'durable': True,
+                    'auto_delete': False,
+                    'arguments': {},
+                }
+                for i in range(3)
+            ],
+            'exchanges': [],
+            'bindings': [
+                {
+                    'source': 'amq.direct',
+                    'vhost': '/',
+                    'destination': 'q0',
+                    'destination_type': 'queue',
+                    'routing_key': 'q0',
+                    'arguments': {},
+                },
+            ],
+        }
+        self.api = RabbitAPIClient('127.0.0.1', 15672, ('guest', 'guest'))
+
+    def test_no_changes(self):
+        desired = deepcopy(self.current)
+        desired['users'][0]['tags'] = ['b', 'a']
+        del desired['queues'][0]['arguments']
+
+        self.assertFalse(diff_definitions(self.current, desired))
+
+    def test_diff(self):
+        desired = deepcopy(self.current)
+        desired['queues'][1]['durable'] = False
+        desired['queues'].pop(2)
+        desired['queues'].append({'name': 'new', 'vhost': '/'})
+        desired['bindings'][0]['arguments'] = {'x-match': 'all'}
+
+        diff = diff_definitions(self.current, desired)
+
+        self.assertEqual(
+            diff['queues'].create,
+            [{'name': 'new', 'vhost': '/'}]
+        )
+        self.assertEqual(
+            [queue['name'] for queue in diff['queues'].update],
+            ['q1']
+        )
+        self.assertEqual(
+            [queue['name'] for queue in diff['queues'].delete],
+            ['q2']
+        )
+        self.assertEqual(len(diff['bindings'].create), 1)
+        self.assertEqual(len(diff['bindings'].delete), 1)
+        self.assertEqual(list(diff.conflicts()), ['queues'])
+        self.assertEqual(
+            diff.upserts()['queues'],
+            [{'name': 'new', 'vhost': '/'}]
+        )
+
+    def test_reconcile_noop(self):
+        with patch.object(RabbitAPIClient, '_get',
+                          return_value=self.current) as mock_get, \
+                patch.object(RabbitAPIClient, '_post') as mock_post:
+            diff, results = reconcile(self.api, deepcopy(self.current))
+
+        self.assertFalse(diff)
+        self.assertEqual(results, [])
+        mock_get.assert_called_once()
+        mock_post.assert_not_called()
+
+    def test_reconcile(self):
+        desired = deepcopy(self.current)
+        desired['queues'].pop(2)
+        desired['queues'][1]['arguments'] = {'x-max-length': 10}
+        desired['users'][0]['tags'] = 'administrator'
+
+        with patch.object(RabbitAPIClient, '_get',
+                          return_value=self.current), \
+                patch.object(RabbitAPIClient, '_post') as mock_post, \
+                patch.object(RabbitAPIClient, '_delete') as mock_delete:
+            diff, results = reconcile(self.api, desired, prune=True)
+
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(
+            [call.kwargs['data'] for call in mock_post.call_args_list],
+            [{'users': desired['users']}]
+        )
+        mock_delete.assert_called_once()
+        self.assertEqual(
+            mock_delete.call_args.kwargs['url'],
+            self.api.url + '/api/queues/%2F/q2'
+        )
+
+    def test_reconcile_recreate(self):
+        desired = deepcopy(self.current)
+        desired['queues'][0]['durable'] = False
+
+        with patch.object(RabbitAPIClient, '_get',
+                          return_value=self.current), \
+                patch.object(RabbitAPIClient, '_post') as mock_post, \
+                patch.object(RabbitAPIClient, '_delete') as mock_delete:
+            reconcile(self.api, desired, recreate=True)
+
+        mock_delete.assert_called_once()
+        self.assertEqual(
+            mock_post.call_args_list[0].kwargs['data'],
+            {'queues': [desired['queues'][0]]}
+        )
+        self.assertEqual(
+            mock_post.call_args_list[-1].kwargs['data'],
+            {'bindings': desired['bindings']}
+        )
+
+    def test_reconcile_prune_binding(self):
+        desired = deepcopy(self.current)
+        desired['bindings'] = []
+        binding = dict(self.current['bindings'][0], properties_key='q0')
+
+        with patch.object(RabbitAPIClient, '_get',
+                          side_effect=[self.current, [binding]]) as mock_get, \
+                patch.object(RabbitAPIClient, '_delete') as mock_delete:
+            reconcile(self.api, desired, prune=True)
+
+        self.assertEqual(
+            mock_get.call_args.kwargs['url'],
+            self.api.url + '/api/bindings/%2F/e/amq.direct/q/q0'
+        )
+        self.assertEqual(
+            mock_delete.call_args.kwargs['url'],
+            self.api.url + '/api/bindings/%2F/e/amq.direct/q/q0/q0'
+        )
@@ -0,0 +1,142 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock, patch
+
+import httpx
+import requests
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.retry import RetryBudget, RetryPolicy
+
+
+def http_error(status_code, headers=None):
+    return requests.HTTPError(
+        response=Mock(status_code=status_code, headers=headers or {})
+    )
+
+
+class RetryBudgetTests(TestCase):
+
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, capacity=2)
+
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+
+class RetryPolicyTests(TestCase):
+
+    def setUp(self):
+        self.policy = RetryPolicy(attempts=3, base=0.1, cap=1)
+
+    def test_is_transient(self):
+        self.assertTrue(self.policy.is_transient(requests.ConnectionError()))
+        self.assertTrue(self.policy.is_transient(http_error(503)))
+        self.assertFalse(self.policy.is_transient(http_error(404)))
+        self.assertFalse(self.policy.is_transient(ValueError()))
+
+    def test_attempts(self):
+        error = requests.ConnectionError()
+
+        self.assertIsNotNone(self.policy.delay(1, error))
+        self.assertIsNotNone(self.policy.delay(2, error))
+        self.assertIsNone(self.policy.delay(3, error))
+
+    def test_decorrelated_jitter(self):
+        delays = [self.policy.backoff(0.5) for _ in range(100)]
+
+        self.assertTrue(all(0.1 <= delay <= 1 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_retry_after(self):
+        self.assertEqual(
+            self.policy.delay(1, http_error(429, {'Retry-After': '3'})), 3
+        )
+        self.assertEqual(
+            self.policy.retry_after(http_error(503, {
+                'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT',
+            })),
+            0,
+        )
+        self.assertIsNone(
+            self.policy.delay(1, http_error(503, {'Retry-After': '3600'}))
+        )
+
+    def test_budget_exhausted(self):
+        self.policy.budget = RetryBudget(capacity=1)
+
+        self.assertIsNotNone(self.policy.delay(1, requests.Timeout()))
+        self.assertIsNone(self.policy.delay(1, requests.Timeout()))
+        self.assertEqual((self.policy.retried, self.policy.rejected), (1, 1))
+
+
+@patch('rabbitmq_admin.base.time.sleep')
+class ResourceRetryTests(TestCase):
+
+    def setUp(self):
+        self.api = RabbitAPIClient(
+            '127.0.0.1', 15672, ('guest', 'guest'), retry=RetryPolicy()
+        )
+
+    @patch('requests.Session.get')
+    def test_get_is_retried(self, mock_get, mock_sleep):
+        mock_get.side_effect = [
+            requests.ConnectionError(),
+            Mock(raise_for_status=Mock(side_effect=http_error(503))),
+            Mock(content=b'[]'),
+        ]
+
+        self.assertEqual(self.api.list_nodes(), [])
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_client_error_is_not_retried(self, mock_get, mock_sleep):
+        mock_get.return_value = Mock(
+            raise_for_status=Mock(side_effect=http_error(404))
+        )
+
+        with self.assertRaises(requests.HTTPError):
+            self.api.get_vhost('missing')
+        mock_sleep.assert_not_called()
+
+    @patch('requests.Session.post')
+    def test_post_is_not_retried(self, mock_post, mock_sleep):
+        mock_post.side_effect = requests.ConnectionError()
+
+        with self.assertRaises(requests.ConnectionError):
+            self.api.post_definitions({})
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('requests.Session.post')
+    def test_post_opt_in(self, mock_post, mock_sleep):
+        self.api.retry.methods.add('POST')
+        mock_post.side_effect = [requests.ConnectionError(), Mock(content=b'')]
+
+        self.api.post_definitions({})
+        self.assertEqual(mock_post.call_count, 2)
+
+
+class AsyncResourceRetryTests(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.responses = [httpx.Response(503), httpx.Response(200, json=[])]
+        self.api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(lambda request: (
+                self.responses.pop(0)
+            )),
+            retry=RetryPolicy(base=0, cap=0),
+        )
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    async def test_get_is_retried(self):
+        self.assertEqual(await self.api.list_nodes(), [])
+        self.assertEqual(self.api.retry.retried, 1)
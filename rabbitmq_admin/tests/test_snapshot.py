@@ -0,0 +1,123 @@
+from importlib.util import find_spec
+from unittest import IsolatedAsyncioTestCase, TestCase, skipUnless
+
+from rabbitmq_admin.models import Queue
+from rabbitmq_admin.snapshot import ConnectionSnapshot, QueueSnapshot
+
+
+def make_queue(name, vhost, messages, rate=0.0):
+    return {
+        'name': name,
+        'vhost': vhost,
+        'messages': messages,
+        'memory': 1000,
+        'message_stats': {'publish_details': {'rate': rate}},
+    }
+
+
+QUEUES = [
+    make_queue('a', '/', 5, 1.5),
+    make_queue('b', 'other', 50),
+    make_queue('c', '/', 20, 0.5),
+    {'name': 'd', 'vhost': 'other'},
+]
+
+
+class QueueSnapshotTests(TestCase):
+
+    use_numpy = False
+
+    def setUp(self):
+        self.snapshot = QueueSnapshot.from_items(
+            iter(QUEUES), use_numpy=self.use_numpy
+        )
+
+    def names(self, snapshot):
+        return list(snapshot.column('name'))
+
+    def test_columns(self):
+        self.assertEqual(len(self.snapshot), 4)
+        self.assertEqual(
+            list(self.snapshot.column('messages')), [5, 50, 20, 0]
+        )
+        self.assertEqual(
+            list(self.snapshot.column('publish_rate')), [1.5, 0, 0.5, 0]
+        )
+        self.assertIn('message_stats.publish_details.rate',
+                      QueueSnapshot.columns())
+
+    def test_row(self):
+        row = self.snapshot.row(1)
+
+        self.assertEqual((row['name'], row['vhost']), ('b', 'other'))
+        self.assertEqual((row['messages'], row['memory']), (50, 1000))
+        self.assertIsNone(row['node'])
+
+    def test_top(self):
+        self.assertEqual(
+            self.names(self.snapshot.top('messages', 2)), ['b', 'c']
+        )
+        self.assertEqual(
+            self.names(self.snapshot.top('messages', 10)),
+            ['b', 'c', 'a', 'd'],
+        )
+
+    def test_filter(self):
+        self.assertEqual(
+            self.names(self.snapshot.filter('messages', minimum=10)),
+            ['b', 'c'],
+        )
+        self.assertEqual(
+            self.names(self.snapshot.filter('messages', 1, 20)), ['a', 'c']
+        )
+
+    def test_where(self):
+        mask = [vhost == '/' for vhost in self.snapshot.column('vhost')]
+
+        self.assertEqual(self.names(self.snapshot.where(mask)), ['a', 'c'])
+
+    def test_group_by(self):
+        groups = self.snapshot.group_by('vhost', ['messages', 'publish_rate'])
+
+        self.assertEqual(groups, {
+            '/': {'count': 2, 'messages': 25, 'publish_rate': 2},
+            'other': {'count': 2, 'messages': 50, 'publish_rate': 0},
+        })
+        self.assertEqual(self.snapshot.sum('messages'), 75)
+
+    def test_models(self):
+        snapshot = QueueSnapshot.from_items(
+            Queue(queue) for queue in QUEUES
+        )
+
+        self.assertEqual(snapshot.rows(), self.snapshot.rows())
+
+
+@skipUnless(find_spec('numpy'), 'numpy is missing')
+class NumpyQueueSnapshotTests(QueueSnapshotTests):
+
+    use_numpy = True
+
+    def test_vectorized_where(self):
+        messages = self.snapshot.column('messages')
+
+        self.assertEqual(
+            self.names(self.snapshot.where(messages > 10)), ['b', 'c']
+        )
+
+
+class ConnectionSnapshotTests(IsolatedAsyncioTestCase):
+
+    async def test_afrom_items(self):
+        async def connections():
+            yield {'name': 'c1', 'user': 'guest', 'channels': 2,
+                   'recv_oct_details': {'rate': 10.0}}
+            yield {'name': 'c2', 'user': 'guest', 'channels': 3}
+
+        snapshot = await ConnectionSnapshot.afrom_items(connections())
+
+        self.assertEqual(
+            snapshot.group_by('user')['guest'],
+            {'count': 2, 'channels': 5, 'recv_oct': 0, 'send_oct': 0,
+             'recv_rate': 10, 'send_rate': 0},
+        )
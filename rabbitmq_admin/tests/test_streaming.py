@@ -0,0 +1,76 @@
+import json
+from unittest import TestCase
+
+from rabbitmq_admin.streaming import JSONArrayParser, iter_json_array
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class JSONArrayParserTests(TestCase):
+
+    def setUp(self):
+        self.items = [
+            {'name': 'q{0}'.format(i), 'messages': i * 1000, 'node': 'ŕ@b'}
+            for i in range(20)
+        ] + [12345, 'tail', None, [1, 2], 1.25, -0.5e-3, 2E+10, True, 7]
+        self.body = json.dumps(self.items, ensure_ascii=False).encode()
+
+    def test_every_chunk_size(self):
+        for size in range(1, 40):
+            self.assertEqual(
+                list(iter_json_array(split(self.body, size))),
+                self.items
+            )
+
+    def test_number_split_across_chunks(self):
+        self.assertEqual(
+            list(iter_json_array([b'[1.', b'25, 2.5]'])), [1.25, 2.5]
+        )
+        self.assertEqual(
+            list(iter_json_array([b'[1', b'e3, 2.5', b'E-1, -', b'1]'])),
+            [1000.0, 0.25, -1]
+        )
+        self.assertEqual(list(iter_json_array([b'[tr', b'ue]'])), [True])
+
+    def test_number_at_the_end_of_a_chunk(self):
+        parser = JSONArrayParser()
+        self.assertEqual(parser.feed(b'[1, 2'), [1])
+        self.assertEqual(parser.feed(b'5 '), [25])
+        self.assertEqual(parser.feed(b']'), [])
+        self.assertEqual(parser.close(), [])
+
+    def test_whitespace(self):
+        body = b' \n[ 1 ,\n 2 , {"a": [ ]} ]\n '
+        self.assertEqual(
+            list(iter_json_array(split(body, 3))),
+            [1, 2, {'a': []}]
+        )
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array([b'[', b']'])), [])
+
+    def test_items_are_yielded_before_the_end(self):
+        parser = JSONArrayParser()
+        self.assertEqual(parser.feed(b'[{"a": 1}, {"b"'), [{'a': 1}])
+        self.assertEqual(parser.feed(b': 2}]'), [{'b': 2}])
+        self.assertEqual(parser.close(), [])
+
+    def test_not_an_array(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"a": 1}']))
+
+    def test_truncated(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'[{"a": 1}, {"b": ']))
+
+    def test_extra_data(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'[1] 2']))
+
+    def test_invalid_number(self):
+        parser = JSONArrayParser()
+        self.assertEqual(parser.feed(b'[1.'), [])
+        with self.assertRaises(ValueError):
+            parser.feed(b'x, 2]')
@@ -0,0 +1,194 @@
+import asyncio
+import threading
+import time
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import MagicMock, Mock, patch
+
+import httpx
+
+from rabbitmq_admin.api import RabbitAPIClient
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.throttle import Limit, Throttle, classify_request
+
+
+class ClassifyRequestTests(TestCase):
+
+    def test_classify(self):
+        expensive = [
+            ('GET', 'http://host:15672/api/queues', {}),
+            ('GET', '/api/queues/%2F', {'page': 1}),
+            ('GET', '/api/overview', {}),
+            ('GET', '/api/definitions', {}),
+            ('GET', '/api/nodes/rabbit%40a', {'memory': 'true'}),
+        ]
+        cheap = [
+            ('GET', '/api/queues/%2F/name', {}),
+            ('GET', '/api/nodes/rabbit%40a', {'memory': 'false'}),
+            ('GET', '/api/vhosts', {}),
+            ('PUT', '/api/queues/%2F/name', {}),
+        ]
+
+        for request in expensive:
+            self.assertEqual(classify_request(*request), 'expensive', request)
+        for request in cheap:
+            self.assertEqual(classify_request(*request), 'cheap', request)
+
+
+class LimitTests(TestCase):
+
+    def test_rate(self):
+        now = [0.0]
+        limit = Limit(rate=10, burst=2, clock=lambda: now[0])
+
+        self.assertEqual([limit.reserve() for _ in range(4)], [
+            0.0, 0.0, 0.1, 0.2
+        ])
+        now[0] = 1.0
+        self.assertEqual(limit.reserve(), 0.0)
+
+    def test_unlimited(self):
+        self.assertEqual(Limit().reserve(), 0.0)
+
+    def test_concurrency(self):
+        limit = Limit(concurrency=2)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with limit:
+                with lock:
+                    running.append(1)
+                    peak.append(len(running))
+                time.sleep(0.01)
+                with lock:
+                    running.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(max(peak), 2)
+
+
+class AsyncLimitTests(IsolatedAsyncioTestCase):
+
+    async def test_release_wakes_waiter(self):
+        limit = Limit(concurrency=1)
+        limit.acquire()
+        waiter = asyncio.ensure_future(limit.aacquire())
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiter.done())
+
+        # released by another thread
+        thread = threading.Thread(target=limit.release)
+        thread.start()
+        thread.join(5)
+        await asyncio.wait_for(waiter, 1)
+
+        self.assertEqual(limit._in_flight, 1)
+        self.assertFalse(limit._waiters)
+
+    async def test_cancelled_waiter(self):
+        limit = Limit(concurrency=1)
+        await limit.aacquire()
+        waiter = asyncio.ensure_future(limit.aacquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        limit.release()
+
+        self.assertEqual(limit._in_flight, 0)
+        await asyncio.wait_for(limit.aacquire(), 1)
+
+
+class ResourceThrottleTests(TestCase):
+
+    @patch('requests.Session.get')
+    def test_limit_per_class(self, mock_get):
+        mock_get.return_value = Mock(content=b'[]')
+        throttle = Throttle(expensive=MagicMock(), cheap=MagicMock())
+        api = RabbitAPIClient(
+            '127.0.0.1', 15672, ('guest', 'guest'), throttle=throttle
+        )
+
+        api.list_queues()
+        api.list_queues()
+        api.get_vhost('/')
+
+        self.assertEqual(throttle.limits['expensive'].__enter__.call_count, 2)
+        self.assertEqual(throttle.limits['cheap'].__enter__.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_stream_holds_limit(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=200)
+        mock_get.return_value.iter_content.return_value = iter(
+            [b'[{"name": "a"},', b' {"name": "b"}]']
+        )
+        throttle = Throttle(expensive=MagicMock())
+        api = RabbitAPIClient(
+            '127.0.0.1', 15672, ('guest', 'guest'), throttle=throttle
+        )
+        limit = throttle.limits['expensive']
+
+        queues = api.stream_queues()
+        self.assertEqual(next(queues), {'name': 'a'})
+        self.assertEqual(limit.__enter__.call_count, 1)
+        self.assertEqual(limit.__exit__.call_count, 0)
+
+        queues.close()
+        self.assertEqual(limit.__exit__.call_count, 1)
+
+
+class AsyncResourceThrottleTests(IsolatedAsyncioTestCase):
+
+    async def test_concurrency(self):
+        running = []
+        peak = []
+
+        async def handler(request):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return httpx.Response(200, json=[])
+
+        api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(handler),
+            throttle=Throttle(expensive=Limit(concurrency=2)),
+        )
+        async with api:
+            await asyncio.gather(*(api.list_queues() for _ in range(6)))
+
+        self.assertEqual(max(peak), 2)
+
+    async def test_stream_holds_limit(self):
+        limit = Limit(concurrency=1)
+        api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=[{'name': 'a'}])
+            ),
+            throttle=Throttle(expensive=limit),
+        )
+        async with api:
+            queues = api.stream_queues()
+            self.assertEqual(await queues.__anext__(), {'name': 'a'})
+            listed = asyncio.ensure_future(api.list_queues())
+            await asyncio.sleep(0.01)
+            self.assertFalse(listed.done())
+
+            await queues.aclose()
+
+            self.assertEqual(await asyncio.wait_for(listed, 1), [
+                {'name': 'a'}
+            ])
@@ -0,0 +1,182 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import httpx
+
+from rabbitmq_admin.async_api import AsyncRabbitAPIClient
+from rabbitmq_admin.topology import TopicTrie, Topology, headers_match
+
+
+def binding(source, destination, routing_key='', destination_type='queue',
+            **arguments):
+    return {
+        'source': source,
+        'vhost': '/',
+        'destination': destination,
+        'destination_type': destination_type,
+        'routing_key': routing_key,
+        'arguments': arguments,
+    }
+
+
+EXCHANGES = [
+    {'name': '', 'vhost': '/', 'type': 'direct'},
+    {'name': 'orders', 'vhost': '/', 'type': 'topic',
+     'arguments': {'alternate-exchange': 'unrouted'}},
+    {'name': 'unrouted', 'vhost': '/', 'type': 'fanout'},
+    {'name': 'audit', 'vhost': '/', 'type': 'fanout'},
+    {'name': 'headers', 'vhost': '/', 'type': 'headers'},
+    {'name': 'loop', 'vhost': '/', 'type': 'fanout'},
+]
+QUEUES = [
+    {'name': name, 'vhost': '/'}
+    for name in ('eu', 'all', 'audit', 'dead', 'pdf', 'orphan')
+]
+BINDINGS = [
+    binding('', 'eu', 'eu'),
+    binding('orders', 'eu', 'order.*.eu'),
+    binding('orders', 'all', 'order.#'),
+    binding('orders', 'audit', 'order.created.#', 'exchange'),
+    binding('audit', 'audit'),
+    binding('audit', 'loop', destination_type='exchange'),
+    binding('loop', 'audit', destination_type='exchange'),
+    binding('unrouted', 'dead'),
+    binding('headers', 'pdf', **{'x-match': 'any', 'format': 'pdf',
+                                 'type': 'report'}),
+]
+
+
+class TopicTrieTests(TestCase):
+
+    def test_match(self):
+        trie = TopicTrie()
+        for pattern in ('a.*.c', 'a.#', '#.c', '#', 'a.b', '*'):
+            trie.add(pattern, pattern)
+
+        self.assertEqual(
+            set(trie.match('a.b.c')), {'a.*.c', 'a.#', '#.c', '#'}
+        )
+        self.assertEqual(set(trie.match('a')), {'a.#', '#', '*'})
+        self.assertEqual(set(trie.match('a.b')), {'a.#', '#', 'a.b'})
+        self.assertEqual(set(trie.match('c')), {'#.c', '#', '*'})
+
+
+class HeadersMatchTests(TestCase):
+
+    def test_match(self):
+        arguments = {'x-match': 'all', 'a': 1, 'b': 2, 'x-c': 3}
+
+        self.assertTrue(headers_match(arguments, {'a': 1, 'b': 2}))
+        self.assertFalse(headers_match(arguments, {'a': 1}))
+        arguments['x-match'] = 'any'
+        self.assertTrue(headers_match(arguments, {'a': 1}))
+        arguments['x-match'] = 'all-with-x'
+        self.assertFalse(headers_match(arguments, {'a': 1, 'b': 2}))
+
+
+class TopologyTests(TestCase):
+
+    def setUp(self):
+        self.topology = Topology(EXCHANGES, QUEUES, BINDINGS)
+
+    def test_route(self):
+        self.assertEqual(
+            self.topology.route('orders', 'order.created.eu'),
+            {'eu', 'all', 'audit'},
+        )
+        self.assertEqual(
+            self.topology.route('orders', 'order.paid.us'), {'all'}
+        )
+        self.assertEqual(self.topology.route('', 'eu'), {'eu'})
+        self.assertEqual(self.topology.route('', 'orphan'), set())
+        self.assertEqual(self.topology.route('missing', 'eu'), set())
+
+    def test_alternate_exchange(self):
+        self.assertEqual(self.topology.route('orders', 'refund'), {'dead'})
+
+    def test_headers(self):
+        self.assertEqual(
+            self.topology.route('headers', headers={'format': 'pdf'}),
+            {'pdf'},
+        )
+        self.assertEqual(
+            self.topology.route('headers', headers={'format': 'csv'}), set()
+        )
+
+    def test_default_exchange_without_bindings(self):
+        topology = Topology(EXCHANGES, QUEUES, [])
+
+        self.assertEqual(topology.route('', 'orphan'), {'orphan'})
+
+    def test_indexes(self):
+        self.assertEqual(len(self.topology.bindings_from('orders')), 3)
+        self.assertEqual(
+            [item['source'] for item in self.topology.bindings_to(
+                'audit', destination_type='exchange'
+            )],
+            ['orders', 'loop'],
+        )
+        self.assertEqual(
+            self.topology.bindings_with_key('eu'), [BINDINGS[0]]
+        )
+
+
+class BindingEndpointsTests(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.api = AsyncRabbitAPIClient(
+            '127.0.0.1',
+            15672,
+            auth=('guest', 'guest'),
+            transport=httpx.MockTransport(self.handler),
+        )
+
+    async def asyncTearDown(self):
+        await self.api.close()
+
+    def handler(self, request):
+        self.requests.append(request)
+        path = request.url.raw_path.split(b'?')[0].decode()
+        if path.endswith('/exchanges/%2F'):
+            return httpx.Response(200, json=EXCHANGES)
+        if path.endswith('/queues/%2F'):
+            return httpx.Response(200, json=QUEUES)
+        if path.endswith('/bindings/%2F'):
+            return httpx.Response(200, json=BINDINGS)
+        return httpx.Response(204 if request.method != 'GET' else 200,
+                              json=[])
+
+    def request(self, index=-1):
+        request = self.requests[index]
+        return request.method, request.url.raw_path.decode()
+
+    async def test_endpoints(self):
+        await self.api.list_bindings_by_source('e/x', '/')
+        self.assertEqual(
+            self.request(), ('GET', '/api/exchanges/%2F/e%2Fx/bindings/source')
+        )
+        await self.api.list_bindings_by_destination('e', '/')
+        self.assertEqual(self.request(), (
+            'GET', '/api/exchanges/%2F/e/bindings/destination'
+        ))
+        await self.api.create_queue_binding('e', 'q', '/', 'key')
+        self.assertEqual(self.request(), ('POST', '/api/bindings/%2F/e/e/q/q'))
+        self.assertEqual(
+            self.requests[-1].content, b'{"routing_key":"key","arguments":{}}'
+        )
+        await self.api.get_exchange_binding('a', 'b', '/', 'key')
+        self.assertEqual(
+            self.request(), ('GET', '/api/bindings/%2F/e/a/e/b/key')
+        )
+        await self.api.delete_queue_binding('e', 'q', '/', '~')
+        self.assertEqual(
+            self.request(), ('DELETE', '/api/bindings/%2F/e/e/q/q/~')
+        )
+
+    async def test_afetch(self):
+        topology = await Topology.afetch(self.api, vhost='/')
+
+        self.assertEqual(topology.route('audit'), {'audit'})
+        self.assertEqual(
+            self.requests[0].url.params['columns'], 'name,vhost,type,arguments'
+        )
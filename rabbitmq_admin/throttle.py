@@ -0,0 +1,217 @@
+"""
+Client-side limits of the request rate and concurrency. The management
+plugin computes the statistics of list endpoints on every request, so
+these get a separate, stricter limit than the cheap ones. A
+:class:`Throttle` is thread-safe, share one instance between all the
+clients of a process to limit their combined load.
+"""
+import asyncio
+import time
+from collections import deque
+from threading import Condition, Lock
+from urllib.parse import urlsplit
+
+#: Collections whose list endpoints compute statistics of every object
+EXPENSIVE_COLLECTIONS = {
+    'bindings',
+    'channels',
+    'connections',
+    'consumers',
+    'definitions',
+    'exchanges',
+    'overview',
+    'queues',
+}
+
+
+def classify_request(method, url, params=None):
+    """
+    Returns ``'expensive'`` for the GET requests of the collections in
+    :data:`EXPENSIVE_COLLECTIONS` and of the node memory breakdowns and
+    ``'cheap'`` for everything else
+    """
+    parts = urlsplit(url).path.split('/')
+    if method != 'GET' or len(parts) < 3:
+        return 'cheap'
+    flags = {
+        str(value).lower() for key, value in (params or {}).items()
+        if key in ('memory', 'binary')
+    }
+    if parts[2] == 'nodes' and 'true' in flags:
+        return 'expensive'
+    # /api/queues and /api/queues/vhost, not a single queue
+    if parts[2] in EXPENSIVE_COLLECTIONS and len(parts) <= 4:
+        return 'expensive'
+    return 'cheap'
+
+
+def _wake(waiter):
+    if not waiter.cancelled():
+        waiter.set_result(None)
+
+
+class Limit(object):
+    """
+    A token bucket limiting the request rate combined with a semaphore
+    limiting the requests in flight. Both are optional. The threads and
+    the asyncio tasks of any event loop share the slots, a released slot
+    is handed to a waiting task first.
+    """
+
+    def __init__(self, rate=None, burst=None, concurrency=None,
+                 clock=time.monotonic):
+        """
+        :param rate: The requests per second, unlimited by default
+        :type rate: float
+
+        :param burst: The requests allowed at once above the rate, by
+            default ``rate``
+        :type burst: float
+
+        :param concurrency: The maximum number of requests in flight,
+            unlimited by default
+        :type concurrency: int
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else (rate or 1)
+        self.concurrency = concurrency
+        self.clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._in_flight = 0
+        self._lock = Lock()
+        self._freed = Condition(self._lock)
+        #: The futures of the waiting asyncio tasks
+        self._waiters = deque()
+
+    def reserve(self):
+        """
+        Takes a token for a request
+
+        :returns: The time to wait before sending the request in seconds
+        :rtype: float
+        """
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def _take(self):
+        """
+        Takes a free slot, the caller holds the lock
+
+        :rtype: bool
+        """
+        if self.concurrency is None:
+            return True
+        if self._in_flight < self.concurrency:
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self):
+        with self._freed:
+            self._freed.wait_for(self._take)
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        """
+        Same as :meth:`acquire` without blocking the event loop
+        """
+        with self._lock:
+            waiter = None
+            if not self._take():
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+        try:
+            if waiter is not None:
+                await waiter
+            delay = self.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    def _abandon(self, waiter):
+        """
+        Gives up the slot of a cancelled task, whether it was handed over
+        already or not
+        """
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                return
+        self.release()
+
+    def release(self):
+        if self.concurrency is None:
+            return
+        with self._lock:
+            if self._waiters:
+                # the slot stays taken, by the woken task
+                waiter = self._waiters.popleft()
+                waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+                return
+            self._in_flight -= 1
+            self._freed.notify()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    async def __aenter__(self):
+        await self.aacquire()
+        return self
+
+    async def __aexit__(self, *args):
+        self.release()
+
+
+#: A limit which never waits, for the requests of clients without a throttle
+UNLIMITED = Limit()
+
+
+class Throttle(object):
+    """
+    Limits the requests by their class, see :func:`classify_request`
+    ::
+
+        throttle = Throttle(
+            expensive=Limit(rate=2, concurrency=2),
+            cheap=Limit(rate=50, concurrency=10),
+        )
+        api = RabbitAPIClient(host, port, auth, throttle=throttle)
+    """
+
+    def __init__(self, expensive=None, cheap=None, classify=None):
+        """
+        :param expensive: The limit of the expensive requests
+        :type expensive: Limit
+
+        :param cheap: The limit of the other requests
+        :type cheap: Limit
+
+        :param classify: Returns the class of a request given its method,
+            URL and query parameters, ``'expensive'`` or ``'cheap'``
+        :type classify: callable
+        """
+        self.limits = {
+            'expensive': expensive or Limit(),
+            'cheap': cheap or Limit(),
+        }
+        self.classify = classify or classify_request
+
+    def limit_for(self, method, url, params=None):
+        return self.limits[self.classify(method, url, params)]
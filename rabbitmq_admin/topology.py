@@ -0,0 +1,295 @@
+"""
+An in-memory index of the exchanges, queues and bindings which answers
+where a message lands without further requests. It follows the routing of
+the direct, fanout, topic and headers exchanges, exchange to exchange
+bindings and alternate exchanges:
+::
+
+    topology = Topology.fetch(api, vhost='/')
+    topology.route('orders', 'order.created.eu')
+    {'audit', 'orders.eu'}
+
+Alternate exchanges set by policies are not known, the arguments of the
+exchanges are. Exchanges of other types route to every bound destination.
+"""
+import asyncio
+from collections import defaultdict
+
+EXCHANGE_COLUMNS = ['name', 'vhost', 'type', 'arguments']
+QUEUE_COLUMNS = ['name', 'vhost']
+BINDING_COLUMNS = [
+    'source',
+    'vhost',
+    'destination',
+    'destination_type',
+    'routing_key',
+    'arguments',
+    'properties_key',
+]
+
+
+class TopicTrie(object):
+    """
+    The bindings of a topic exchange by the words of their patterns, so a
+    routing key is matched in a walk over its words instead of against
+    every pattern
+    """
+
+    __slots__ = ('children', 'destinations')
+
+    def __init__(self):
+        self.children = {}
+        self.destinations = []
+
+    def add(self, pattern, destination):
+        node = self
+        for word in pattern.split('.'):
+            node = node.children.setdefault(word, TopicTrie())
+        node.destinations.append(destination)
+
+    def match(self, routing_key):
+        found = []
+        self._match(routing_key.split('.'), 0, found)
+        return found
+
+    def _match(self, words, index, found):
+        if index == len(words):
+            found.extend(self.destinations)
+        else:
+            for word in (words[index], '*'):
+                child = self.children.get(word)
+                if child is not None:
+                    child._match(words, index + 1, found)
+        child = self.children.get('#')
+        if child is not None:
+            # ``#`` matches zero or more words
+            for skip in range(index, len(words) + 1):
+                child._match(words, skip, found)
+
+
+def headers_match(arguments, headers):
+    """
+    Matches the arguments of a headers exchange binding, the ``x-match``
+    argument is ``all`` (the default), ``any``, ``all-with-x`` or
+    ``any-with-x``
+    """
+    mode = arguments.get('x-match', 'all')
+    with_x = mode.endswith('-with-x')
+    expected = [
+        (key, value) for key, value in arguments.items()
+        if key != 'x-match' and (with_x or not key.startswith('x-'))
+    ]
+    matches = (
+        key in headers and (value is None or headers[key] == value)
+        for key, value in expected
+    )
+    if mode.startswith('any'):
+        return any(matches)
+    return all(matches)
+
+
+class ExchangeRoutes(object):
+    """
+    The bindings of one source exchange, indexed for its type
+    """
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.by_key = defaultdict(list)
+        self.topics = TopicTrie()
+        self.bindings = []
+
+    def add(self, binding, destination):
+        self.bindings.append((binding.get('arguments') or {}, destination))
+        self.by_key[binding.get('routing_key', '')].append(destination)
+        if self.kind == 'topic':
+            self.topics.add(binding.get('routing_key', ''), destination)
+
+    def match(self, routing_key, headers):
+        if self.kind == 'direct':
+            return self.by_key.get(routing_key, [])
+        if self.kind == 'topic':
+            return self.topics.match(routing_key)
+        if self.kind == 'headers':
+            return [
+                destination for arguments, destination in self.bindings
+                if headers_match(arguments, headers)
+            ]
+        # fanout and the types the routing is not known of
+        return [destination for _, destination in self.bindings]
+
+
+class Topology(object):
+    """
+    :param exchanges: The exchanges, e.g. of
+        :meth:`RabbitAPIClient.list_exchanges`
+    :type exchanges: iterable of dict
+
+    :param queues: The queues
+    :type queues: iterable of dict
+
+    :param bindings: The bindings
+    :type bindings: iterable of dict
+    """
+
+    def __init__(self, exchanges, queues, bindings):
+        #: The exchanges by vhost and name
+        self.exchanges = {
+            (exchange['vhost'], exchange['name']): exchange
+            for exchange in exchanges
+        }
+        self.queues = {(queue['vhost'], queue['name']) for queue in queues}
+        #: The bindings by vhost and source exchange
+        self.by_source = defaultdict(list)
+        #: The bindings by vhost, destination type and destination
+        self.by_destination = defaultdict(list)
+        #: The bindings by vhost and routing key
+        self.by_key = defaultdict(list)
+        self._routes = {}
+        for binding in bindings:
+            self._add(binding)
+
+    @classmethod
+    def fetch(cls, api, vhost=None):
+        """
+        Builds the topology of the server with three requests
+
+        :param vhost: Only index the given vhost
+        :type vhost: str
+        """
+        return cls(*(request() for request in cls._requests(api, vhost)))
+
+    @classmethod
+    async def afetch(cls, api, vhost=None):
+        """
+        Builds the topology with an asyncio client, see :meth:`fetch`
+        """
+        return cls(*await asyncio.gather(*(
+            request() for request in cls._requests(api, vhost)
+        )))
+
+    @staticmethod
+    def _requests(api, vhost):
+        if vhost is None:
+            return (
+                lambda: api.list_exchanges(columns=EXCHANGE_COLUMNS),
+                lambda: api.list_queues(columns=QUEUE_COLUMNS),
+                lambda: api.list_bindings(columns=BINDING_COLUMNS),
+            )
+        return (
+            lambda: api.list_exchanges_for_vhost(
+                vhost, columns=EXCHANGE_COLUMNS
+            ),
+            lambda: api.list_queues_for_vhost(vhost, columns=QUEUE_COLUMNS),
+            lambda: api.list_bindings_for_vhost(
+                vhost, columns=BINDING_COLUMNS
+            ),
+        )
+
+    def _add(self, binding):
+        vhost, source = binding['vhost'], binding['source']
+        destination = (binding['destination_type'], binding['destination'])
+        self.by_source[vhost, source].append(binding)
+        self.by_destination[(vhost,) + destination].append(binding)
+        self.by_key[vhost, binding.get('routing_key', '')].append(binding)
+        routes = self._routes.get((vhost, source))
+        if routes is None:
+            exchange = self.exchanges.get((vhost, source), {})
+            routes = ExchangeRoutes(self._kind(exchange))
+            self._routes[vhost, source] = routes
+        routes.add(binding, destination)
+
+    @staticmethod
+    def _kind(exchange):
+        arguments = exchange.get('arguments') or {}
+        if exchange.get('type') == 'x-delayed-message':
+            return arguments.get('x-delayed-type', 'direct')
+        return exchange.get('type', 'direct')
+
+    def route(self, exchange, routing_key='', headers=None, vhost='/'):
+        """
+        :param exchange: The exchange the message is published to, ``''``
+            for the default exchange
+        :type exchange: str
+
+        :param routing_key: The routing key of the message
+        :type routing_key: str
+
+        :param headers: The headers of the message, for headers exchanges
+        :type headers: dict
+
+        :param vhost: The vhost name
+        :type vhost: str
+
+        :returns: The names of the queues the message lands in
+        :rtype: set
+        """
+        queues = set()
+        self._route(
+            vhost, exchange, routing_key, headers or {}, queues, set()
+        )
+        return queues
+
+    def _route(self, vhost, exchange, routing_key, headers, queues, visited):
+        if (vhost, exchange) in visited:
+            return
+        visited.add((vhost, exchange))
+        matched = self._match(vhost, exchange, routing_key, headers)
+        for kind, destination in matched:
+            if kind == 'queue':
+                queues.add(destination)
+            else:
+                self._route(
+                    vhost, destination, routing_key, headers, queues, visited
+                )
+        if not matched:
+            self._alternate(vhost, exchange, routing_key, headers, queues,
+                            visited)
+
+    def _match(self, vhost, exchange, routing_key, headers):
+        """
+        :returns: The destinations of the bindings of the exchange matching
+            the message
+        """
+        routes = self._routes.get((vhost, exchange))
+        if routes is not None:
+            return routes.match(routing_key, headers)
+        if exchange == '' and (vhost, routing_key) in self.queues:
+            # the implicit bindings of the default exchange, when they are
+            # not listed
+            return [('queue', routing_key)]
+        return []
+
+    def _alternate(self, vhost, exchange, routing_key, headers, queues,
+                   visited):
+        arguments = self.exchanges.get((vhost, exchange), {}).get(
+            'arguments'
+        ) or {}
+        alternate = arguments.get('alternate-exchange')
+        if alternate is not None:
+            self._route(
+                vhost, alternate, routing_key, headers, queues, visited
+            )
+
+    def bindings_from(self, exchange, vhost='/'):
+        """
+        :returns: The bindings of a source exchange
+        :rtype: list of dict
+        """
+        return self.by_source.get((vhost, exchange), [])
+
+    def bindings_to(self, destination, vhost='/', destination_type='queue'):
+        """
+        :returns: The bindings of a queue or of a destination exchange
+        :rtype: list of dict
+        """
+        return self.by_destination.get(
+            (vhost, destination_type, destination), []
+        )
+
+    def bindings_with_key(self, routing_key, vhost='/'):
+        """
+        :returns: The bindings with the routing key
+        :rtype: list of dict
+        """
+        return self.by_key.get((vhost, routing_key), [])